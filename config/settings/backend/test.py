@@ -9,6 +9,9 @@ INSTALLED_APPS = ['test_without_migrations',] + INSTALLED_APPS
 
 CACHES['default']['KEY_PREFIX'] = ''.join(random.choices(string.ascii_letters, k=8))
 
+# Logs are created immediately, as TestCase never commits to run buffered writes
+ERY_LOG_BUFFERED = False
+
 SECRET_KEY = env('DJANGO_SECRET_KEY', default='INCASESOMETHINGGOESWRONGWITHENV')
 
 PASSWORD_HASHERS = [
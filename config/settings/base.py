@@ -9,7 +9,27 @@ TESTING = len(sys.argv) > 1 and sys.argv[1] == 'test'
 env = environ.Env()
 
 ERY_BABEL_HOSTPORT = env("ERY_BABEL_HOSTPORT", default="localhost:30000")
+# Seconds for which transpiled bundles are cached by the digest of their ES6 source
+ERY_BABEL_CACHE_TIMEOUT = env.int("ERY_BABEL_CACHE_TIMEOUT", default=7 * 24 * 60 * 60)
+# Seconds for which prebuilt stint pages (see ery_backend.stints.bundles) are kept
+ERY_BUNDLE_CACHE_TIMEOUT = env.int("ERY_BUNDLE_CACHE_TIMEOUT", default=30 * 24 * 60 * 60)
+# Threads on which the files of a stint page are rendered
+ERY_RENDER_WORKERS = env.int("ERY_RENDER_WORKERS", default=4)
 ERY_ENGINE_HOSTPORT = env("ERY_ENGINE_HOSTPORT", default="localhost:30001")
+# Seconds after which processes reload reference tables (see ery_backend.base.registry)
+ERY_REGISTRY_TIMEOUT = env.int("ERY_REGISTRY_TIMEOUT", default=60)
+# Logs are created in batches by a background thread (see ery_backend.logs.sink). Disabled in test settings.
+ERY_LOG_BUFFERED = env.bool("ERY_LOG_BUFFERED", default=True)
+ERY_LOG_QUEUE_SIZE = env.int("ERY_LOG_QUEUE_SIZE", default=10000)
+ERY_LOG_BATCH_SIZE = env.int("ERY_LOG_BATCH_SIZE", default=500)
+ERY_LOG_FLUSH_INTERVAL = env.float("ERY_LOG_FLUSH_INTERVAL", default=1.0)
+# What to do with logs while the queue is full: 'drop' them, or 'block' on writing them
+ERY_LOG_OVERFLOW = env("ERY_LOG_OVERFLOW", default="drop")
+# Where stint output and datasets are stored: 'google' (Cloud Datastore) or 'postgres'
+ERY_DATASTORE_BACKEND = env("ERY_DATASTORE_BACKEND", default="google")
+# Connection total counts are approximated for tables estimated to hold more rows than this
+ERY_EXACT_COUNT_LIMIT = env.int("ERY_EXACT_COUNT_LIMIT", default=100000)
+ERY_COUNT_CACHE_TIMEOUT = env.int("ERY_COUNT_CACHE_TIMEOUT", default=60)
 REDIS_LOCATION = '{0}/{1}'.format(env('REDIS_URL', default='redis://127.0.0.1:6379'), 0)
 
 ASGI_APPLICATION = "config.routing.application"
@@ -72,6 +92,7 @@ LOCAL_APPS = [
     'ery_backend.base.apps.BaseConfig',
     'ery_backend.comments.apps.CommentsConfig',
     'ery_backend.datasets.apps.DatasetsConfig',
+    'ery_backend.datastore.apps.DatastoreConfig',
     'ery_backend.commands.apps.CommandsConfig',
     'ery_backend.conditions.apps.ConditionsConfig',
     'ery_backend.folders.apps.FoldersConfig',
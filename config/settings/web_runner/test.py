@@ -12,6 +12,9 @@ AUTHENTICATION_BACKENDS = ['ery_backend.frontends.web_views.Auth0'] + AUTHENTICA
 
 CACHES['default']['KEY_PREFIX'] = ''.join(random.choices(string.ascii_letters, k=8))
 
+# Logs are created immediately, as TestCase never commits to run buffered writes
+ERY_LOG_BUFFERED = False
+
 SECRET_KEY = env('DJANGO_SECRET_KEY', default='INCASESOMETHINGGOESWRONGWITHENV')
 
 PASSWORD_HASHERS = [
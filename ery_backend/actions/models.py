@@ -63,22 +63,28 @@ class Action(ModuleDefinitionNamedModel):
             name = '{}_copy'.format(self.name)
         return super().duplicate(name)
 
-    def run(self, hand):
+    def run(self, hand, plan=None):
         """
         Execute all :class:`ActionStep` objects (in order).
 
         Args:
             hand (:class:`~ery_backend.hands.models.Hand`): Provides context for all :class:`ActionStep` objects.
+            plan (Optional[Tuple[:class:`~ery_backend.actions.plans.PlannedStep`]]): Compiled steps. Obtained via
+              :func:`~ery_backend.actions.plans.get_action_plan` if not specified.
         """
+        from .plans import get_action_plan
+
+        if plan is None:
+            plan = get_action_plan(self)
         socket_message_args = []
         action_start_message = "action: {}, started on hand with id: {}".format(self.name, hand.id)
         hand.stint.log(action_start_message, system_only=True)
-        for action_step in self.steps.all():
+        for action_step, subplan in plan:
             start_message = "actionstep: {}, started for action: {}, on hand with id: {}".format(
                 action_step.action_type, self.name, hand.id
             )
             hand.stint.log(start_message, system_only=True)
-            socket_message_args += action_step.run(hand)
+            socket_message_args += action_step.run(hand, subplan)
             end_message = "actionstep: {}, completed for action: {}, on hand with id: {}".format(
                 action_step.action_type, self.name, hand.id
             )
@@ -282,7 +288,7 @@ class ActionStep(EryPrivileged):
     #         }
     #     )
 
-    def _run_part_conditionally(self, hand=None, team=None):
+    def _run_part_conditionally(self, hand=None, team=None, subplan=None):
         """
         Run :class:`ActionStep` given true evaluation of corresponding :class:`~ery_backend.conditions.models.Condition`.
 
@@ -297,12 +303,15 @@ class ActionStep(EryPrivileged):
             do_run = not do_run
 
         # XXX: Properly test all of these changes in issue #688
-        return self._run_part(hand, team) if do_run else []
+        return self._run_part(hand, team, subplan) if do_run else []
 
     # pylint:disable=too-many-branches
-    def _run_part(self, hand=None, team=None):
+    def _run_part(self, hand=None, team=None, subplan=None):
         """
         Execute predefined action_type if Condition satisfied.
+
+        Args:
+            subplan (Optional[Tuple[:class:`~ery_backend.actions.plans.PlannedStep`]]): Compiled steps of subaction.
         """
         from ery_backend.stints.models import Stint
 
@@ -320,7 +329,7 @@ class ActionStep(EryPrivileged):
             elif self.action_type == ActionStep.ACTION_TYPE_CHOICES.set_era:
                 hand.set_era(self.era)
             elif self.action_type == ActionStep.ACTION_TYPE_CHOICES.subaction:
-                socket_message_args += self.subaction.run(hand=hand)
+                socket_message_args += self.subaction.run(hand=hand, plan=subplan)
             elif self.action_type == ActionStep.ACTION_TYPE_CHOICES.save_data:
                 hand.stint.save_output_data(self, hand)
             elif self.action_type == ActionStep.ACTION_TYPE_CHOICES.quit:
@@ -337,29 +346,41 @@ class ActionStep(EryPrivileged):
             hand.stint.set_status(Stint.STATUS_CHOICES.panicked)
             raise EryActionError(self, e, hand)
 
-    def run(self, hand):
+    def run(self, hand, subplan=None):
         """
         Use predefined for_each to execute :class:`ActionStep` at specific scope.
 
         Args:
             hand (:class:`~ery_backend.hands.models.Hand`): Provides context for :class:`ActionStep` objects.
+            subplan (Optional[Tuple[:class:`~ery_backend.actions.plans.PlannedStep`]]): Compiled steps of subaction.
         """
         socket_message_args = []
         if self.for_each == ActionStep.FOR_EACH_CHOICES.current_hand_only:
-            socket_message_args += self._run_part_conditionally(hand)
+            socket_message_args += self._run_part_conditionally(hand, subplan=subplan)
         # XXX: Add socket_message_args flow for more than just hand
         elif self.for_each == ActionStep.FOR_EACH_CHOICES.hand_in_neighborhood:
-            pass
+            from ery_backend.base.cache import batch_invalidations
+            from ery_backend.hands.models import Hand
+            from ery_backend.teams.networks import get_neighbor_ids
+
+            # Networks name hands by id, which may belong to other stints
+            neighbors = Hand.objects.filter(stint_id=hand.stint_id, id__in=get_neighbor_ids(hand)).select_related(
+                'stint', 'current_team', 'current_module', 'stage'
+            )
+            # Neighbors are loaded in one query, and the cache invalidations of their changes flushed together
+            with batch_invalidations():
+                for neighbor in neighbors.order_by('id'):
+                    self._run_part_conditionally(neighbor, subplan=subplan)
         elif self.for_each == ActionStep.FOR_EACH_CHOICES.hand_in_team:
             team_members = hand.current_team.hands.all()
             for team_hand in team_members:
-                self._run_part_conditionally(team_hand)
+                self._run_part_conditionally(team_hand, subplan=subplan)
         elif self.for_each == ActionStep.FOR_EACH_CHOICES.hand_in_stint:
             for stint_hand in hand.stint.hands.all():
-                self._run_part_conditionally(stint_hand)
+                self._run_part_conditionally(stint_hand, subplan=subplan)
         elif self.for_each == ActionStep.FOR_EACH_CHOICES.team_in_stint:
             for team in hand.stint.teams.all():
-                self._run_part_conditionally(team)
+                self._run_part_conditionally(team, subplan=subplan)
 
         return socket_message_args
 
@@ -369,11 +390,13 @@ class ActionStep(EryPrivileged):
         that should be saved to Google Datastore.
 
         Returns:
-            :class:`django.db.models.query.Queryset`: set of
-            :class:`~ery_backend.variables.models.VariableDefinition` objects.
+            Union[List, :class:`django.db.models.query.Queryset`]: :class:`~ery_backend.variables.models.VariableDefinition`
+            objects.
         """
-        if self.to_save.exists():
-            return self.to_save
+        # Uses to_save as prefetched by plans
+        to_save = list(self.to_save.all())
+        if to_save:
+            return to_save
 
         module_definitions = stint.stint_specification.stint_definition.module_definitions
         return VariableDefinition.objects.filter(module_definition__in=module_definitions.all()).filter(is_output_data=True)
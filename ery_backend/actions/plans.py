@@ -0,0 +1,130 @@
+"""
+Plans:
+    :class:`~ery_backend.actions.models.Action` instances compiled into immutable, nested tuples of their
+    :class:`~ery_backend.actions.models.ActionStep` objects, with all definitions used while running them loaded, so that
+    running an :class:`~ery_backend.actions.models.Action` queries runtime data only.
+"""
+from collections import namedtuple
+
+from django.core.cache import cache
+
+from ery_backend.base.cache import set_tagged
+
+# subplan is the plan of the subaction of subaction steps, and None otherwise
+PlannedStep = namedtuple('PlannedStep', ('step', 'subplan'))
+
+
+def _load_conditions(condition_ids):
+    """
+    Load conditions, their variable definitions and (nested) sub conditions, with one query per level of nesting.
+    """
+    from ery_backend.conditions.models import Condition
+
+    conditions = {}
+    pending_ids = set(condition_ids)
+    while pending_ids:
+        for condition in Condition.objects.filter(id__in=pending_ids).select_related(
+            'left_variable_definition', 'right_variable_definition'
+        ):
+            conditions[condition.id] = condition
+        pending_ids = {
+            sub_condition_id
+            for condition in conditions.values()
+            for sub_condition_id in (condition.left_sub_condition_id, condition.right_sub_condition_id)
+            if sub_condition_id and sub_condition_id not in conditions
+        }
+    for condition in conditions.values():
+        if condition.left_sub_condition_id:
+            condition.left_sub_condition = conditions[condition.left_sub_condition_id]
+        if condition.right_sub_condition_id:
+            condition.right_sub_condition = conditions[condition.right_sub_condition_id]
+    return conditions
+
+
+def compile_action_plan(action):
+    """
+    Args:
+        - action (:class:`~ery_backend.actions.models.Action`)
+
+    Notes:
+        - Steps of the action and its subactions are loaded with one query per level of nesting, together with their
+          variable_definition, era, subaction and to_save, and with their condition (see :func:`_load_conditions`).
+        - A subaction already being planned (i.e., a circular reference) is given no subplan, and planned when run.
+
+    Returns:
+        Tuple[:class:`PlannedStep`]: In order of execution.
+    """
+    from .models import ActionStep
+
+    actions = {action.id: action}
+    steps_by_action = {}
+    pending_ids = {action.id}
+    while pending_ids:
+        steps = (
+            ActionStep.objects.filter(action_id__in=pending_ids)
+            .select_related('variable_definition', 'era', 'subaction')
+            .prefetch_related('to_save')
+            .order_by('order', 'id')
+        )
+        pending_ids = set()
+        for step in steps:
+            step.action = actions[step.action_id]
+            steps_by_action.setdefault(step.action_id, []).append(step)
+            if step.action_type == ActionStep.ACTION_TYPE_CHOICES.subaction and step.subaction_id not in actions:
+                actions[step.subaction_id] = step.subaction
+                pending_ids.add(step.subaction_id)
+
+    all_steps = [step for steps in steps_by_action.values() for step in steps]
+    conditions = _load_conditions({step.condition_id for step in all_steps if step.condition_id})
+    for step in all_steps:
+        if step.condition_id:
+            step.condition = conditions[step.condition_id]
+
+    def _plan(action_id, planning):
+        planned_steps = []
+        for step in steps_by_action.get(action_id, ()):
+            subplan = None
+            if step.action_type == ActionStep.ACTION_TYPE_CHOICES.subaction and step.subaction_id not in planning:
+                subplan = _plan(step.subaction_id, planning | {step.subaction_id})
+            planned_steps.append(PlannedStep(step, subplan))
+        return tuple(planned_steps)
+
+    return _plan(action.id, {action.id})
+
+
+def _get_plan_tags(plan):
+    from ery_backend.modules.models import ModuleDefinition
+
+    tags = set()
+    for planned_step in plan:
+        action = planned_step.step.action
+        tags.add(planned_step.step.get_cache_tag())
+        tags.add(action.get_cache_tag())
+        tags.add(ModuleDefinition.get_cache_tag_by_pk(action.module_definition_id))
+        if planned_step.subplan:
+            tags.update(_get_plan_tags(planned_step.subplan))
+    return tags
+
+
+def get_action_plan(action):
+    """
+    Get the compiled plan of an :class:`~ery_backend.actions.models.Action` (see :func:`compile_action_plan`).
+
+    Notes:
+        - Cached, and invalidated on changes to the :class:`~ery_backend.actions.models.Action` instances planned, their
+          steps (including their to_save), or the :class:`~ery_backend.modules.models.ModuleDefinition` they belong to
+          (which covers conditions, variable definitions and eras).
+
+    Returns:
+        Tuple[:class:`PlannedStep`]
+    """
+    from ery_backend.modules.models import ModuleDefinition
+
+    cache_key = f'ACP:{action.id}'
+    plan = cache.get(cache_key)
+    if plan is None:
+        plan = compile_action_plan(action)
+        tags = _get_plan_tags(plan)
+        tags.update((action.get_cache_tag(), ModuleDefinition.get_cache_tag_by_pk(action.module_definition_id)))
+        set_tagged(cache_key, plan, tags)
+    return plan
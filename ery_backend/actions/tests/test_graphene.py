@@ -1,5 +1,7 @@
 from string import Template
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 import graphene
 
 from ery_backend.mutations import ActionMutation, ActionStepMutation
@@ -302,6 +304,31 @@ class TestReadActionStep(GQLTestCase):
         for actionstep_2_version_node_id in actionstep_2_version_node_ids:
             self.assertIn(actionstep_2_version_node_id, version_node_ids)
 
+    def test_version_nodes_query_count(self):
+        """Queries of versions of allActionSteps do not grow with the number of actionsteps"""
+        query = """{allActionSteps{ edges{ node{ versions{ edges{ node{ id }}}}}}}"""
+
+        def add_actionsteps(n):
+            for _ in range(n):
+                actionstep = ActionStepFactory()
+                create_revisions([{'obj': actionstep, 'attr': 'log_message'}], 2, user=self.editor['user'])
+                grant_role(self.editor['role'], actionstep.action.module_definition, self.editor['user'])
+
+        def execute():
+            with CaptureQueriesContext(connection) as queries:
+                result = self.gql_client.execute(query, context_value=self.gql_client.get_context(user=self.editor["user"]))
+            self.fail_on_errors(result)
+            return result, len(queries.captured_queries)
+
+        add_actionsteps(2)
+        _, few_query_count = execute()
+        add_actionsteps(5)
+        result, many_query_count = execute()
+        self.assertEqual(len(result['data']['allActionSteps']['edges']), 7)
+        for edge in result['data']['allActionSteps']['edges']:
+            self.assertEqual(len(edge['node']['versions']['edges']), 2)
+        self.assertEqual(many_query_count, few_query_count)
+
 
 class TestCreateActionStep(GQLTestCase):
     node_name = "ActionStepNode"
@@ -17,6 +17,7 @@ from ery_backend.scripts.grpc.engine_pb2 import Result, Value
 from ery_backend.stages.factories import StageDefinitionFactory
 from ery_backend.stints.factories import StintFactory
 from ery_backend.syncs.factories import EraFactory
+from ery_backend.teams.factories import TeamNetworkFactory
 from ery_backend.users.factories import UserFactory
 from ery_backend.validators.factories import ValidatorFactory
 from ery_backend.variables.factories import (
@@ -400,6 +401,33 @@ class TestActionStep(EryTestCase):
         self.assertEqual(self.hand_2.era, era_1)
         self.assertEqual(team.era, era_1)
 
+    @mock.patch('ery_backend.conditions.models.Condition.evaluate')
+    def test_hand_in_neighborhood(self, mock_evaluate):
+        """
+        Confirm steps run for each neighbor of a hand, in the networks of its stint.
+        """
+        mock_evaluate.return_value = True
+        # Hands of other stints are not in the neighborhood
+        other_hand = HandFactory()
+        hand_ids = (self.hand_1.id, self.hand_2.id, self.hand_3.id, other_hand.id)
+        TeamNetworkFactory(
+            stint=self.hand_1.stint,
+            network=(
+                "graph [ node [ id {} ] node [ id {} ] node [ id {} ] node [ id {} ]"
+                " edge [ source {} target {} ] edge [ source {} target {} ] ]"
+            ).format(*hand_ids, self.hand_1.id, self.hand_3.id, self.hand_1.id, other_hand.id),
+        )
+        action_step = ActionStepFactory(
+            action=self.action,
+            action_type=ActionStep.ACTION_TYPE_CHOICES.set_era,
+            for_each=ActionStep.FOR_EACH_CHOICES.hand_in_neighborhood,
+            era=self.era,
+        )
+        action_step.run(self.hand_1)
+        for hand, in_neighborhood in ((self.hand_1, False), (self.hand_2, False), (self.hand_3, True), (other_hand, False)):
+            hand.refresh_from_db()
+            self.assertEqual(hand.era == self.era, in_neighborhood)
+
     @mock.patch('ery_backend.conditions.models.Condition.evaluate')
     @mock.patch('ery_backend.scripts.ledger_client.send_payment')
     def test_pay_users(self, mock_payment, mock_evaluate):
@@ -589,7 +617,7 @@ class TestGetToSave(EryTestCase):
         vd = VariableDefinitionFactory(module_definition=self.module_definition)
         action = ActionFactory(module_definition=self.module_definition)
         action_step = ActionStepFactory(to_save=[vd], action=action)
-        self.assertEqual(action_step.get_to_save(self.stint).all()[0], vd)
+        self.assertEqual(action_step.get_to_save(self.stint)[0], vd)
 
     def test_get_to_save_unspecified(self):
         """
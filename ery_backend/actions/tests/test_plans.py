@@ -0,0 +1,98 @@
+from django.core.cache import cache
+
+from ery_backend.base.testcases import EryTestCase
+from ery_backend.conditions.factories import ConditionFactory
+from ery_backend.conditions.models import Condition
+from ery_backend.modules.factories import ModuleDefinitionFactory
+from ery_backend.syncs.factories import EraFactory
+from ery_backend.variables.factories import VariableDefinitionFactory
+
+from ..factories import ActionFactory, ActionStepFactory
+from ..models import ActionStep
+from ..plans import compile_action_plan, get_action_plan
+
+
+class TestActionPlan(EryTestCase):
+    def setUp(self):
+        self.module_definition = ModuleDefinitionFactory()
+        self.action = ActionFactory(module_definition=self.module_definition)
+        self.subaction = ActionFactory(module_definition=self.module_definition)
+        self.variable_definition = VariableDefinitionFactory(module_definition=self.module_definition)
+        sub_condition = ConditionFactory(
+            module_definition=self.module_definition,
+            left_type=Condition.TYPE_CHOICES.variable,
+            right_type=Condition.TYPE_CHOICES.expression,
+            left_variable_definition=self.variable_definition,
+            right_expression='1',
+            relation=Condition.RELATION_CHOICES.equal,
+        )
+        self.condition = ConditionFactory(
+            module_definition=self.module_definition,
+            left_type=Condition.TYPE_CHOICES.sub_condition,
+            right_type=Condition.TYPE_CHOICES.sub_condition,
+            left_sub_condition=sub_condition,
+            right_sub_condition=sub_condition,
+            relation=None,
+            operator=Condition.BINARY_OPERATOR_CHOICES.op_and,
+        )
+        self.set_variable_step = ActionStepFactory(
+            action=self.action,
+            order=1,
+            action_type=ActionStep.ACTION_TYPE_CHOICES.set_variable,
+            variable_definition=self.variable_definition,
+            condition=self.condition,
+            subaction=None,
+        )
+        self.subaction_step = ActionStepFactory(
+            action=self.action, order=2, action_type=ActionStep.ACTION_TYPE_CHOICES.subaction, subaction=self.subaction
+        )
+        self.set_era_step = ActionStepFactory(
+            action=self.subaction,
+            order=1,
+            action_type=ActionStep.ACTION_TYPE_CHOICES.set_era,
+            era=EraFactory(module_definition=self.module_definition),
+            subaction=None,
+        )
+        self.set_era_step.to_save.add(self.variable_definition)
+
+    def test_compile(self):
+        """
+        Confirm steps are planned in order, with everything used while running them loaded.
+        """
+        plan = compile_action_plan(self.action)
+        self.assertEqual([planned_step.step for planned_step in plan], [self.set_variable_step, self.subaction_step])
+        self.assertIsNone(plan[0].subplan)
+        self.assertEqual([planned_step.step for planned_step in plan[1].subplan], [self.set_era_step])
+
+        with self.assertNumQueries(0):
+            set_variable_step = plan[0].step
+            self.assertEqual(set_variable_step.action, self.action)
+            self.assertEqual(set_variable_step.variable_definition, self.variable_definition)
+            self.assertEqual(set_variable_step.condition.as_javascript(), self.condition.as_javascript())
+            self.assertEqual(plan[1].step.subaction, self.subaction)
+            set_era_step = plan[1].subplan[0].step
+            self.assertEqual(set_era_step.era, self.set_era_step.era)
+            self.assertEqual(set_era_step.get_to_save(None), [self.variable_definition])
+
+    def test_circular_subaction(self):
+        ActionStepFactory(
+            action=self.subaction, order=2, action_type=ActionStep.ACTION_TYPE_CHOICES.subaction, subaction=self.action
+        )
+        plan = compile_action_plan(self.action)
+        self.assertIsNone(plan[1].subplan[1].subplan)
+
+    def test_cache(self):
+        """
+        Confirm plans are cached, and invalidated on changes to their steps.
+        """
+        plan = get_action_plan(self.action)
+        with self.assertNumQueries(0):
+            self.assertEqual(get_action_plan(self.action), plan)
+
+        self.set_era_step.order = 3
+        self.set_era_step.save()
+        self.assertIsNone(cache.get(f'ACP:{self.action.id}'))
+        get_action_plan(self.action)
+
+        self.set_era_step.to_save.clear()
+        self.assertIsNone(cache.get(f'ACP:{self.action.id}'))
@@ -4,14 +4,20 @@ Tag:
     and exists to link other keys together for joint invalidation. A tag should not be
     nested within another tag. Rather, invalidation should work on multiple tags if necessary.
 """
+from contextlib import contextmanager, ExitStack
 from functools import wraps, partial
 import logging
+import threading
 import graphql
 
 from django.core.cache import cache
+from django.db import transaction
 
 logger = logging.getLogger(__name__)
 
+# Per thread state of tag collection and deferred invalidation
+_local = threading.local()
+
 
 def _get_update_cache_tag_lock(tag):
     """Return locking handler for cache tag updates."""
@@ -95,8 +101,14 @@ def invalidate_tag(tag):
     Deletes all cache keys in the set of values belonging to tag, as well as tag itself.
 
     Note:
-        If a value or tag intended for deletion does not exist, no error is triggered on cache.delete.
+        - If a value or tag intended for deletion does not exist, no error is triggered on cache.delete.
+        - Within :func:`collect_tags`, tag is only collected, to be invalidated by the caller.
     """
+    collected = getattr(_local, 'collected_tags', None)
+    if collected is not None:
+        collected.add(tag)
+        return
+
     to_invalidate_items = cache.get(tag)
     if to_invalidate_items is not None:
         with _get_update_cache_tag_lock(tag):
@@ -105,6 +117,111 @@ def invalidate_tag(tag):
             cache.delete(tag)
 
 
+def invalidate_many(tags):
+    """
+    Deletes all cache keys in the sets of values belonging to tags, as well as the tags themselves, using one read and
+    one delete.
+
+    Note:
+        - As in :func:`invalidate_tag`, the lock of each tag is held from the read to the delete, so that keys tagged
+          meanwhile are not dropped from their tags. Locks are taken in sorted order, so that concurrent calls cannot
+          deadlock.
+    """
+    tags = sorted(set(tags))
+    if not tags:
+        return
+    with ExitStack() as locks:
+        for tag in tags:
+            locks.enter_context(_get_update_cache_tag_lock(tag))
+        keys = set(tags)
+        for tagged in cache.get_many(tags).values():
+            keys.update(tagged)
+        cache.delete_many(keys)
+
+
+def is_tag_collected(tag):
+    """
+    Returns:
+        bool: Whether tag has already been collected by the current :func:`collect_tags`.
+    """
+    collected = getattr(_local, 'collected_tags', None)
+    return collected is not None and tag in collected
+
+
+@contextmanager
+def collect_tags():
+    """
+    Collect, instead of invalidating, the tags passed to :func:`invalidate_tag` within the block.
+
+    Yields:
+        Set[str]: Collected tags.
+    """
+    previous = getattr(_local, 'collected_tags', None)
+    _local.collected_tags = collected = set()
+    try:
+        yield collected
+    finally:
+        _local.collected_tags = previous
+
+
+def flush_invalidations():
+    """
+    Invalidate the tags of all instances passed to :func:`defer_invalidation`, together with those of their ancestors,
+    using :func:`invalidate_many`.
+    """
+    pending = getattr(_local, 'pending_invalidations', None)
+    if not pending:
+        return
+    _local.pending_invalidations = {}
+    with collect_tags() as tags:
+        for instance in pending.values():
+            instance.invalidate_tags()
+    invalidate_many(tags)
+    logger.debug("Invalidated %s cache tags of %s instances", len(tags), len(pending))
+
+
+def defer_invalidation(instance):
+    """
+    Invalidate the cache tags of an :class:`~ery_backend.base.models.EryModel` instance (see
+    :meth:`~ery_backend.base.models.EryModel.invalidate_tags`) once the current transaction commits, or, in
+    autocommit mode, immediately.
+
+    Notes:
+        - Within :func:`batch_invalidations`, invalidation is deferred until the end of the block instead.
+        - Instances are collected per thread. A flush registered by a transaction that is rolled back is taken over by
+          the next one to commit, so that every hook after the first of a transaction has nothing left to flush.
+    """
+    pending = getattr(_local, 'pending_invalidations', None)
+    if pending is None:
+        pending = _local.pending_invalidations = {}
+    pending[(instance.__class__, instance.pk)] = instance
+    if not getattr(_local, 'batch_depth', 0):
+        transaction.on_commit(flush_invalidations)
+
+
+@contextmanager
+def batch_invalidations():
+    """
+    Defer invalidations requested via :func:`defer_invalidation` within the block to one flush at its end (or at the end
+    of the enclosing transaction).
+    """
+    _local.batch_depth = getattr(_local, 'batch_depth', 0) + 1
+    try:
+        yield
+    finally:
+        _local.batch_depth -= 1
+        if not _local.batch_depth:
+            transaction.on_commit(flush_invalidations)
+
+
+def clear_pending_invalidations():
+    """
+    Drop invalidations deferred on the current thread without flushing them, as when their transaction is rolled back.
+    """
+    _local.pending_invalidations = {}
+    _local.batch_depth = 0
+
+
 def invalidate_handler(sender, instance, **kwargs):
     """
     Convenience method for getting an objects's cache_key and invalidating it. Used in signals.py
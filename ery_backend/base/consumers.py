@@ -3,6 +3,7 @@ from asgiref.sync import async_to_sync
 from channels.generic.websocket import JsonWebsocketConsumer
 from graphql_relay.node.node import from_global_id
 
+from .cache import batch_invalidations
 from .utils import channel_format, send_websocket_message, gen_socket_messages_from_arg
 
 
@@ -59,11 +60,12 @@ class WebRunnerConsumer(JsonWebsocketConsumer):
                 1) 'gql_id' key with value of connected widget's gql_id
                 2) 'stint_id' key with value of connected stint's gql_id
                 3) 'event' key with name of JavaScript event.
+            - Events are looked up in the dispatch table of the current
+              :class:`~ery_backend.modules.models.ModuleDefinition` of the :class:`~ery_backend.hands.models.Hand` (see
+              :func:`~ery_backend.modules.dispatch.get_dispatch_table`).
         """
         from ery_backend.hands.models import Hand
-        from ery_backend.forms.models import FormButton
-        from ery_backend.modules.widgets import ModuleDefinitionWidget
-        from ery_backend.templates.widgets import TemplateWidget
+        from ery_backend.modules.dispatch import dispatch_event
 
         required_subset = set(('gql_id', 'stint_id', 'name', 'event_type'))
         for element in required_subset:
@@ -71,22 +73,24 @@ class WebRunnerConsumer(JsonWebsocketConsumer):
                 raise ValidationError(
                     f'"{element}" not present in {required_subset} required for triggering' ' of widget events.'
                 )
-        wrapper_name, django_id = from_global_id(data['gql_id'])
-        if wrapper_name == 'ModuleDefinitionWidgetNode':
-            wrapper = ModuleDefinitionWidget.objects.get(pk=django_id)
-        elif wrapper_name == 'TemplateWidgetNode':
-            wrapper = TemplateWidget.objects.get(pk=django_id)
-        elif wrapper_name == 'FormButtonNode':
-            wrapper = FormButton.objects.get(pk=django_id)
 
         hand = Hand.objects.get(user=self.scope['user'], stint__id=data['stint_id'])
         value = data['value'] if 'value' in data and data['value'] != '' else None
         if data['current_stage_id'] == hand.stage.id:
-            socket_message_args = wrapper.trigger_events(data['name'], data['event_type'], hand, value=value)
+            socket_message_args = dispatch_event(hand, data['gql_id'], data['name'], data['event_type'], value=value)
             if socket_message_args:
                 messages = gen_socket_messages_from_arg(socket_message_args, hand)
                 send_websocket_message(hand, {'type': 'websocket.send', 'messages': messages})
 
+    def record_heartbeat(self):
+        """
+        Buffer the last_seen of the connected :class:`~ery_backend.hands.models.Hand`, without a database query.
+        """
+        from ery_backend.hands.heartbeats import record_heartbeat
+
+        if getattr(self, 'hand_id', None) is not None:
+            record_heartbeat(self.hand_id)
+
     def connect(self):
         # XXX: Use _get_hand_from_context
         from ery_backend.frontends.renderers import ReactRenderer
@@ -105,11 +109,19 @@ class WebRunnerConsumer(JsonWebsocketConsumer):
                 stint = Stint.objects.get(id=stint_id)
                 stint_definition_slug = stint.stint_specification.stint_definition.slug
                 hand = Hand.objects.filter(stint=stint, user=user).order_by('id').last()
+                self.hand_id = hand.id
+                hand.update_last_seen()
                 async_to_sync(self.channel_layer.group_add)(
                     f'{stint_definition_slug}{hand.stint.id}-{formatted_username}', self.channel_name
                 )
+                # For broadcasts to the whole stint (see send_stint_message)
+                async_to_sync(self.channel_layer.group_add)(
+                    channel_format(f'{stint_definition_slug}{hand.stint.id}'), self.channel_name
+                )
                 messages = []
                 stint_message = {'event': 'set_stint', 'data': stint_id}
+                # Identifies the hand in broadcasts to the whole stint
+                hand_message = {'event': 'set_hand', 'data': hand.id}
                 var_message = {'event': 'update_all_vars', 'data': ReactRenderer.generate_variables(hand)}
                 module_message = {'event': 'current_module', 'data': hand.current_module_definition.name}
                 stage_message = {
@@ -117,7 +129,7 @@ class WebRunnerConsumer(JsonWebsocketConsumer):
                     'data': {'current_stage': hand.stage.stage_definition.name, 'current_stage_id': hand.stage.id},
                 }
 
-                messages = [stint_message, var_message, module_message, stage_message]
+                messages = [stint_message, hand_message, var_message, module_message, stage_message]
                 send_websocket_message(hand, {'type': 'websocket.send', 'messages': messages})
         else:
             self.close()
@@ -129,9 +141,13 @@ class WebRunnerConsumer(JsonWebsocketConsumer):
         super().send_json(content)
 
     def receive_json(self, content):
-        data = content['data']
+        data = content.get('data')
         event_type = content['event']
-        if event_type == 'widget_event':
-            self.trigger_widget_events(data)
-        elif event_type == 'form_event':
-            self.trigger_form_events(data)
+        # Every event, including an explicit 'heartbeat', counts as activity of the hand
+        self.record_heartbeat()
+        # Runtime saves triggered by the event share one invalidation of cache tags
+        with batch_invalidations():
+            if event_type == 'widget_event':
+                self.trigger_widget_events(data)
+            elif event_type == 'form_event':
+                self.trigger_form_events(data)
@@ -1,7 +1,7 @@
 from graphql_relay.node.node import from_global_id
 
 from django.db import models, transaction
-from django.db.models import Count
+from django.db.models import Count, Q
 
 from .exceptions import EryTypeError
 
@@ -26,25 +26,15 @@ class EryQuerySet(models.QuerySet):
             - :class:`~ery_backend.base.exceptions.EryValidationrError`: Raised on invalid use/combination
               of user and/or group.
         """
-        from ery_backend.roles.utils import get_cached_role_ids_by_privilege
+        from ery_backend.roles.utils import get_privileged_ids
 
-        # get ids of associated roles
-        role_ids_with_privilege = get_cached_role_ids_by_privilege(privilege_name)
-
-        # use ids to get cls specific objs for user/user groups or group (EryValidationError raised here if necessary.)
-        filter_kwargs = {}
+        # Ids are matched in a subquery on the privilege ancestor (EryValidationError raised here if necessary.)
+        privileged_ids = get_privileged_ids(self.model.get_privilege_ancestor_cls(), privilege_name, user, group)
         if self.model.parent_field:
             # get linking attribute path between self.model and privilege_ancestor
-            ancestor_match_ids = self.model.get_privilege_ancestor_cls().get_ids_by_role_assignment(
-                role_ids_with_privilege, user, group
-            )
             ancestor_path = self.model.get_privilege_ancestor_filter_path()
-            filter_kwargs.update({'{}__id__in'.format(ancestor_path): ancestor_match_ids})
-        else:
-            obj_match_ids = self.model.get_ids_by_role_assignment(role_ids_with_privilege, user, group)
-            filter_kwargs.update({'id__in': obj_match_ids})
-        qs = self.filter(**filter_kwargs)
-        return qs
+            return self.filter(**{'{}__id__in'.format(ancestor_path): privileged_ids})
+        return self.filter(id__in=privileged_ids)
 
     def filter_privilege(self, privilege_name, user=None, group=None, **kwargs):
         """
@@ -77,9 +67,9 @@ class EryQuerySet(models.QuerySet):
 
         Note: EryValidationError is raised on invalid use/combination of user and/or group.
         """
-        from ery_backend.roles.models import Role
+        from .registry import get_role
 
-        owner_role_id = Role.objects.values_list('id', flat=True).get(name='owner')
+        owner_role_id = get_role('owner').id
 
         # use ids to get cls specific objs for user/user groups or group (EryValidationError raised here if necessary.)
         obj_match_ids = self.model.get_ids_by_role_assignment([owner_role_id], user, None)
@@ -96,7 +86,11 @@ class EryQuerySet(models.QuerySet):
             :class:`promise.Promise`[List[:class:`~ery_backend.base.models.EryModel`]]
         """
         dataloader = context.get_data_loader(self.model)
-        return dataloader.load_many(self.values_list('id', flat=True))
+        # Prime with the evaluated queryset, preserving its select_related and prefetch_related lookups
+        objs = list(self)
+        for obj in objs:
+            dataloader.prime(obj.id, obj)
+        return dataloader.load_many([obj.id for obj in objs])
 
 
 class EryManager(models.Manager):
@@ -151,9 +145,11 @@ class EryManager(models.Manager):
         return obj
 
     def delete_with_owner(self, obj_ids, user):
-        from ery_backend.roles.models import Role, RoleAssignment
+        from ery_backend.roles.models import RoleAssignment
 
-        owner = Role.objects.get(name='owner')
+        from .registry import get_role
+
+        owner = get_role('owner')
         role_assignments = RoleAssignment.objects.filter(
             content_type=self.model.get_content_type(), user=user, role=owner, object_id__in=obj_ids
         )
@@ -163,21 +159,14 @@ class EryManager(models.Manager):
 class EryFileQuerySet(EryQuerySet):
     def _filter_privilege(self, privilege_name, user=None, group=None):
         """
-        Used when additional query not needed (outside of get_cached_role_ids_by_privilege and
-        model.get_ids_by_role_assignment).
+        Extends :meth:`EryQuerySet._filter_privilege`, such that published files are always readable.
         """
-        from ery_backend.roles.utils import get_cached_role_ids_by_privilege
-
-        # get ids of associated roles
-        role_ids_with_privilege = get_cached_role_ids_by_privilege(privilege_name)
-        # use ids to get cls specific objs for user/user groups or group (EryValidationError raised here if necessary.)
-        obj_match_ids = self.model.get_ids_by_role_assignment(role_ids_with_privilege, user, group)
+        from ery_backend.roles.utils import get_privileged_ids
 
+        privileged_q = Q(id__in=get_privileged_ids(self.model, privilege_name, user, group))
         if privilege_name == 'read':
-            published_ids_q = self.model.objects.filter(published=True).exclude(id__in=obj_match_ids)
-            obj_match_ids += published_ids_q.values_list('id', flat=True)
-
-        return self.filter(id__in=obj_match_ids)
+            privileged_q |= Q(published=True)
+        return self.filter(privileged_q)
 
     def add_popularity(self):
         """
@@ -13,7 +13,9 @@ def get_model_batch_load_fn(model):
 
     def batch_load_fn(keys):
         logger.debug("Loading dataloader for %s with %s", model, keys)
-        return Promise.resolve(model.objects.filter(id__in=keys))
+        # DataLoader expects one value per key, in the order of keys
+        objs = {str(pk): obj for pk, obj in model.objects.in_bulk(keys).items()}
+        return Promise.resolve([objs.get(str(key)) for key in keys])
 
     return batch_load_fn
 
@@ -23,10 +25,50 @@ def get_model_data_loader(model):
     return DataLoader(get_model_batch_load_fn(model))
 
 
+def get_user_privilege_data_loader(user, privilege_name):
+    """Create dataloader of whether user has privilege on given objects."""
+    from ery_backend.roles.utils import has_privilege_many
+
+    def batch_load_fn(objs):
+        logger.debug("Loading privilege dataloader for %s with %s", privilege_name, objs)
+        return Promise.resolve(has_privilege_many(objs, user, privilege_name))
+
+    return DataLoader(batch_load_fn, cache_key_fn=lambda obj: (obj.__class__, obj.pk))
+
+
+def get_versions_data_loader():
+    """Create dataloader of the versions of given objects, newest first."""
+    from django.contrib.contenttypes.models import ContentType
+    from django.db.models import Q
+    from reversion.models import Version
+
+    def batch_load_fn(objs):
+        logger.debug("Loading versions dataloader with %s", objs)
+        object_ids = {}
+        for obj in objs:
+            object_ids.setdefault(ContentType.objects.get_for_model(obj.__class__).id, set()).add(str(obj.pk))
+        condition = Q()
+        for content_type_id, ids in object_ids.items():
+            condition |= Q(content_type_id=content_type_id, object_id__in=ids)
+        versions = {}
+        for version in Version.objects.filter(condition).select_related('revision').order_by('-id'):
+            versions.setdefault((version.content_type_id, version.object_id), []).append(version)
+        return Promise.resolve(
+            [versions.get((ContentType.objects.get_for_model(obj.__class__).id, str(obj.pk)), []) for obj in objs]
+        )
+
+    return DataLoader(batch_load_fn, cache_key_fn=lambda obj: (obj.__class__, obj.pk))
+
+
 class DataLoaderMiddleware:
-    """Middleware to add `context.get_dataloader` method.  """
+    """
+    Middleware to add `context.get_dataloader`, `context.get_privilege_data_loader` and
+    `context.get_versions_data_loader` methods.
+    """
 
     cache_attrname = 'data_loader_cache'
+    privilege_cache_attrname = 'privilege_data_loader_cache'
+    versions_cache_attrname = 'versions_data_loader_cache'
 
     def resolve(self, resolve_next, parent, info, **kwargs):
         """Graphene middleware resolve method."""
@@ -40,5 +82,22 @@ class DataLoaderMiddleware:
                 cache[model] = get_model_data_loader(model)
             return cache[model]
 
+        def get_privilege_data_loader(user, privilege_name):
+            attrname = self.privilege_cache_attrname
+            if not hasattr(info.context, attrname):
+                setattr(info.context, attrname, {})
+            cache = getattr(info.context, attrname)
+            if (user.pk, privilege_name) not in cache:
+                cache[(user.pk, privilege_name)] = get_user_privilege_data_loader(user, privilege_name)
+            return cache[(user.pk, privilege_name)]
+
+        def get_versions_data_loader():
+            attrname = self.versions_cache_attrname
+            if not hasattr(info.context, attrname):
+                setattr(info.context, attrname, get_versions_data_loader())
+            return getattr(info.context, attrname)
+
         info.context.get_data_loader = get_data_loader
+        info.context.get_privilege_data_loader = get_privilege_data_loader
+        info.context.get_versions_data_loader = get_versions_data_loader
         return resolve_next(parent, info, **kwargs)
@@ -1,13 +1,18 @@
+from collections import namedtuple
+from functools import lru_cache
 import random
 import re
 import string
 
+from django.apps import apps
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
 from django.db import models
+from django.db.models import F, Prefetch
 
 import graphene
 from model_utils import Choices
 
+from .cache import ery_cache, get_func_cache_key, tag_key
 from .exceptions import EryValueError, EryValidationError
 
 
@@ -274,9 +279,11 @@ class PrivilegedMixin(models.Model):
             :class:`ery_backend.users.models.User`
 
         """
-        from ery_backend.roles.models import Role, RoleAssignment
+        from ery_backend.roles.models import RoleAssignment
 
-        owner = Role.objects.get(name='owner')
+        from .registry import get_role
+
+        owner = get_role('owner')
         content_type = self.get_content_type()
         owner_role_assignment = (
             RoleAssignment.objects.filter(role=owner, content_type=content_type, object_id=self.id).exclude(user=None).first()
@@ -457,6 +464,17 @@ class RenderMixin(models.Model):
         raise NotImplementedError(f"Method not implemented for {hand.frontend}")
 
 
+BlockInfo = namedtuple('BlockInfo', ('name', 'content', 'block_type', 'ancestor_id'))
+
+
+@lru_cache(maxsize=None)
+def _get_block_ancestor_cls(block_type):
+    for model in apps.get_models():
+        if model.__name__ == block_type:
+            return model.get_privilege_ancestor_cls()
+    raise LookupError(f"No block model named {block_type}")
+
+
 class BlockHolderMixin(RenderMixin):  # pylint: disable=abstract-method
     """
     Add methods for rendering via connected block models.
@@ -490,11 +508,22 @@ class BlockHolderMixin(RenderMixin):  # pylint: disable=abstract-method
             Union[:class:`~ery_backend.template.models.TemplateBlock`,
                   :class:`~ery_backend.commands.models.CommandTemplateBlock`]
         """
-        element = self
-        while getattr(element, element.block_parent):
-            element = getattr(element, element.block_parent)
+        ancestors = self.get_block_ancestors()
+        element = ancestors[-1] if ancestors else self
         return element.blocks.first()
 
+    def get_block_ancestors(self):
+        """
+        Get the chain of block parents of current instance, following block_parent.
+
+        Returns:
+            List[:class:`BlockHolderMixin`]: Nearest parent first.
+        """
+        parent = getattr(self, self.block_parent) if self.block_parent else None
+        if parent is None:
+            return []
+        return [parent] + parent.get_block_ancestors()
+
     @staticmethod
     def _get_server_side_evaluation_calls(block_content):
         regex_pattern = r'\{\{(.*?)\}\}'
@@ -524,53 +553,105 @@ class BlockHolderMixin(RenderMixin):  # pylint: disable=abstract-method
         # pylint:disable=anomalous-backslash-in-string
         return self._escape_server_side_evaluation_call(block_content)
 
-    def get_local_blocks(self, frontend, language, raw=False):
+    @ery_cache
+    def get_block_catalog(self, frontend_id=None, language_id=None):
         """
-        Collects block info into dict.
-        """
-        return {
-            block.name: {
-                # Handle optional frontend in BlockHolder
-                'content': block.get_translation_by_frontend_language(frontend, language).content,
-                # XXX: Re-add evaluate_block(block.get_translation(frontend, language)) in issue #708
-                # 'content': block.get_translation(frontend, language) if raw else evaluate_block(
-                #     block.get_translation(frontend, language)),
-                'block_type': block.__class__.__name__,
-                'ancestor_id': block.get_privilege_ancestor().id,
-                'ancestor': block.get_privilege_ancestor(),
-            }
-            for block in self.blocks.all()
-        }
+        Compile the blocks of current instance and its block ancestors.
+
+        Args:
+            - frontend_id (Optional[int]): Of the :class:`~ery_backend.frontends.models.Frontend` of translations, where
+              translations have one.
+            - language_id (Optional[str]): Of the :class:`Language` of translations.
+
+        Notes:
+            - Blocks and their translations are fetched with one prefetch per block model across the whole chain of
+              block holders, rather than with queries per block and per ancestor.
+            - Cached as :class:`BlockInfo` tuples, until current instance or any of its block ancestors is invalidated.
 
-    def get_ancestor_blocks(self, frontend, language, raw=False):
-        ancestral_blocks = {}
+        Raises:
+            - :class:`~ery_backend.base.exceptions.EryValidationError`: Raised if a block has no matching translation.
 
-        if self.block_parent:
-            block_model = getattr(self, self.block_parent)
-            if block_model:
-                ancestral_blocks.update(block_model.get_blocks_by_frontend_language(frontend, language, raw))
+        Returns:
+            List[:class:`BlockInfo`]: Blocks of current instance, followed by those of its ancestors. Blocks of nearer
+            holders override same named blocks of farther ones.
+        """
+        holders = [self] + self.get_block_ancestors()
+        holder_ids_by_cls = {}
+        for holder in holders:
+            holder_ids_by_cls.setdefault(holder.__class__, []).append(holder.id)
+
+        blocks_by_holder = {}
+        for holder_cls, holder_ids in holder_ids_by_cls.items():
+            block_model = holder_cls._meta.get_field('blocks').related_model
+            translation_model = block_model._meta.get_field('translations').related_model
+            translations = translation_model.objects.filter(language_id=language_id)
+            if hasattr(translation_model, 'frontend'):
+                translations = translations.filter(frontend_id=frontend_id)
+            blocks = (
+                block_model.objects.filter(**{f'{block_model.parent_field}__in': holder_ids})
+                .annotate(ancestor_id=F(block_model.get_privilege_ancestor_filter_path()))
+                .prefetch_related(Prefetch('translations', queryset=translations, to_attr='catalog_translations'))
+            )
+            for block in blocks:
+                holder_id = getattr(block, f'{block_model.parent_field}_id')
+                blocks_by_holder.setdefault((holder_cls, holder_id), []).append(block)
+
+        catalog = {}
+        for holder in holders:
+            for block in blocks_by_holder.get((holder.__class__, holder.id), []):
+                if block.name in catalog:
+                    continue
+                if not block.catalog_translations:
+                    raise EryValidationError(
+                        f'No translation of language: {language_id}, exists for frontend: {frontend_id}, for'
+                        f' {block.__class__}, {block}.'
+                    )
+                catalog[block.name] = BlockInfo(
+                    block.name, block.catalog_translations[0].content, block.__class__.__name__, block.ancestor_id
+                )
 
-        return ancestral_blocks
+        # Changes to ancestors do not necessarily invalidate current instance
+        cache_key = get_func_cache_key(self.get_block_catalog, self, frontend_id, language_id)
+        tag_key([holder.get_cache_tag() for holder in holders[1:]], cache_key)
+        return list(catalog.values())
 
     def get_blocks_by_frontend_language(self, frontend=None, language=None, raw=False):
         """
         Gets information regarding all block objects connected to model instance.
 
         Args:
-            - hand (:class:`~ery_backend.hands.models.Hand`): Provides
-              :class:`~ery_backend.frontends.models.Frontend` used to filter connected
+            - frontend (:class:`~ery_backend.frontends.models.Frontend`): Used to filter connected
               :class:`~ery_backend.stages.models.StageTemplateBlock` and
               :class:`~ery_backend.templates.models.TemplateBlock` instances.
+            - language (Union[:class:`Language`, str]): Used to filter translations.
             - raw (boolean): If false, perform server side evaluation of blocks.
 
+        Notes:
+            - Built from :meth:`get_block_catalog`, with privilege ancestors fetched in bulk.
+
         Returns:
             dict: Model instance information. Keys represent the (str) lower cased name of each retrieved
             Model instance and values represent the names (user and formatted) and content of said block.
         """
-        blocks = self.get_local_blocks(frontend, language, raw)
-        blocks.update({k: v for (k, v) in self.get_ancestor_blocks(frontend, language, raw).items() if k not in blocks})
+        catalog = self.get_block_catalog(getattr(frontend, 'pk', frontend), getattr(language, 'pk', language))
 
-        return blocks
+        ancestor_ids_by_block_type = {}
+        for block_info in catalog:
+            ancestor_ids_by_block_type.setdefault(block_info.block_type, set()).add(block_info.ancestor_id)
+        ancestors = {
+            block_type: _get_block_ancestor_cls(block_type).objects.in_bulk(ancestor_ids)
+            for block_type, ancestor_ids in ancestor_ids_by_block_type.items()
+        }
+
+        return {
+            block_info.name: {
+                'content': block_info.content,
+                'block_type': block_info.block_type,
+                'ancestor_id': block_info.ancestor_id,
+                'ancestor': ancestors[block_info.block_type][block_info.ancestor_id],
+            }
+            for block_info in catalog
+        }
 
     def get_blocks(self, frontend, language):
         return self.get_blocks_by_frontend_language(frontend=frontend, language=language)
@@ -629,11 +710,12 @@ class ChoiceMixin(TranslationHolderMixin):
         Returns:
             str: Translation model's caption.
         """
-        try:
-            translation = self.translations.get(language=language)
-            return translation.caption
-        except self.translations.model.DoesNotExist:
-            return self.value
+        # Filtered in Python, to make use of prefetched translations
+        language_id = getattr(language, 'pk', language)
+        for translation in self.translations.all():
+            if translation.language_id == language_id:
+                return translation.caption
+        return self.value
 
     def get_info(self, language):
         """
@@ -680,7 +762,7 @@ class ChoiceHolderMixin:
         from ery_backend.variables.models import VariableDefinition
 
         choice_type = VariableDefinition.DATA_TYPE_CHOICES.choice
-        is_multiple_choice = self.choices.exists()
+        is_multiple_choice = bool(self.choices.all())
         if self.variable_definition and not is_multiple_choice:
             is_multiple_choice = self.variable_definition.data_type == choice_type
         return is_multiple_choice
@@ -786,9 +868,11 @@ class LogMixin:
             - system_only (Optional[bool]): Whether to create a :class:`~ery_backend.logs.models.Log` instance.
 
         Notes:
-            - A :class:`~ery_backend.logs.models.Log` instance is only created for system_only=False cases.
+            - A :class:`~ery_backend.logs.models.Log` instance is only created for system_only=False cases, in the
+              background (see :mod:`ery_backend.logs.sink`).
         """
         from ..logs.models import Log
+        from ..logs.sink import record_log
 
         levels = {
             Log.LOG_TYPE_CHOICES.debug: 10,
@@ -801,7 +885,7 @@ class LogMixin:
             log_type = Log.LOG_TYPE_CHOICES.info
         logger.log(levels[log_type], message)
         if not system_only:
-            Log.objects.create(message=message, log_type=log_type, **creation_kwargs)
+            record_log(message=message, log_type=log_type, **creation_kwargs)
 
 
 class StateMixin(models.Model):
@@ -211,6 +211,11 @@ class EryModel(TimeStampedModel):
             - history (List[:class:`EryModel`]): Keeps track of which models have already
               had their tags invalidated to prevent circularity.
         """
+        from .cache import is_tag_collected
+
+        if is_tag_collected(self.get_cache_tag()):
+            # Already collected, together with the tags of related models
+            return
         if not history:
             history = [self]
         self._invalidate_tag()
@@ -602,6 +607,43 @@ class EryModel(TimeStampedModel):
         return cls.create_mutation_serializer()
 
 
+class RuntimeModelMixin:
+    """
+    Adds a lightweight save to models written while a :class:`~ery_backend.stints.models.Stint` runs.
+
+    Notes:
+        - Must precede :class:`EryModel` (and any mixin overriding save) in the bases of the model.
+    """
+
+    def runtime_clean(self):
+        """
+        Validation required on every write, including those of :meth:`save` given update_fields.
+        """
+
+    def save(self, *args, **kwargs):
+        """
+        Override of :meth:`EryModel.save`.
+
+        Notes:
+            - If update_fields are given for an existing instance, only those fields (and modified) are written.
+              Authoring validation (clean, post_save_clean) and touching of ancestors are skipped, and invalidation of
+              cache tags is deferred to the end of the transaction (see :func:`~ery_backend.base.cache.defer_invalidation`).
+            - Otherwise, :meth:`EryModel.save` is used.
+        """
+        from .cache import defer_invalidation
+
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or self._state.adding:
+            super().save(*args, **kwargs)
+            return
+
+        self.runtime_clean()
+        kwargs['update_fields'] = set(update_fields) | {'modified'}
+        # Skip the overrides between this mixin and Django's save
+        super(EryModel, self).save(*args, **kwargs)  # pylint: disable=bad-super-call
+        defer_invalidation(self)
+
+
 class EryNamed(EryModel, NamedMixin):
     """Abstract models providing a unique name and comment."""
 
@@ -729,6 +771,18 @@ class EryFile(EryNamed, PrivilegedMixin, KeywordMixin, SluggedMixin, StateMixin)
     name = models.CharField(max_length=512, unique=False, blank=False, help_text="Name of instance")
     published = models.BooleanField(default=False, help_text="Publically viewable")
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self.update_search_document()
+
+    def update_search_document(self):
+        """
+        Create or refresh the :class:`~ery_backend.folders.models.FileSearchDocument` of the current instance.
+        """
+        from ery_backend.folders.models import FileSearchDocument
+
+        FileSearchDocument.update_file(self)
+
     def create_link(self, folder):
         from ery_backend.folders.models import Link
 
@@ -0,0 +1,121 @@
+"""
+Registry:
+    Process-level copies of small, rarely changing reference tables, loaded in full on first use. A table is reloaded
+    after a save or delete of one of its rows in the current process (see :func:`registry_handler`), on a miss, and after
+    ERY_REGISTRY_TIMEOUT seconds, by which other processes pick up changes.
+
+Notes:
+    - Instances are shared between threads and requests, and must be treated as read-only.
+"""
+import threading
+import time
+
+from django.apps import apps
+from django.conf import settings
+
+
+class Registry:
+    """
+    Instances of a model, by the value of one of their fields.
+
+    Args:
+        - model_label (str): As given to :meth:`django.apps.apps.get_model`.
+        - key_field (str): Unique field by which instances are looked up.
+    """
+
+    def __init__(self, model_label, key_field):
+        self.model_label = model_label
+        self.key_field = key_field
+        self._lock = threading.Lock()
+        self._objects = None
+        self._loaded = None
+
+    @property
+    def model(self):
+        return apps.get_model(self.model_label)
+
+    def _load(self, reload=False):
+        objects, loaded = self._objects, self._loaded
+        if reload or objects is None or time.monotonic() - loaded > settings.ERY_REGISTRY_TIMEOUT:
+            with self._lock:
+                objects = {getattr(obj, self.key_field): obj for obj in self.model.objects.all()}
+                self._objects, self._loaded = objects, time.monotonic()
+        return objects
+
+    def get(self, key):
+        """
+        Args:
+            - key: Value of key_field.
+
+        Raises:
+            - :class:`django.core.exceptions.ObjectDoesNotExist`: The DoesNotExist of the model, if no instance matches
+              key, even after a reload.
+
+        Returns:
+            :class:`django.db.models.Model`
+        """
+        objects = self._load()
+        if key not in objects:
+            # May have been created since loading
+            objects = self._load(reload=True)
+        try:
+            return objects[key]
+        except KeyError:
+            raise self.model.DoesNotExist(f"{self.model.__name__} with {self.key_field}: {key}, does not exist")
+
+    def clear(self):
+        self._objects = None
+
+
+frontends = Registry('frontends.Frontend', 'name')
+languages = Registry('languages_plus.Language', 'pk')
+privileges = Registry('roles.Privilege', 'name')
+roles = Registry('roles.Role', 'name')
+
+REGISTRIES = (frontends, languages, privileges, roles)
+
+
+def get_frontend(name):
+    """
+    Returns:
+        :class:`~ery_backend.frontends.models.Frontend`
+    """
+    return frontends.get(name)
+
+
+def get_language(pk):
+    """
+    Returns:
+        :class:`Language`
+    """
+    return languages.get(pk)
+
+
+def get_privilege(name):
+    """
+    Returns:
+        :class:`~ery_backend.roles.models.Privilege`
+    """
+    return privileges.get(name)
+
+
+def get_role(name):
+    """
+    Returns:
+        :class:`~ery_backend.roles.models.Role`
+    """
+    return roles.get(name)
+
+
+def clear_registries():
+    for registry in REGISTRIES:
+        registry.clear()
+
+
+def registry_handler(sender, **kwargs):
+    """
+    Drop the :class:`Registry` of a changed model.
+    """
+    for registry in REGISTRIES:
+        if registry.model is sender:
+            registry.clear()
@@ -8,6 +8,7 @@ import django_filters
 import graphene
 from graphene import relay
 from graphql_relay import from_global_id
+from promise import Promise
 from reversion.models import Version, Revision
 from rest_framework import serializers
 
@@ -16,7 +17,7 @@ from ery_backend.base.utils import get_gql_id
 from ery_backend.roles.utils import grant_ownership, has_privilege
 from ery_backend.users.utils import authenticated_user
 
-from .schema_utils import EryObjectType, EryFilterConnectionField
+from .schema_utils import EryObjectType, EryFilterConnectionField, PrefetchedResults
 from .utils import verified_revert
 
 
@@ -31,18 +32,28 @@ class PrivilegedNodeMixin:
         user = authenticated_user(info.context)
         django_model = cls._meta.model
         data_loader = info.context.get_data_loader(django_model)
+        privilege_data_loader = info.context.get_privilege_data_loader(user, 'read')
 
-        qs = cls._meta.model.objects
-        if filter_kwargs:
-            qs = qs.filter(**filter_kwargs)
-        if exclude_kwargs:
-            qs = qs.exclude(**exclude_kwargs)
-        django_object = qs.get(pk=node_id)
+        if filter_kwargs or exclude_kwargs:
+            qs = cls._meta.model.objects
+            if filter_kwargs:
+                qs = qs.filter(**filter_kwargs)
+            if exclude_kwargs:
+                qs = qs.exclude(**exclude_kwargs)
+            qs.values_list('pk', flat=True).get(pk=node_id)
 
-        if has_privilege(django_object, user, 'read'):
-            return data_loader.load(django_object.id)
+        def check_privilege(django_object):
+            if django_object is None:
+                raise django_model.DoesNotExist(f"{django_model.__name__} matching query does not exist.")
 
-        raise ValueError("not authorized")
+            def authorize(allowed):
+                if allowed:
+                    return django_object
+                raise ValueError("not authorized")
+
+            return privilege_data_loader.load(django_object).then(authorize)
+
+        return data_loader.load(node_id).then(check_privilege)
 
 
 class EryMutationMixin:
@@ -127,6 +138,7 @@ class VersionNode(EryObjectType):
         interfaces = (relay.Node,)
         filter_privilege = False
         use_dataloader = False
+        keyset_ordering = ('-id',)
 
     @classmethod
     def get_node(cls, info, node_id):
@@ -142,11 +154,20 @@ class VersionMixin:
 
     def resolve_versions(self, info):
         user = authenticated_user(info.context)
-        if has_privilege(self, user, 'view_versions'):
-            qs = Version.objects.get_for_object(self)
-        else:
-            qs = Version.objects.get_for_object(self).filter(revision__user=user)
-        return qs
+
+        def restrict(results):
+            can_view_versions, versions = results
+            if can_view_versions:
+                return PrefetchedResults(versions)
+            return PrefetchedResults(version for version in versions if version.revision.user_id == user.id)
+
+        # Privileges and versions are each loaded in one query for all parents
+        return Promise.all(
+            [
+                info.context.get_privilege_data_loader(user, 'view_versions').load(self),
+                info.context.get_versions_data_loader().load(self),
+            ]
+        ).then(restrict)
 
 
 class VersionInput(graphene.ObjectType):
@@ -1,6 +1,14 @@
+import base64
+import hashlib
+import json
+
 import django  # Needed to migrate
-from django.core.exceptions import FieldDoesNotExist
-from django.db import models, transaction
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet, FieldDoesNotExist
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection as db_connection, models, transaction
+from django.db.models import Prefetch, Q
 from django.db.models.fields.related import ForeignKey
 
 import django_filters
@@ -10,9 +18,11 @@ from graphene.types.resolver import dict_resolver
 from graphene_django.fields import DjangoConnectionField
 from graphene_django.filter.fields import DjangoFilterConnectionField
 from graphene_django.filter.filterset import custom_filterset_factory
-from graphene_django.registry import set_connection_fields
+from graphene_django.registry import get_global_registry, set_connection_fields
 from graphene_django.types import DjangoObjectType, DjangoObjectTypeOptions
+from graphql.language.ast import FragmentSpread, InlineFragment
 from graphql_relay.node.node import from_global_id
+from promise import Promise
 
 from ery_backend.base.mixins import PrivilegedMixin
 from ery_backend.base.utils import to_snake_case
@@ -20,14 +30,63 @@ from ery_backend.users.utils import authenticated_user
 from ery_backend.roles.utils import has_privilege
 
 
+def get_estimated_count(model):
+    """
+    Get the number of rows of the table of model, as estimated by Postgres statistics.
+
+    Returns:
+        int: Negative if the table has never been analyzed.
+    """
+    with db_connection.cursor() as cursor:
+        cursor.execute("SELECT reltuples FROM pg_class WHERE relname = %s", [model._meta.db_table])
+        row = cursor.fetchone()
+    return int(row[0]) if row else -1
+
+
+def get_total_count(qs):
+    """
+    Count the rows of qs, approximately for large tables.
+
+    Notes:
+        - Tables estimated to hold fewer than ERY_EXACT_COUNT_LIMIT rows are always counted exactly.
+        - Otherwise, unfiltered querysets are estimated through :func:`get_estimated_count`, while counts of filtered
+          querysets are cached for ERY_COUNT_CACHE_TIMEOUT seconds.
+
+    Returns:
+        int
+    """
+    if isinstance(qs, list):
+        # Prefetched results (see PrefetchedResults)
+        return len(qs)
+    if get_estimated_count(qs.model) < settings.ERY_EXACT_COUNT_LIMIT:
+        return qs.count()
+    if not qs.query.where:
+        return get_estimated_count(qs.model)
+
+    try:
+        sql = str(qs.query)
+    except EmptyResultSet:
+        return 0
+    cache_key = f"COUNT:{hashlib.md5(sql.encode()).hexdigest()}"
+    count = cache.get(cache_key)
+    if count is None:
+        count = qs.count()
+        cache.set(cache_key, count, settings.ERY_COUNT_CACHE_TIMEOUT)
+    return count
+
+
 class CountableConnection(relay.Connection):
     class Meta:
         abstract = True
 
     total_count = graphene.Int()
+    next_key = graphene.String(description="Opaque key of the next page, for nodes with keyset pagination")
 
     def resolve_total_count(self, info):
-        return self.unlimited_iterable.count()
+        return get_total_count(self.unlimited_iterable)
+
+    def resolve_next_key(self, info):
+        return getattr(self, "keyset_next_key", None)
 
 
 def ery_object_default_resolver(attname, default_value, root, info, **args):
@@ -51,12 +110,20 @@ def ery_object_default_resolver(attname, default_value, root, info, **args):
         from ery_backend.base.models import EryModel
         from ery_backend.users.models import User
 
+        prefetched = getattr(root, get_prefetch_attname(attname), None)
+        if prefetched is not None:
+            # Loaded through prefetch_related by optimize_queryset
+            return PrefetchedResults(prefetched)
+
         if issubclass(root.__class__, EryModel) or isinstance(root, User) and hasattr(root, attname):
             try:
                 field = root._meta.get_field(attname)
             except FieldDoesNotExist:
                 pass
             else:
+                if isinstance(field, ForeignKey) and field.is_cached(root):
+                    # Loaded through select_related by optimize_queryset
+                    return getattr(root, attname)
                 if isinstance(field, ForeignKey) and hasattr(field, "id"):
                     related_id = getattr(root, f"{attname}_id")
                     if related_id is not None:
@@ -102,6 +169,7 @@ class EryObjectTypeOptions(DjangoObjectTypeOptions):
     filter_privilege = None
     use_dataloader = None
     use_connection = None
+    keyset_ordering = None
 
 
 class EryObjectType(DjangoObjectType):
@@ -120,6 +188,7 @@ class EryObjectType(DjangoObjectType):
         filter_privilege=True,
         use_connection=None,
         use_dataloader=True,
+        keyset_ordering=None,
         _meta=None,
         **options,
     ):
@@ -147,6 +216,7 @@ class EryObjectType(DjangoObjectType):
         _meta.filter_privilege = filter_privilege
         _meta.use_dataloader = use_dataloader
         _meta.use_connection = use_connection
+        _meta.keyset_ordering = keyset_ordering
 
         super(EryObjectType, cls).__init_subclass_with_meta__(
             _meta=_meta,
@@ -404,6 +474,241 @@ class EryObjectType(DjangoObjectType):
         )
 
 
+# Fields loaded even when not selected, as privilege checks and state filtering depend on them
+ALWAYS_LOADED_FIELDS = ('published', 'state')
+
+
+def _get_selections(selection_set, info):
+    """Yield the fields of a selection set, expanding fragments"""
+    for selection in selection_set.selections:
+        if isinstance(selection, FragmentSpread):
+            yield from _get_selections(info.fragments[selection.name.value].selection_set, info)
+        elif isinstance(selection, InlineFragment):
+            yield from _get_selections(selection.selection_set, info)
+        else:
+            yield selection
+
+
+def _get_node_selection_set(field_ast, info):
+    """Get the selection set of the node of a field, skipping the edges of connections"""
+    if field_ast.selection_set is None:
+        return None
+    for selection in _get_selections(field_ast.selection_set, info):
+        if selection.name.value == "edges":
+            for edge_selection in _get_selections(selection.selection_set, info):
+                if edge_selection.name.value == "node":
+                    return edge_selection.selection_set
+            return None
+    return field_ast.selection_set
+
+
+# Arguments of connections that do not change which rows are resolved
+PAGINATION_ARGS = ('offset', 'limit', 'first', 'last', 'before', 'after')
+
+
+class PrefetchedResults(list):
+    """
+    Rows of a connection, prefetched by :func:`optimize_queryset` of its parent (or loaded in batch by its resolver),
+    already restricted and ordered as the connection would.
+    """
+
+
+def get_prefetch_attname(field_name):
+    """Get the attribute holding the rows of a connection prefetched by :func:`optimize_queryset`"""
+    return f"_prefetched_{field_name}"
+
+
+def _get_connection_prefetch_queryset(model, name, selection, info):
+    """
+    Get the queryset with which to prefetch a connection, as restricted by its :class:`EryConnectionField`.
+
+    Returns:
+        Optional[:class:`django.db.models.query.QuerySet`]: None if the field is not an :class:`EryConnectionField`
+        resolved by default, or is given arguments filtering its rows.
+    """
+    node_type = get_global_registry().get_type_for_model(model)
+    if node_type is None or getattr(node_type, f"resolve_{name}", None) is not None:
+        return None
+    connection_field = node_type._meta.fields.get(name)
+    if not isinstance(connection_field, EryConnectionField):
+        return None
+    if any(argument.name.value not in PAGINATION_ARGS for argument in selection.arguments or ()):
+        return None
+
+    node = connection_field.node_type
+    node_meta = node._meta
+    qs = node.get_queryset(node_meta.model.objects.all(), info)
+    if issubclass(node_meta.model, PrivilegedMixin) and node_meta.filter_privilege:
+        user = getattr(info.context, "user", None)
+        if not user:
+            return None
+        qs = qs.filter_privilege("read", user)
+    if node_meta.keyset_ordering:
+        qs = qs.order_by(*node_meta.keyset_ordering)
+    return qs
+
+
+def _collect_related(model, selection_set, info, prefix, joinable, select_related, prefetch_related, only):
+    """
+    Add lookups required by selection_set on model.
+
+    Args:
+        - model (:class:`django.db.models.Model`)
+        - selection_set (:class:`graphql.language.ast.SelectionSet`)
+        - info (:class:`graphql.execution.base.ResolveInfo`)
+        - prefix (str): Lookup path from the root model.
+        - joinable (bool): Whether model is loaded through joins of the root query, rather than through prefetching.
+        - select_related (Set[str])
+        - prefetch_related (Dict[str, Optional[:class:`django.db.models.query.QuerySet`]]): Querysets by lookup, for
+          connections prefetched into the attribute given by :func:`get_prefetch_attname`.
+        - only (Set[str])
+    """
+    loaded_fields = {model._meta.pk.name}
+    if isinstance(getattr(model, "parent_field", None), str):
+        loaded_fields.add(model.parent_field)
+    known_fields = True
+
+    for selection in _get_selections(selection_set, info):
+        name = to_snake_case(selection.name.value)
+        if name in ("id", "__typename"):
+            continue
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            # Resolved by the node, which may use any field
+            known_fields = False
+            continue
+
+        if not field.is_relation:
+            loaded_fields.add(name)
+            continue
+        if field.related_model is None:
+            known_fields = False
+            continue
+
+        path = f"{prefix}{name}"
+        sub_selection_set = _get_node_selection_set(selection, info)
+        if joinable and field.concrete and (field.many_to_one or field.one_to_one):
+            select_related.add(path)
+            loaded_fields.add(name)
+            related_joinable = True
+        else:
+            prefetch_queryset = _get_connection_prefetch_queryset(model, name, selection, info)
+            if prefetch_queryset is not None:
+                path = f"{prefix}{get_prefetch_attname(name)}"
+            prefetch_related[path] = prefetch_queryset
+            related_joinable = False
+        if sub_selection_set is not None:
+            _collect_related(
+                field.related_model,
+                sub_selection_set,
+                info,
+                f"{path}__",
+                related_joinable,
+                select_related,
+                prefetch_related,
+                only,
+            )
+        elif related_joinable:
+            only.update(f"{path}__{related_field.name}" for related_field in field.related_model._meta.concrete_fields)
+
+    if joinable:
+        if known_fields:
+            loaded_fields.update(name for name in ALWAYS_LOADED_FIELDS if hasattr(model, name))
+        else:
+            loaded_fields.update(field.name for field in model._meta.concrete_fields)
+        only.update(f"{prefix}{name}" for name in loaded_fields)
+
+
+def optimize_queryset(qs, info):
+    """
+    Apply select_related, prefetch_related and only to qs, based on the fields requested by a GraphQL query.
+
+    Args:
+        - qs (:class:`django.db.models.query.QuerySet`)
+        - info (:class:`graphql.execution.base.ResolveInfo`): Info of the field resolving qs.
+
+    Notes:
+        - Forward relations are joined, while reverse and many-to-many relations (and anything nested in them) are
+          prefetched.
+        - Loaded fields are only restricted for models whose requested fields are all model fields, as nodes resolving
+          other fields may use any of them.
+        - Connections resolved by default and without filtering arguments are prefetched as their
+          :class:`EryConnectionField` would restrict and order them, and then resolved from the prefetched rows.
+
+    Returns:
+        :class:`django.db.models.query.QuerySet`
+    """
+    select_related, prefetch_related, only = set(), {}, set()
+    for field_ast in info.field_asts:
+        selection_set = _get_node_selection_set(field_ast, info)
+        if selection_set is not None:
+            _collect_related(qs.model, selection_set, info, "", True, select_related, prefetch_related, only)
+
+    if select_related:
+        qs = qs.select_related(*sorted(select_related))
+    if prefetch_related:
+        lookups = []
+        for path in sorted(prefetch_related):
+            prefix, _, attname = path.rpartition("__")
+            if prefetch_related[path] is None:
+                lookups.append(path)
+            else:
+                # Prefetched from the relation the connection resolves by default
+                relation = prefix + ("__" if prefix else "") + attname[len(get_prefetch_attname("")) :]
+                lookups.append(Prefetch(relation, queryset=prefetch_related[path], to_attr=attname))
+        qs = qs.prefetch_related(*lookups)
+    if only:
+        qs = qs.only(*sorted(only))
+    return qs
+
+
+def encode_keyset(obj, ordering):
+    """
+    Encode the values of the ordering fields of obj into an opaque key.
+
+    Args:
+        - obj (:class:`django.db.models.Model`)
+        - ordering (Tuple[str]): Field names, prefixed with '-' if descending.
+
+    Returns:
+        str
+    """
+    values = [getattr(obj, field_name.lstrip("-")) for field_name in ordering]
+    return base64.urlsafe_b64encode(json.dumps(values, cls=DjangoJSONEncoder).encode()).decode()
+
+
+def filter_keyset(qs, ordering, key):
+    """
+    Restrict qs to rows following the row encoded in key, under ordering.
+
+    Args:
+        - qs (:class:`django.db.models.query.QuerySet`)
+        - ordering (Tuple[str]): Field names, prefixed with '-' if descending.
+        - key (str): Generated by :func:`encode_keyset`.
+
+    Returns:
+        :class:`django.db.models.query.QuerySet`
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(key.encode()))
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid key: {key}")
+    if len(values) != len(ordering):
+        raise ValueError(f"Invalid key: {key}")
+
+    # (a, b) > (x, y) is expanded to a > x OR (a = x AND b > y), which allows directions to be mixed
+    condition = Q()
+    preceding = {}
+    for field_name, value in zip(ordering, values):
+        name = field_name.lstrip("-")
+        value = qs.model._meta.get_field(name).to_python(value)
+        lookup = "lt" if field_name.startswith("-") else "gt"
+        condition |= Q(**preceding, **{f"{name}__{lookup}": value})
+        preceding[name] = value
+    return qs.filter(condition)
+
+
 class EryConnectionField(DjangoConnectionField):
     def __init__(self, *args, **kwargs):
         self._add_ery_fields(kwargs)
@@ -414,6 +719,7 @@ class EryConnectionField(DjangoConnectionField):
         kwargs["ids"] = graphene.List(graphene.ID)
         kwargs["offset"] = graphene.Int()
         kwargs["limit"] = graphene.Int()
+        kwargs["after_key"] = graphene.String()
 
     @staticmethod
     def apply_ery_filters(qs, kwargs):
@@ -465,6 +771,7 @@ class EryConnectionField(DjangoConnectionField):
     @classmethod
     def _resolve_queryset(cls, connection, queryset, info, args):
         qs = connection._meta.node.get_queryset(queryset, info)
+        qs = optimize_queryset(qs, info)
         qs = cls.apply_ery_filters(qs, args)
         qs = cls.apply_id_filters(qs, args)
 
@@ -477,18 +784,59 @@ class EryConnectionField(DjangoConnectionField):
 
         return qs
 
+    @staticmethod
+    def is_prefetched(iterable, args):
+        """
+        Whether iterable holds the rows of the connection, needing no further filtering.
+
+        Notes:
+            - See :class:`PrefetchedResults`. Only pagination arguments may be given, as they are applied on
+              resolving the connection.
+        """
+        return isinstance(iterable, PrefetchedResults) and all(arg in PAGINATION_ARGS for arg in args)
+
     @classmethod
     def resolve_queryset(cls, connection, queryset, info, args):
+        if Promise.is_thenable(queryset):
+            return Promise.resolve(queryset).then(lambda resolved: cls.resolve_queryset(connection, resolved, info, args))
+        if cls.is_prefetched(queryset, args):
+            return queryset
+        if isinstance(queryset, PrefetchedResults):
+            queryset = connection._meta.node._meta.model.objects.filter(pk__in=[obj.pk for obj in queryset])
         qs = cls._resolve_queryset(connection, queryset, info, args)
         return qs.from_dataloader(info.context)
 
+    @staticmethod
+    def apply_keyset(qs, kwargs, ordering):
+        """
+        Order qs by ordering, starting after the row given by the after_key argument.
+
+        Notes:
+            - Used instead of offsets by nodes declaring a keyset_ordering, such that later pages are as fast as the
+              first.
+        """
+        qs = qs.order_by(*ordering)
+        if kwargs.get("after_key"):
+            qs = filter_keyset(qs, ordering, kwargs["after_key"])
+        return qs
+
     @classmethod
     def resolve_connection(cls, connection, args, iterable):
-        unlimited_iterable = iterable._chain()  # pylint: disable=protected-access
+        keyset_ordering = getattr(connection._meta.node._meta, "keyset_ordering", None)
+        if isinstance(iterable, list):
+            # Already restricted, and ordered by any keyset_ordering (see PrefetchedResults)
+            unlimited_iterable = iterable
+        else:
+            unlimited_iterable = iterable._chain()  # pylint: disable=protected-access
+            if keyset_ordering:
+                iterable = cls.apply_keyset(iterable, args, keyset_ordering)
         iterable = cls.apply_ery_limits(iterable, args)
 
         connection = super().resolve_connection(connection, args, iterable)
         connection.unlimited_iterable = unlimited_iterable
+        limit = args.get("limit")
+        if keyset_ordering and limit and len(connection.edges) == limit:
+            connection.keyset_next_key = encode_keyset(connection.edges[-1].node, keyset_ordering)
 
         return connection
 
@@ -496,8 +844,14 @@ class EryConnectionField(DjangoConnectionField):
 class EryFilterConnectionField(DjangoFilterConnectionField, EryConnectionField):
     @classmethod
     def resolve_queryset(cls, connection, iterable, info, args, filtering_args, filterset_class):
-        if isinstance(iterable, list) and iterable:
-            iterable = iterable[0]._meta.model.objects.filter(pk__in=[element.pk for element in iterable])
+        if Promise.is_thenable(iterable):
+            return Promise.resolve(iterable).then(
+                lambda resolved: cls.resolve_queryset(connection, resolved, info, args, filtering_args, filterset_class)
+            )
+        if cls.is_prefetched(iterable, args):
+            return iterable
+        if isinstance(iterable, list):
+            iterable = connection._meta.node._meta.model.objects.filter(pk__in=[element.pk for element in iterable])
         qs = super(EryFilterConnectionField, cls)._resolve_queryset(connection, iterable, info, args)
         filter_kwargs = {k: v for k, v in args.items() if k in filtering_args}
         return filterset_class(data=filter_kwargs, queryset=qs, request=info.context).qs
@@ -1,15 +1,34 @@
-from django.db.models.signals import m2m_changed, post_save
+from django.db.models.signals import m2m_changed, post_delete, post_save
 
+from ery_backend.actions.models import ActionStep
 from ery_backend.commands.utils import assign_default_commands
+from ery_backend.comments.models import FileStar
+from ery_backend.folders.models import FileSearchDocument, file_keywords_handler, file_star_handler
 from ery_backend.modules.models import ModuleDefinition
 from ery_backend.roles.models import Role
+from ery_backend.roles.utils import privilege_access_handler
 from ery_backend.users.models import User
 
 from .cache import invalidate_handler
+from .registry import REGISTRIES, registry_handler
 
 
-for cls in (Role.privileges.through, User.groups.through):
+for cls in (Role.privileges.through, User.groups.through, ActionStep.to_save.through):
     m2m_changed.connect(invalidate_handler, cls)
 
+for cls in (Role.privileges.through, Role.parents.through):
+    m2m_changed.connect(privilege_access_handler, cls)
+
 for cls in (ModuleDefinition,):
     post_save.connect(assign_default_commands, cls)
+
+for cls in (FileStar,):
+    post_save.connect(file_star_handler, cls)
+    post_delete.connect(file_star_handler, cls)
+
+for field_name, _ in FileSearchDocument.FILE_CHOICES:
+    m2m_changed.connect(file_keywords_handler, FileSearchDocument._meta.get_field(field_name).related_model.keywords.through)
+
+for registry in REGISTRIES:
+    post_save.connect(registry_handler, registry.model)
+    post_delete.connect(registry_handler, registry.model)
@@ -32,7 +32,9 @@ from ery_backend.variables.factories import VariableDefinitionFactory
 from ery_backend.variables.models import VariableDefinition
 from ery_backend.widgets.models import Widget
 
+from .cache import clear_pending_invalidations
 from .middleware import DataLoaderMiddleware
+from .registry import clear_registries
 from .utils import get_gql_id, get_default_language, get_loggedin_client
 
 logger = logging.getLogger(__name__)
@@ -454,6 +456,12 @@ class EryTestCase(TestCase):
         logger.info("Running %s at %s", cls, dt.datetime.now())
         super().setUpClass(*args, **kwargs)
 
+    def tearDown(self):
+        # Rows rolled back after each test do not signal registries, nor commit to flush deferred invalidations
+        clear_registries()
+        clear_pending_invalidations()
+        super().tearDown()
+
 
 class EryTransactionTestCase(TransactionTestCase):
     """
@@ -2,8 +2,11 @@ import random
 import string
 import unittest
 from math import pi
+from unittest import mock
 
 from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from ery_backend.base.testcases import EryTestCase, create_test_hands
 from ery_backend.modules.factories import ModuleDefinitionFactory
@@ -12,7 +15,18 @@ from ery_backend.roles.models import Privilege, Role, RoleParent
 from ery_backend.roles.utils import grant_role, revoke_role, has_privilege
 from ery_backend.users.factories import UserFactory
 from ery_backend.variables.factories import VariableDefinitionFactory, HandVariableFactory
-from ..cache import get_func_cache_key, get_func_cache_key_for_hand, invalidate_tag, set_tagged, ery_cache
+from ery_backend.variables.models import VariableDefinition
+from ..cache import (
+    _get_update_cache_tag_lock,
+    collect_tags,
+    ery_cache,
+    flush_invalidations,
+    get_func_cache_key,
+    get_func_cache_key_for_hand,
+    invalidate_many,
+    invalidate_tag,
+    set_tagged,
+)
 
 
 class TestCaching(EryTestCase):
@@ -245,3 +259,88 @@ class TestCaching(EryTestCase):
         self.assertEqual(cache.get(hello_say_key), result, msg="failed to cache hello.say(..)")
         invalidate_tag(tag)
         self.assertEqual(cache.get(tag), None, msg="failed to invalidate by tag")
+
+
+class TestDeferredInvalidation(EryTestCase):
+    def setUp(self):
+        self.hand = create_test_hands(n=1, signal_pubsub=False).first()
+        module_definition = self.hand.current_module.stint_definition_module_definition.module_definition
+        variable_definition = VariableDefinitionFactory(
+            module_definition=module_definition,
+            scope=VariableDefinition.SCOPE_CHOICES.hand,
+            data_type=VariableDefinition.DATA_TYPE_CHOICES.int,
+            default_value=0,
+        )
+        self.variable = HandVariableFactory(hand=self.hand, variable_definition=variable_definition, value=1)
+        self.tags = [self.variable.get_cache_tag(), self.hand.current_module.get_cache_tag(), self.hand.stint.get_cache_tag()]
+
+    def tearDown(self):
+        flush_invalidations()
+        super().tearDown()
+
+    def test_invalidate_many(self):
+        set_tagged('many_key1', 'value1', ['many_tag_1'])
+        set_tagged('many_key2', 'value2', ['many_tag_2'])
+        set_tagged('many_key3', 'value3', ['many_tag_3'])
+        invalidate_many(['many_tag_1', 'many_tag_2'])
+        self.assertIsNone(cache.get('many_key1'))
+        self.assertIsNone(cache.get('many_tag_1'))
+        self.assertIsNone(cache.get('many_key2'))
+        self.assertEqual(cache.get('many_key3'), 'value3')
+        invalidate_tag('many_tag_3')
+
+    def test_invalidate_many_locks(self):
+        """
+        Confirm the lock of each tag is held while invalidating, as in invalidate_tag.
+        """
+        set_tagged('locked_key', 'value', ['locked_tag_2', 'locked_tag_1'])
+        with mock.patch('ery_backend.base.cache._get_update_cache_tag_lock', wraps=_get_update_cache_tag_lock) as mock_lock:
+            invalidate_many(['locked_tag_2', 'locked_tag_1', 'locked_tag_2'])
+        self.assertEqual([call[0][0] for call in mock_lock.call_args_list], ['locked_tag_1', 'locked_tag_2'])
+        self.assertIsNone(cache.get('locked_key'))
+
+    def test_collect_tags(self):
+        set_tagged('collected_key', 'value', ['collected_tag'])
+        with collect_tags() as tags:
+            invalidate_tag('collected_tag')
+        self.assertEqual(tags, {'collected_tag'})
+        self.assertEqual(cache.get('collected_key'), 'value')
+        invalidate_tag('collected_tag')
+
+    def test_runtime_save(self):
+        """
+        Confirm a save given update_fields writes only those fields, and invalidates tags on commit.
+        """
+        for tag in self.tags:
+            set_tagged(f'{tag}:key', 'value', [tag])
+
+        self.variable.value = '2'
+        with mock.patch('ery_backend.base.cache.transaction.on_commit') as on_commit:
+            with CaptureQueriesContext(connection) as context:
+                self.variable.save(update_fields=['value'])
+        updates = [query['sql'] for query in context.captured_queries if query['sql'].startswith('UPDATE')]
+        self.assertEqual(len(updates), 1)
+        self.assertIn('"value"', updates[0])
+        self.assertNotIn('"hand_id"', updates[0])
+        self.variable.refresh_from_db()
+        self.assertEqual(self.variable.value, 2)
+
+        # Invalidation waits for the commit
+        on_commit.assert_called_once_with(flush_invalidations)
+        for tag in self.tags:
+            self.assertEqual(cache.get(f'{tag}:key'), 'value')
+        flush_invalidations()
+        for tag in self.tags:
+            self.assertIsNone(cache.get(f'{tag}:key'))
+            self.assertIsNone(cache.get(tag))
+
+    def test_full_save(self):
+        """
+        Confirm a save without update_fields invalidates tags immediately.
+        """
+        tag = self.variable.get_cache_tag()
+        set_tagged(f'{tag}:key', 'value', [tag])
+        with mock.patch('ery_backend.base.cache.transaction.on_commit') as on_commit:
+            self.variable.save()
+        on_commit.assert_not_called()
+        self.assertIsNone(cache.get(f'{tag}:key'))
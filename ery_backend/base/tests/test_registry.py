@@ -0,0 +1,41 @@
+from django.test.utils import override_settings
+
+from ery_backend.frontends.models import Frontend
+from ery_backend.roles.factories import RoleFactory
+from ery_backend.roles.models import Role
+
+from ..registry import get_frontend, get_language, get_role
+from ..testcases import EryTestCase
+
+
+class TestRegistry(EryTestCase):
+    def test_get(self):
+        """Reference rows are loaded once"""
+        web = get_frontend('Web')
+        self.assertEqual(web, Frontend.objects.get(name='Web'))
+        with self.assertNumQueries(0):
+            self.assertIs(get_frontend('Web'), web)
+            self.assertEqual(get_frontend('SMS').name, 'SMS')
+        self.assertEqual(get_language('en').pk, 'en')
+
+    def test_does_not_exist(self):
+        with self.assertRaises(Frontend.DoesNotExist):
+            get_frontend('Carrier pigeon')
+
+    def test_miss(self):
+        """Rows created since loading are found"""
+        get_role('owner')
+        role = RoleFactory()
+        self.assertEqual(get_role(role.name), role)
+
+    def test_change(self):
+        """Changed rows are reloaded"""
+        owner = get_role('owner')
+        Role.objects.get(name='owner').save()
+        self.assertIsNot(get_role('owner'), owner)
+
+    @override_settings(ERY_REGISTRY_TIMEOUT=-1)
+    def test_timeout(self):
+        get_frontend('Web')
+        with self.assertNumQueries(1):
+            get_frontend('Web')
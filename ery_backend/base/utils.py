@@ -7,9 +7,8 @@ from asgiref.sync import async_to_sync
 from channels.layers import get_channel_layer
 from django.conf import settings
 
-from languages_plus.models import Language
-
 from .cache import ery_cache
+from .registry import get_language
 
 
 @ery_cache
@@ -159,7 +158,7 @@ def get_default_language(pk=False):
     """
     if pk:
         return settings.DEFAULT_LANGUAGE
-    return Language.objects.get(pk=settings.DEFAULT_LANGUAGE)
+    return get_language(settings.DEFAULT_LANGUAGE)
 
 
 def channel_format(string):
@@ -247,6 +246,20 @@ def send_websocket_message(hand, message, group='hand'):
             async_to_sync(channel_layer.group_send)(channel_name, message)
 
 
+def send_stint_message(stint, message):
+    """
+    Broadcast a message to every connected :class:`~ery_backend.hands.models.Hand` of a
+    :class:`~ery_backend.stints.models.Stint`, in one send to its channel.
+
+    Args:
+        - stint (:class:`~ery_backend.stints.models.Stint`)
+        - message (Dict[str, Any])
+    """
+    channel_layer = get_channel_layer()
+    stint_channel = f'{stint.stint_specification.stint_definition.slug}{stint.id}'
+    async_to_sync(channel_layer.group_send)(channel_format(stint_channel), message)
+
+
 def to_snake_case(camelcase):
     """
     Convert camelcase formatted name to snake case
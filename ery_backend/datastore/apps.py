@@ -0,0 +1,6 @@
+from django.apps import AppConfig
+
+
+class DatastoreConfig(AppConfig):
+    name = 'ery_backend.datastore'
+    verbose_name = "Datastore"
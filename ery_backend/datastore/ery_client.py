@@ -4,6 +4,8 @@ from time import sleep
 from google.cloud import datastore
 from google.api_core.exceptions import GatewayTimeout
 
+from django.conf import settings
+
 
 logger = logging.getLogger(__name__)
 
@@ -135,8 +137,17 @@ class EryDatastoreClient:
 
 
 def get_datastore_client():
+    """
+    Returns:
+        The client of the backend selected through settings.ERY_DATASTORE_BACKEND ('google' or 'postgres').
+    """
     global ery_datastore_client  # pylint:disable=global-statement
 
     if not ery_datastore_client:
-        ery_datastore_client = EryDatastoreClient()
+        if getattr(settings, "ERY_DATASTORE_BACKEND", "google") == "postgres":
+            from .postgres_client import PostgresDatastoreClient
+
+            ery_datastore_client = PostgresDatastoreClient()
+        else:
+            ery_datastore_client = EryDatastoreClient()
     return ery_datastore_client
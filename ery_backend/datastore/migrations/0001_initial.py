@@ -0,0 +1,58 @@
+# Generated by Django 2.2.11 on 2020-05-12 17:03
+
+import django.contrib.postgres.fields.jsonb
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            # Django cannot declare partitioned tables. Partitions are created on demand by the postgres client.
+            database_operations=[
+                migrations.RunSQL(
+                    sql=(
+                        'CREATE TABLE "datastore_entity" ('
+                        ' "id" bigserial NOT NULL,'
+                        ' "partition" varchar(640) NOT NULL,'
+                        ' "kind" varchar(64) NOT NULL,'
+                        ' "path" text NOT NULL,'
+                        ' "parent_path" text NULL,'
+                        ' "properties" jsonb NOT NULL'
+                        ') PARTITION BY LIST ("partition");'
+                    ),
+                    reverse_sql='DROP TABLE "datastore_entity" CASCADE;',
+                ),
+                # Declared on the partitioned table, and so created on each of its partitions (Postgres 11+)
+                migrations.RunSQL(
+                    sql='CREATE INDEX "datastore_e_partiti_df67b4_idx" ON "datastore_entity" ("partition", "kind");',
+                    reverse_sql='DROP INDEX "datastore_e_partiti_df67b4_idx";',
+                ),
+            ],
+            state_operations=[
+                migrations.CreateModel(
+                    name='OutputEntity',
+                    fields=[
+                        ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                        ('partition', models.CharField(help_text='Kind and id/name of the root key of the entity', max_length=640)),
+                        ('kind', models.CharField(max_length=64)),
+                        ('path', models.TextField(help_text="JSON encoded flat path of the entity's key")),
+                        ('parent_path', models.TextField(blank=True, help_text='JSON encoded flat path of the parent key', null=True)),
+                        ('properties', django.contrib.postgres.fields.jsonb.JSONField(default=dict)),
+                    ],
+                    options={
+                        'db_table': 'datastore_entity',
+                    },
+                ),
+                migrations.AddIndex(
+                    model_name='outputentity',
+                    index=models.Index(fields=['partition', 'kind'], name='datastore_e_partiti_df67b4_idx'),
+                ),
+            ],
+        ),
+    ]
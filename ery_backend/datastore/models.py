@@ -0,0 +1,28 @@
+from django.contrib.postgres.fields import JSONField
+from django.db import models
+
+
+class OutputEntity(models.Model):
+    """
+    Postgres representation of a datastore entity, as written by
+    :class:`~ery_backend.datastore.postgres_client.PostgresDatastoreClient`.
+
+    Notes:
+        - The table is partitioned by LIST on partition, which holds the root of the entity's key (e.g., 'Run:<stint.pk>'),
+          so that all output of a :class:`~ery_backend.stints.models.Stint` lives in its own partition.
+        - Rows are written through COPY and are never updated in place. A put of an existing key replaces its row.
+    """
+
+    class Meta:
+        db_table = 'datastore_entity'
+        indexes = [models.Index(fields=['partition', 'kind'])]
+
+    id = models.BigAutoField(primary_key=True)
+    partition = models.CharField(max_length=640, help_text="Kind and id/name of the root key of the entity")
+    kind = models.CharField(max_length=64)
+    path = models.TextField(help_text="JSON encoded flat path of the entity's key")
+    parent_path = models.TextField(null=True, blank=True, help_text="JSON encoded flat path of the parent key")
+    properties = JSONField(default=dict)
+
+    def __str__(self):
+        return f"{self.kind} ({self.path})"
@@ -0,0 +1,211 @@
+import csv
+import datetime as dt
+import hashlib
+import io
+import json
+import logging
+
+from google.cloud import datastore
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils.dateparse import parse_datetime
+
+
+logger = logging.getLogger(__name__)
+
+DATETIME_TAG = "__datetime__"
+
+
+class _EntityEncoder(json.JSONEncoder):
+    """Tag datetimes so that they survive the round trip through JSONB"""
+
+    def default(self, o):  # pylint:disable=method-hidden
+        if isinstance(o, dt.datetime):
+            return {DATETIME_TAG: o.isoformat()}
+        return super().default(o)
+
+
+def _decode_value(value):
+    """Reverse the tagging done by :class:`_EntityEncoder`"""
+    if isinstance(value, dict):
+        if len(value) == 1 and DATETIME_TAG in value:
+            return parse_datetime(value[DATETIME_TAG])
+        return {k: _decode_value(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_decode_value(v) for v in value]
+    return value
+
+
+def _encode_path(key):
+    return json.dumps(list(key.flat_path))
+
+
+def _get_partition(key):
+    """Entities are partitioned by their root key, meaning one partition per :class:`~ery_backend.stints.models.Stint` run"""
+    return "{}:{}".format(*key.flat_path[:2])
+
+
+class PostgresQuery:
+    """Subset of :class:`google.cloud.datastore.query.Query` used by ery, served by a server-side cursor"""
+
+    def __init__(self, client, kind=None, ancestor=None):
+        self.client = client
+        self.kind = kind
+        self.ancestor = ancestor
+
+    def get_queryset(self):
+        from .models import OutputEntity
+
+        qs = OutputEntity.objects.all()
+        if self.kind is not None:
+            qs = qs.filter(kind=self.kind)
+        if self.ancestor is not None:
+            ancestor_path = _encode_path(self.ancestor)
+            # Descendant paths continue the ancestor's JSON list, i.e. '["Run", 1' + ', "Write", ...]'
+            qs = qs.filter(partition=_get_partition(self.ancestor), path__startswith=f"{ancestor_path[:-1]}, ")
+        return qs.order_by('id')
+
+    def fetch(self, limit=None):
+        """Yield matching entities, streaming them from the database in chunks"""
+        qs = self.get_queryset()
+        if limit is not None:
+            qs = qs[:limit]
+        for path, properties in qs.values_list('path', 'properties').iterator(chunk_size=self.client.fetch_chunk_size):
+            yield self.client.to_entity(path, properties)
+
+
+class PostgresDatastoreClient:
+    """
+    Drop-in replacement for :class:`~ery_backend.datastore.ery_client.EryDatastoreClient`, storing entities as JSONB
+    rows of :class:`~ery_backend.datastore.models.OutputEntity`.
+
+    Notes:
+        - Writes are bulk loaded through COPY.
+        - Reads of entire runs and datasets are streamed through server-side cursors.
+        - Keys remain :class:`google.cloud.datastore.key.Key` instances, so the ery entities work unchanged.
+    """
+
+    copy_columns = ('partition', 'kind', 'path', 'parent_path', 'properties')
+    fetch_chunk_size = 2000
+
+    def __init__(self, project=None):
+        self.project = project or getattr(settings, "PROJECT_NAME", "eryservices-176219")
+        self._partitions = set()
+        self._is_partitioned = None
+
+    def key(self, *path_args, **kwargs):
+        """Proxy to google.cloud.datastore.key.Key"""
+        if kwargs.get('parent') is None:
+            kwargs.setdefault('project', self.project)
+        return datastore.Key(*path_args, **kwargs)
+
+    def to_entity(self, path, properties):
+        """Build a generic :class:`google.cloud.datastore.Entity` from a stored row"""
+        entity = datastore.Entity(key=self.key(*json.loads(path)))
+        entity.update(_decode_value(properties))
+        return entity
+
+    def _table_is_partitioned(self):
+        # Test databases are built from the model rather than migrations, and thus have a plain table
+        if self._is_partitioned is None:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT relkind FROM pg_class WHERE relname = %s", ['datastore_entity'])
+                row = cursor.fetchone()
+            self._is_partitioned = row is not None and row[0] == 'p'
+        return self._is_partitioned
+
+    def _ensure_partitions(self, partitions):
+        missing = set(partitions) - self._partitions
+        if missing and self._table_is_partitioned():
+            with connection.cursor() as cursor:
+                for partition in missing:
+                    table_name = f"datastore_entity_{hashlib.md5(partition.encode()).hexdigest()[:16]}"
+                    cursor.execute(
+                        f'CREATE TABLE IF NOT EXISTS "{table_name}" PARTITION OF "datastore_entity" FOR VALUES IN (%s)',
+                        [partition],
+                    )
+                    cursor.execute(f'CREATE INDEX IF NOT EXISTS "{table_name}_kind_path" ON "{table_name}" (kind, path)')
+        self._partitions.update(missing)
+
+    def get(self, key, **kwargs):
+        """Retrieve an entity from a single key, if it exists."""
+        entities = self.get_multi([key])
+        return entities[0] if entities else None
+
+    def get_multi(self, keys, **kwargs):
+        """Retrieve entities, along with their attributes"""
+        from .models import OutputEntity
+
+        if not keys:
+            return []
+        rows = OutputEntity.objects.filter(
+            partition__in={_get_partition(key) for key in keys}, path__in=[_encode_path(key) for key in keys]
+        ).values_list('path', 'properties')
+        return [self.to_entity(path, properties) for path, properties in rows]
+
+    def put(self, entity):
+        """Save an entity"""
+        return self.put_multi([entity])
+
+    def put_multi(self, entities):
+        """
+        Save entities using a single COPY.
+
+        Notes:
+            - Existing rows sharing a key with one of the entities are replaced.
+        """
+        from .models import OutputEntity
+
+        if not entities:
+            return
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        partitions = set()
+        paths = []
+        for entity in entities:
+            partition = _get_partition(entity.key)
+            path = _encode_path(entity.key)
+            parent_path = _encode_path(entity.key.parent) if entity.key.parent else None
+            partitions.add(partition)
+            paths.append(path)
+            writer.writerow([partition, entity.kind, path, parent_path, json.dumps(dict(entity), cls=_EntityEncoder)])
+        buffer.seek(0)
+
+        self._ensure_partitions(partitions)
+        columns = ", ".join(f'"{column}"' for column in self.copy_columns)
+        with transaction.atomic():
+            OutputEntity.objects.filter(partition__in=partitions, path__in=paths).delete()
+            with connection.cursor() as cursor:
+                cursor.copy_expert(f'COPY "datastore_entity" ({columns}) FROM STDIN WITH (FORMAT csv)', buffer)
+
+    def auto_batch_puts(self, entities, delay=0):
+        """COPY has no batch size limit, so all entities are written at once."""
+        self.put_multi(entities)
+
+    def delete(self, key):
+        """Delete the key"""
+        return self.delete_multi([key])
+
+    def delete_multi(self, keys):
+        """Delete keys"""
+        from .models import OutputEntity
+
+        OutputEntity.objects.filter(
+            partition__in={_get_partition(key) for key in keys}, path__in=[_encode_path(key) for key in keys]
+        ).delete()
+
+    def query(self, kind=None, ancestor=None, **kwargs):
+        """Proxy to :class:`PostgresQuery`"""
+        return PostgresQuery(self, kind=kind, ancestor=ancestor)
+
+    @staticmethod
+    def transaction(**kwargs):
+        """Writes are atomic through the Django transaction"""
+        return transaction.atomic()
+
+    @staticmethod
+    def batch():
+        """Writes are atomic through the Django transaction"""
+        return transaction.atomic()
@@ -0,0 +1,66 @@
+from datetime import datetime
+
+import pytz
+
+from ery_backend.base.testcases import EryTestCase
+
+from ..factories import RunEntityFactory, WriteEntityFactory, TeamEntityFactory, HandEntityFactory
+from ..models import OutputEntity
+from ..postgres_client import PostgresDatastoreClient
+
+
+class TestPostgresDatastoreClient(EryTestCase):
+    """
+    The PostgresDatastoreClient stores and retrieves datastore entities.
+    """
+
+    def setUp(self):
+        self.client = PostgresDatastoreClient()
+        self.run = RunEntityFactory()
+        self.write = WriteEntityFactory(parent=self.run.key)
+        self.team = TeamEntityFactory(parent=self.write.key)
+        self.hands = [HandEntityFactory(parent=self.write.key, pk=pk) for pk in range(1, 4)]
+
+    def test_put_and_get(self):
+        """Entities, including datetime values, survive the round trip"""
+        self.client.put_multi([self.run, self.write, self.team] + self.hands)
+
+        run = self.client.get(self.run.key)
+        self.assertEqual(run.key.flat_path, self.run.key.flat_path)
+        self.assertEqual(dict(run), dict(self.run))
+        self.assertIsInstance(run["started"], datetime)
+
+        write = self.client.get(self.write.key)
+        self.assertEqual(write["pk"], self.write["pk"])
+        self.assertEqual(write["variables"], self.write["variables"])
+
+        self.assertIsNone(self.client.get(self.client.key("Run", -1)))
+
+    def test_put_replaces(self):
+        """A put of an existing key replaces its row"""
+        self.client.put(self.run)
+        self.run["ended"] = datetime.now(pytz.UTC)
+        self.client.put(self.run)
+
+        self.assertEqual(OutputEntity.objects.filter(kind="Run").count(), 1)
+        self.assertEqual(self.client.get(self.run.key)["ended"], self.run["ended"])
+
+    def test_ancestor_query(self):
+        """Queries only return descendants of the given kind"""
+        other_run = RunEntityFactory()
+        other_write = WriteEntityFactory(parent=other_run.key)
+        self.client.put_multi([self.run, self.write, self.team, other_run, other_write] + self.hands)
+
+        writes = list(self.client.query(kind="Write", ancestor=self.run.key).fetch())
+        self.assertEqual([dict(write) for write in writes], [dict(self.write)])
+
+        hands = list(self.client.query(kind="Hand", ancestor=self.write.key).fetch())
+        self.assertEqual([hand["pk"] for hand in hands], [1, 2, 3])
+        self.assertEqual(len(list(self.client.query(kind="Hand", ancestor=self.run.key).fetch(limit=2))), 2)
+
+    def test_delete(self):
+        self.client.put_multi([self.run, self.write])
+        self.client.delete(self.write.key)
+
+        self.assertIsNone(self.client.get(self.write.key))
+        self.assertIsNotNone(self.client.get(self.run.key))
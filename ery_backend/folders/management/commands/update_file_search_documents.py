@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from ery_backend.folders.models import FileSearchDocument
+
+
+class Command(BaseCommand):
+    help = "Create or refresh the search documents of all files."
+
+    def handle(self, *args, **options):
+        count = 0
+        for field_name, _ in FileSearchDocument.FILE_CHOICES:
+            for obj in FileSearchDocument._meta.get_field(field_name).related_model.objects.iterator():
+                obj.update_search_document()
+                count += 1
+        self.stdout.write("{} search documents updated".format(count))
@@ -0,0 +1,137 @@
+from django.conf import settings
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+import django.contrib.postgres.search
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations, models
+from django.db.models import Count, Value
+import django.db.models.deletion
+import django.utils.timezone
+import model_utils.fields
+
+
+def create_file_search_documents(apps, schema_editor):
+    """
+    Create the documents of existing files, as kept by FileSearchDocument.update_file.
+    """
+    ContentType = apps.get_model('contenttypes', 'ContentType')
+    FileSearchDocument = apps.get_model('folders', 'FileSearchDocument')
+    FileStar = apps.get_model('comments', 'FileStar')
+    RoleAssignment = apps.get_model('roles', 'RoleAssignment')
+    User = apps.get_model(settings.AUTH_USER_MODEL)
+
+    documents = []
+    for field_name, _ in FileSearchDocument._meta.get_field('reference_type').choices:
+        model_cls = FileSearchDocument._meta.get_field(field_name).related_model
+        content_type = ContentType.objects.filter(
+            app_label=model_cls._meta.app_label, model=model_cls._meta.model_name
+        ).first()
+        owner_ids = {}
+        if content_type:
+            # First owner of each file, as in get_owner
+            owner_assignments = RoleAssignment.objects.filter(
+                role__name='owner', content_type=content_type, user__isnull=False
+            ).order_by('-created')
+            owner_ids = dict(owner_assignments.values_list('object_id', 'user_id'))
+        popularities = dict(
+            FileStar.objects.filter(**{f'{field_name}__isnull': False})
+            .values_list(field_name)
+            .annotate(count=Count('id'))
+            .order_by()
+        )
+        for obj in model_cls.objects.prefetch_related('keywords'):
+            documents.append(
+                FileSearchDocument(
+                    reference_type=field_name,
+                    name=obj.name,
+                    comment=obj.comment or '',
+                    keywords=' '.join(keyword.name for keyword in obj.keywords.all()),
+                    owner_id=owner_ids.get(obj.id),
+                    popularity=popularities.get(obj.id, 0),
+                    state=obj.state,
+                    published=obj.published,
+                    **{field_name: obj},
+                )
+            )
+    FileSearchDocument.objects.bulk_create(documents, batch_size=2000)
+
+    # Weighted as in FileSearchDocument.update_file, in one update per owner
+    usernames = dict(User.objects.filter(id__in={document.owner_id for document in documents}).values_list('id', 'username'))
+    for owner_id in {document.owner_id for document in documents}:
+        FileSearchDocument.objects.filter(owner_id=owner_id).update(
+            document=SearchVector('name', weight='A')
+            + SearchVector('keywords', weight='B')
+            + SearchVector('comment', weight='C')
+            + SearchVector(Value(usernames.get(owner_id, '')), weight='D')
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('assets', '0002_auto_20200430_0148'),
+        ('datasets', '0002_auto_20200430_0148'),
+        ('modules', '0005_auto_20200430_0148'),
+        ('procedures', '0001_initial'),
+        ('stints', '0003_auto_20200430_0148'),
+        ('templates', '0004_auto_20200430_1609'),
+        ('themes', '0002_auto_20200430_0148'),
+        ('validators', '0002_auto_20200430_0148'),
+        ('widgets', '0002_auto_20200430_0148'),
+        ('folders', '0007_auto_20200430_0148'),
+        ('comments', '0008_auto_20200430_0148'),
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('keywords', '0002_auto_20200430_0148'),
+        ('roles', '0003_auto_20200430_0148'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.CreateModel(
+            name='FileSearchDocument',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('reference_type', models.CharField(choices=[('dataset', 'Dataset'), ('image_asset', 'Image Asset'), ('procedure', 'Procedure'), ('module_definition', 'Module Definition'), ('stint_definition', 'Stint Definition'), ('template', 'Template'), ('widget', 'Widget'), ('theme', 'Theme'), ('validator', 'Validator')], max_length=32)),
+                ('name', models.CharField(max_length=512)),
+                ('comment', models.TextField(blank=True, default='')),
+                ('keywords', models.TextField(blank=True, default='', help_text='Space separated names of keywords')),
+                ('popularity', models.PositiveIntegerField(default=0, help_text='Number of connected FileStar instances')),
+                ('state', models.CharField(choices=[('prealpha', 'Pre-alpha'), ('alpha', 'Alpha'), ('beta', 'Beta'), ('release', 'Release'), ('archived', 'Archived'), ('deleted', 'Deleted')], default='prealpha', max_length=18)),
+                ('published', models.BooleanField(default=False)),
+                ('document', django.contrib.postgres.search.SearchVectorField(null=True)),
+                ('dataset', models.ForeignKey(blank=True, help_text=':class:`~ery_backend.users.models.User` uploaded :class:`~ery_backend.datasets.models.Dataset`', null=True, on_delete=django.db.models.deletion.CASCADE, to='datasets.Dataset')),
+                ('image_asset', models.ForeignKey(blank=True, help_text=':class:`~ery_backend.users.models.User` uploaded image.', null=True, on_delete=django.db.models.deletion.CASCADE, to='assets.ImageAsset')),
+                ('module_definition', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='modules.ModuleDefinition')),
+                ('owner', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('procedure', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='procedures.Procedure')),
+                ('stint_definition', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='stints.StintDefinition')),
+                ('template', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='templates.Template')),
+                ('theme', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='themes.Theme')),
+                ('validator', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='validators.Validator')),
+                ('widget', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='widgets.Widget')),
+            ],
+            options={
+                'ordering': ('created',),
+                'abstract': False,
+            },
+        ),
+        migrations.AddIndex(
+            model_name='filesearchdocument',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['document'], name='folders_fil_documen_d49b4d_gin'),
+        ),
+        # Trigram indexes back substring matches on name: contains (LIKE) and icontains (UPPER(...) LIKE UPPER(...)).
+        # Kept out of the model's Meta, as they depend on the pg_trgm extension.
+        migrations.RunSQL(
+            'CREATE INDEX folders_filesearchdocument_name_trgm ON folders_filesearchdocument USING gin (name gin_trgm_ops);',
+            'DROP INDEX folders_filesearchdocument_name_trgm;',
+        ),
+        migrations.RunSQL(
+            'CREATE INDEX folders_filesearchdocument_upper_name_trgm ON folders_filesearchdocument '
+            'USING gin (UPPER(name) gin_trgm_ops);',
+            'DROP INDEX folders_filesearchdocument_upper_name_trgm;',
+        ),
+        migrations.RunPython(create_file_search_documents, migrations.RunPython.noop),
+    ]
@@ -1,18 +1,14 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector, SearchVectorField
 from django.db import models
+from django.db.models import F, Q, Value
+from django.db.models.functions import Greatest
 
 from model_utils import Choices
 
-from ery_backend.assets.models import ImageAsset
-from ery_backend.base.cache import ery_cache
-from ery_backend.base.mixins import PrivilegedMixin
+from ery_backend.base.mixins import PrivilegedMixin, StateMixin
 from ery_backend.base.models import EryNamedPrivileged, EryFileReference
-from ery_backend.procedures.models import Procedure
-from ery_backend.modules.models import ModuleDefinition
-from ery_backend.stints.models import StintDefinition
-from ery_backend.templates.models import Template
-from ery_backend.themes.models import Theme
-from ery_backend.validators.models import Validator
-from ery_backend.widgets.models import Widget
+from ery_backend.comments.models import FileStar
 
 
 class Folder(EryNamedPrivileged):
@@ -20,22 +16,24 @@ class Folder(EryNamedPrivileged):
     Emulates a standard directory. Responsible for holding :class:`Link` objects.
     """
 
-    @ery_cache(timeout=3)
-    def query_files(self, user):  # pylint: disable=no-self-use
+    def query_files(self, user, order_by='name', offset=0, limit=None):  # pylint: disable=no-self-use
         """
         Return subset of :class:`~ery_backend.base.models.EryFileReference` instances belonging to current
         instance.
 
+        Args:
+            - user (:class:`~ery_backend.users.models.User`)
+            - order_by (str): One of :attr:`FileSearchDocument.FILE_ORDERINGS`.
+            - offset (int)
+            - limit (Optional[int])
+
+        Notes:
+            - See :meth:`FileSearchDocument.query_files`.
+
         Returns:
             List[Dict[`~ery_backend.base.models.EryModel`: Dict[str: Union[:class:`User`, :class:`EryModel`, str]]]]
         """
-        file_models = [StintDefinition, ModuleDefinition, Template, Theme, Procedure, Widget, ImageAsset, Validator]
-        objs = []
-
-        for model in file_models:
-            objs += list(model.objects.filter_privilege('read', user).add_popularity().all())
-
-        return [{obj.get_field_name(): obj, 'owner': obj.get_owner(), 'popularity': obj.popularity} for obj in objs]
+        return FileSearchDocument.query_files(user, order_by, offset, limit)
 
 
 class Link(EryFileReference, PrivilegedMixin):
@@ -85,3 +83,198 @@ class Link(EryFileReference, PrivilegedMixin):
                 f"Can not link {self.FILE_AND_FOLDER_CHOICES[self.reference_type]} '{self.get_obj().name}'"
                 f"to Folder {self.parent_folder}: Link already exists."
             )
+
+
+class FileSearchDocument(EryFileReference):
+    """
+    Denormalized, searchable representation of an :class:`~ery_backend.base.models.EryFile`.
+
+    Attributes:
+        - document: Weighted tsvector of name (A), keywords (B), comment (C) and owner username (D).
+
+    Notes:
+        - Kept current by :meth:`~ery_backend.base.models.EryFile.update_search_document`, which runs on save of
+          the file and on changes of its keywords and ownership. Popularity is a counter, incremented on star and
+          decremented on unstar.
+        - Besides the GIN index on document, name carries pg_trgm indexes (see migration), backing substring
+          matches on name.
+    """
+
+    class Meta(EryFileReference.Meta):
+        indexes = [GinIndex(fields=['document'])]
+
+    # File types listed in folders and libraries
+    LISTED_FILE_TYPES = (
+        'stint_definition',
+        'module_definition',
+        'template',
+        'theme',
+        'procedure',
+        'widget',
+        'image_asset',
+        'validator',
+    )
+    FILE_ORDERINGS = ('name', '-name', 'popularity', '-popularity', 'created', '-created', 'modified', '-modified')
+
+    name = models.CharField(max_length=512)
+    comment = models.TextField(blank=True, default='')
+    keywords = models.TextField(blank=True, default='', help_text="Space separated names of keywords")
+    owner = models.ForeignKey('users.User', on_delete=models.SET_NULL, null=True, blank=True, related_name='+')
+    popularity = models.PositiveIntegerField(default=0, help_text="Number of connected FileStar instances")
+    state = models.CharField(max_length=18, choices=StateMixin.STATE_CHOICES, default=StateMixin.STATE_CHOICES.prealpha)
+    published = models.BooleanField(default=False)
+    document = SearchVectorField(null=True)
+
+    @classmethod
+    def update_file(cls, obj):
+        """
+        Create or refresh the document of an :class:`~ery_backend.base.models.EryFile`.
+
+        Args:
+            - obj (:class:`~ery_backend.base.models.EryFile`)
+
+        Returns:
+            :class:`FileSearchDocument`
+        """
+        field_name = obj.get_field_name()
+        owner = obj.get_owner()
+        keywords = ' '.join(obj.keywords.values_list('name', flat=True))
+        document = (
+            SearchVector(Value(obj.name), weight='A')
+            + SearchVector(Value(keywords), weight='B')
+            + SearchVector(Value(obj.comment or ''), weight='C')
+            + SearchVector(Value(owner.username if owner else ''), weight='D')
+        )
+        search_document, _ = cls.objects.update_or_create(
+            reference_type=field_name,
+            **{field_name: obj},
+            defaults={
+                'name': obj.name,
+                'comment': obj.comment or '',
+                'keywords': keywords,
+                'owner': owner,
+                'popularity': FileStar.objects.filter(**{field_name: obj}).count(),
+                'state': obj.state,
+                'published': obj.published,
+            },
+        )
+        # Expressions can not be passed to save, hence the separate update
+        cls.objects.filter(id=search_document.id).update(document=document)
+        return search_document
+
+    @classmethod
+    def update_popularity(cls, field_name, file_id, change):
+        """
+        Apply a change in the number of stars to the document of an :class:`~ery_backend.base.models.EryFile`.
+
+        Args:
+            - field_name (str): Member of :attr:`FILE_CHOICES`.
+            - file_id (int)
+            - change (int): 1 on star, -1 on unstar.
+        """
+        cls.objects.filter(**{f'{field_name}_id': file_id}).update(popularity=Greatest(F('popularity') + change, 0))
+
+    @classmethod
+    def filter_readable(cls, user):
+        """
+        Get documents of files readable by user.
+
+        Args:
+            - user (:class:`~ery_backend.users.models.User`)
+
+        Notes:
+            - Deleted files are excluded. Published files are readable by any user.
+
+        Returns:
+            :class:`django.db.models.query.QuerySet`
+        """
+        from ery_backend.roles.utils import get_privileged_ids
+
+        readable = Q(published=True)
+        for field_name, _ in cls.FILE_CHOICES:
+            model_cls = cls._meta.get_field(field_name).related_model
+            readable |= Q(**{f'{field_name}__in': get_privileged_ids(model_cls, 'read', user)})
+        return cls.objects.filter(readable).exclude(state=StateMixin.STATE_CHOICES.deleted)
+
+    @classmethod
+    def query_files(cls, user, order_by='name', offset=0, limit=None):
+        """
+        List files readable by user, with their owner and popularity.
+
+        Args:
+            - user (:class:`~ery_backend.users.models.User`)
+            - order_by (str): One of :attr:`FILE_ORDERINGS`.
+            - offset (int)
+            - limit (Optional[int])
+
+        Notes:
+            - Sorted and paginated by the database, and resolved in one query, joining files and owners.
+
+        Raises:
+            - :class:`ValueError`: Raised on an order_by not in :attr:`FILE_ORDERINGS`.
+
+        Returns:
+            List[Dict[str, Union[:class:`~ery_backend.base.models.EryFile`, :class:`~ery_backend.users.models.User`, int]]]
+        """
+        if order_by not in cls.FILE_ORDERINGS:
+            raise ValueError(f"Invalid ordering: {order_by}. Options are: {', '.join(cls.FILE_ORDERINGS)}")
+
+        documents = (
+            cls.filter_readable(user)
+            .filter(reference_type__in=cls.LISTED_FILE_TYPES)
+            .select_related('owner', *cls.LISTED_FILE_TYPES)
+            .order_by(order_by, 'id')
+        )
+        documents = documents[offset : offset + limit] if limit is not None else documents[offset:]
+        return [document.get_file_entry() for document in documents]
+
+    def get_file_entry(self):
+        """
+        Represent current instance by its file, owner and popularity.
+
+        Returns:
+            Dict[str, Union[:class:`~ery_backend.base.models.EryFile`, :class:`~ery_backend.users.models.User`, int]]
+        """
+        return {self.reference_type: self.get_obj(), 'owner': self.owner, 'popularity': self.popularity}
+
+    @classmethod
+    def search(cls, text, user):
+        """
+        Rank documents of files readable by user against text.
+
+        Args:
+            - text (str): Matched against the document as a full text query, and against name as a substring.
+            - user (:class:`~ery_backend.users.models.User`)
+
+        Notes:
+            - Deleted files are excluded. Published files are readable by any user.
+
+        Returns:
+            :class:`django.db.models.query.QuerySet`
+        """
+        query = SearchQuery(text)
+        return (
+            cls.filter_readable(user)
+            .filter(Q(document=query) | Q(name__icontains=text))
+            .annotate(rank=SearchRank(F('document'), query))
+            .order_by(F('rank').desc(nulls_last=True), '-popularity', 'name')
+        )
+
+
+def file_star_handler(sender, instance, **kwargs):
+    """
+    Count a created or deleted :class:`~ery_backend.comments.models.FileStar` in the popularity of the
+    :class:`FileSearchDocument` of its file.
+    """
+    if kwargs.get('created') is False:
+        return
+    change = 1 if kwargs.get('created') else -1
+    FileSearchDocument.update_popularity(instance.reference_type, getattr(instance, f'{instance.reference_type}_id'), change)
+
+
+def file_keywords_handler(sender, instance, action, **kwargs):
+    """
+    Refresh the :class:`FileSearchDocument` of an :class:`~ery_backend.base.models.EryFile` whose keywords changed.
+    """
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        instance.update_search_document()
@@ -8,11 +8,11 @@ from ery_backend.roles.schema import RoleAssignmentNodeMixin
 from ery_backend.base.mixins import StateMixin
 from ery_backend.base.serializers import EryXMLRenderer
 from ery_backend.base.schema import PrivilegedNodeMixin
-from ery_backend.base.schema_utils import EryObjectType, EryFilterConnectionField
+from ery_backend.base.schema_utils import EryObjectType, EryFilterConnectionField, get_total_count
 from ery_backend.comments.schema import FileCommentNode, FileStarNode
 from ery_backend.users.utils import authenticated_user
 
-from .models import Folder, Link
+from .models import FileSearchDocument, Folder, Link
 
 
 class CountableConnectionBase(relay.Connection):
@@ -22,7 +22,7 @@ class CountableConnectionBase(relay.Connection):
     total_count = graphene.Int()
 
     def resolve_total_count(self, info, **kwargs):
-        return self.iterable.count()
+        return get_total_count(self.iterable)
 
 
 class LinkFilter(django_filters.FilterSet):
@@ -69,7 +69,12 @@ class LinkFilter(django_filters.FilterSet):
 
     @classmethod
     def filter_name(cls, queryset, name, value):
-        return queryset.filter(cls._make_or_condition('name', value, 'contains'))
+        # Matched against trigram indexed names of search documents, rather than a join per file model
+        documents = FileSearchDocument.objects.filter(name__contains=value)
+        condition = Q()
+        for filter_attr in cls.filter_model_attrs:
+            condition |= Q(**{f'{filter_attr}__in': documents.filter(reference_type=filter_attr).values(filter_attr)})
+        return queryset.filter(condition)
 
     @classmethod
     def filter_modified_before(cls, queryset, name, value):
@@ -184,11 +189,34 @@ class FolderNode(RoleAssignmentNodeMixin, EryObjectType):
     class Meta:
         model = Folder
 
-    files = graphene.List(EryFileNode)
+    files = graphene.List(
+        EryFileNode,
+        order_by=graphene.String(default_value='name'),
+        offset=graphene.Int(default_value=0),
+        limit=graphene.Int(),
+    )
+
+    def resolve_files(self, info, order_by, offset, limit=None):
+        user = authenticated_user(info.context)
+        return [EryFileNode(**entry) for entry in self.query_files(user, order_by, offset, limit)]
+
+
+class FileSearchQuery:
+    search_files = graphene.List(
+        EryFileNode,
+        text=graphene.String(required=True),
+        offset=graphene.Int(default_value=0),
+        limit=graphene.Int(default_value=20),
+    )
 
-    def resolve_files(self, info):
+    def resolve_search_files(self, info, text, offset, limit):
         user = authenticated_user(info.context)
-        return [EryFileNode(**entry) for entry in self.query_files(user)]
+        documents = (
+            FileSearchDocument.search(text, user)
+            .select_related('owner', *(field_name for field_name, _ in FileSearchDocument.FILE_CHOICES))
+            .all()[offset : offset + limit]
+        )
+        return [EryFileNode(**document.get_file_entry()) for document in documents]
 
 
 FolderEdge = FolderNode._meta.connection.Edge
@@ -2,6 +2,8 @@ from unittest import mock
 
 import datetime as dt
 import pytz
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 import graphene
 from graphene.utils.str_converters import to_camel_case
 
@@ -110,6 +112,32 @@ class TestReadFolder(GQLTestCase):
         self.fail_on_errors(result)
         self.assertEqual(len(result["data"]["allFolders"]["edges"]), 1)
 
+    def test_read_links_query_count(self):
+        """Queries of links of allFolders do not grow with the number of folders"""
+        query = """{allFolders{ edges{ node{ id links{ edges{ node{ id referenceType }}}}}}}"""
+
+        def add_folders(n):
+            for _ in range(n):
+                folder = FolderFactory()
+                grant_role(self.viewer["role"], folder, self.viewer["user"])
+                for _ in range(2):
+                    LinkFactory(parent_folder=folder, stint_definition=StintDefinitionFactory())
+
+        def execute():
+            with CaptureQueriesContext(connection) as queries:
+                result = self.gql_client.execute(query, context_value=self.gql_client.get_context(user=self.viewer["user"]))
+            self.fail_on_errors(result)
+            return result, len(queries.captured_queries)
+
+        add_folders(2)
+        _, few_query_count = execute()
+        add_folders(5)
+        result, many_query_count = execute()
+        self.assertEqual(len(result["data"]["allFolders"]["edges"]), 7)
+        for edge in result["data"]["allFolders"]["edges"]:
+            self.assertEqual(len(edge["node"]["links"]["edges"]), 2)
+        self.assertEqual(many_query_count, few_query_count)
+
 
 class TestQueryFiles(GQLTestCase):
     node_name = "FolderNode"
@@ -2,6 +2,8 @@ from unittest import mock
 
 from ery_backend.assets.factories import ImageAssetFactory
 from ery_backend.base.testcases import EryTestCase
+from ery_backend.comments.factories import FileStarFactory
+from ery_backend.keywords.factories import KeywordFactory
 from ery_backend.modules.factories import ModuleDefinitionFactory
 from ery_backend.procedures.factories import ProcedureFactory
 from ery_backend.roles.models import Role
@@ -14,6 +16,7 @@ from ery_backend.validators.factories import ValidatorFactory
 from ery_backend.widgets.factories import WidgetFactory
 
 from ..factories import FolderFactory, LinkFactory
+from ..models import FileSearchDocument
 
 model_map = {
     StintDefinitionFactory: 'stint_definition',
@@ -77,6 +80,24 @@ class TestFolder(EryTestCase):
             self.assertIsNotNone(match)
             self.assertEqual(fileobjs[match]['owner'], self.user)
 
+    def test_query_files_ordering(self):
+        """Files are sorted by popularity and paginated in one query"""
+        module_definitions = [ModuleDefinitionFactory(name=f'ModuleDefinition{i}') for i in range(3)]
+        for stars, module_definition in enumerate(module_definitions):
+            grant_role(self.owner, module_definition, self.user)
+            for _ in range(stars):
+                FileStarFactory(module_definition=module_definition)
+        self.folder.query_files(self.user)
+
+        with self.assertNumQueries(1):
+            fileobjs = self.folder.query_files(self.user, order_by='-popularity', offset=1, limit=2)
+        self.assertEqual([fileobj['module_definition'] for fileobj in fileobjs], module_definitions[1::-1])
+        self.assertEqual([fileobj['popularity'] for fileobj in fileobjs], [1, 0])
+        self.assertEqual(fileobjs[0]['owner'], self.user)
+
+        with self.assertRaises(ValueError):
+            self.folder.query_files(self.user, order_by='owner')
+
 
 class TestLink(EryTestCase):
     @mock.patch('ery_backend.assets.models.ImageAsset.bucket')
@@ -135,3 +156,48 @@ class TestLink(EryTestCase):
                 module_definition=self.module_definition,
                 reference_type='stint_definition',
             )
+
+
+class TestFileSearchDocument(EryTestCase):
+    def setUp(self):
+        self.user = UserFactory(username='searchowner')
+        self.module_definition = ModuleDefinitionFactory(name='PublicGoods', comment='An economics game')
+        grant_role(Role.objects.get(name='owner'), self.module_definition, self.user)
+
+    def test_kept_current(self):
+        """Saves, keywords, ownership and stars are reflected by the document"""
+        keyword = KeywordFactory(name='cooperation')
+        self.module_definition.keywords.add(keyword)
+        FileStarFactory(module_definition=self.module_definition)
+        star = FileStarFactory(module_definition=self.module_definition)
+        self.module_definition.name = 'PrisonersDilemma'
+        self.module_definition.save()
+
+        document = FileSearchDocument.objects.get(module_definition=self.module_definition)
+        self.assertEqual(document.reference_type, 'module_definition')
+        self.assertEqual(document.name, 'PrisonersDilemma')
+        self.assertEqual(document.keywords, 'cooperation')
+        self.assertEqual(document.owner, self.user)
+        self.assertEqual(document.popularity, 2)
+
+        star.delete()
+        document.refresh_from_db()
+        self.assertEqual(document.popularity, 1)
+
+    def test_search(self):
+        """Readable files are found by words of their document or by parts of their name"""
+        other_user = UserFactory()
+        self.module_definition.keywords.add(KeywordFactory(name='cooperation'))
+        self.assertEqual(
+            [document.module_definition for document in FileSearchDocument.search('cooperation', self.user)],
+            [self.module_definition],
+        )
+        self.assertEqual(FileSearchDocument.search('licGo', self.user).count(), 1)
+        self.assertFalse(FileSearchDocument.search('cooperation', other_user).exists())
+
+        self.module_definition.published = True
+        self.module_definition.save()
+        self.assertTrue(FileSearchDocument.search('economics', other_user).exists())
+
+        self.module_definition.soft_delete()
+        self.assertFalse(FileSearchDocument.search('economics', self.user).exists())
@@ -53,17 +53,28 @@ class Form(SluggedMixin, ReactNamedMixin, ModuleDefinitionNamedModel):
             - hand (:class:`~ery_backend.hands.models.Hand`)
             - form_data (Dict[str, Union[str, int, float, List, Dict]]]):
               :class:`FormField` name, value.
+
+        Returns:
+            List[:class:`~ery_backend.variables.models.VariableMixin`]: Changed variables.
         """
-        socket_message_args = []
+        from ery_backend.variables.batches import VariableBatch
+
         if not isinstance(form_data, dict):
             raise TypeError("form_data must be a dictionary")
-        for full_field_name, value in form_data.items():
-            field_name = full_field_name.split('-')[-1]
-            variable_definition = self.items.get(field__name=field_name).field.variable_definition
-            variable, changed = hand.stint.set_variable(variable_definition, value, hand=hand)
-            if changed:
-                socket_message_args.append(variable)
-        return socket_message_args
+        values = [(full_field_name.split('-')[-1], value) for full_field_name, value in form_data.items()]
+        fields = {
+            field.name: field
+            for field in FormField.objects.filter(
+                form_item__form=self, name__in=[field_name for field_name, _ in values]
+            ).select_related('variable_definition')
+        }
+
+        batch = VariableBatch(hand.stint, hand=hand)
+        for field_name, value in values:
+            if field_name not in fields:
+                raise FormItem.DoesNotExist(f"FormItem with field: {field_name}, does not exist for form: {self}")
+            batch.set(fields[field_name].variable_definition, value)
+        return batch.flush()
 
 
 class FormItem(EryPrivileged):
@@ -1,17 +1,53 @@
 from abc import ABC
+from concurrent.futures import ThreadPoolExecutor
 import json
 
+from django.conf import settings
+from django.db import connections
+from django.db.models import Prefetch, prefetch_related_objects
 from django.template.loader import render_to_string
 
-from ery_backend.frontends.models import Frontend
+from ery_backend.base.registry import get_frontend
 from ery_backend.scripts.babel_client import convert_es6_bundle
 
 
+def _render_file(template_name, context):
+    try:
+        return render_to_string(template_name, context=context)
+    finally:
+        # Connections are per thread, and those of pool threads are not reused
+        connections.close_all()
+
+
 class ReactRenderer(ABC):
-    def __init__(self, language):
-        self.frontend = Frontend.objects.get(name='Web')
+    template_name = None
+
+    def __init__(self, language, frontend=None):
+        self.frontend = frontend or get_frontend('Web')
         self.language = language
 
+    def get_context(self, is_preview=False):
+        """
+        Args:
+            - is_preview(Optional[bool]): Whether to render as standalone component.
+
+        Returns:
+            Dict[str, Any]: Context of :attr:`template_name`.
+        """
+        raise NotImplementedError
+
+    def render(self, is_preview=False):
+        """
+        Generate an ES5 based view with definitions needed to display the given instance.
+
+        Args:
+            - is_preview(Optional[bool]): Whether to render as standalone component.
+
+        Returns:
+            str: ES5 code.
+        """
+        return render_to_string(self.template_name, context=self.get_context(is_preview))
+
     @staticmethod
     def _get_file_name(file_instance):
         """Use unique slugs instead of non-unique names"""
@@ -38,104 +74,61 @@ class ReactRenderer(ABC):
 
 
 class ReactModuleWidgetRenderer(ReactRenderer):
-    def __init__(self, module_widget, language):
-        self.module_widget = module_widget
-        super().__init__(language)
+    template_name = "ModuleWidget.js"
 
-    def render(self, is_preview=False):
-        """
-        Generate an ES5 based view with definitions needed to display the given instance.
-
-        Args:
-            - is_preview(Optional[bool]): Whether to render as standalone component.
+    def __init__(self, module_widget, language, frontend=None):
+        self.module_widget = module_widget
+        super().__init__(language, frontend)
 
-        Returns:
-            str: ES5 code.
-        """
-        require_communicate = self.module_widget.events.exists()
+    def get_context(self, is_preview=False):
         choices = json.dumps(self.module_widget.get_choices(self.language)) if self.module_widget.is_multiple_choice else None
 
-        return render_to_string(
-            "ModuleWidget.js",
-            context={
-                "choices": choices,
-                "module_widget": self.module_widget,
-                "require_communicate": require_communicate,
-                "validators": [
-                    (validation.validator, validation.get_error_message(self.language))
-                    for validation in self.module_widget.validations.all()
-                ],
-            },
-        )
+        return {
+            "choices": choices,
+            "module_widget": self.module_widget,
+            "require_communicate": bool(self.module_widget.events.all()),
+            "validators": [
+                (validation.validator, validation.get_error_message(self.language))
+                for validation in self.module_widget.validations.all()
+            ],
+        }
 
 
 class ReactTemplateWidgetRenderer(ReactRenderer):
-    def __init__(self, template_widget, language):
-        self.template_widget = template_widget
-        super().__init__(language)
-
-    def render(self, is_preview=False):
-        """
-        Generate an ES5 based view with definitions needed to display the given instance.
+    template_name = "TemplateWidget.js"
 
-        Args:
-            - is_preview(Optional[bool]): Whether to render as standalone component.
+    def __init__(self, template_widget, language, frontend=None):
+        self.template_widget = template_widget
+        super().__init__(language, frontend)
 
-        Returns:
-            str: ES5 code.
-        """
-        return render_to_string(
-            "TemplateWidget.js", context={"template_widget": self.template_widget, "is_preview": is_preview,}
-        )
+    def get_context(self, is_preview=False):
+        return {"template_widget": self.template_widget, "is_preview": is_preview}
 
 
 class ReactWidgetRenderer(ReactRenderer):
-    def __init__(self, widget, language):
-        self.widget = widget
-        super().__init__(language)
+    template_name = "Widget.js"
 
-    def render(self, is_preview=False):
-        """
-        Generate an ES5 based view with definitions needed to display the given instance.
-
-        Args:
-            - is_preview(Optional[bool]): Whether to render as standalone component.
-
-        Returns:
-            str: ES5 code.
-        """
-        from ery_backend.widgets.models import WidgetEventStep
+    def __init__(self, widget, language, frontend=None):
+        self.widget = widget
+        super().__init__(language, frontend)
 
-        return render_to_string(
-            "Widget.js",
-            context={
-                "widget": self.widget,
-                "dependencies": self.widget.connections.select_related('target').all(),
-                "require_communicate": (
-                    self.widget.events.filter(
-                        steps__event_action_type__in=WidgetEventStep.REQUIRE_COMMUNCIATE_ACTION_TYPES
-                    ).exists()
-                ),
-                "is_preview": is_preview,
-            },
-        )
+    def get_context(self, is_preview=False):
+        return {
+            "widget": self.widget,
+            "dependencies": self.widget.connections.all(),
+            "require_communicate": self.widget.requires_communicate(),
+            "is_preview": is_preview,
+        }
 
 
 class ReactFormRenderer(ReactRenderer):
-    def __init__(self, form, language):
-        self.form = form
-        super().__init__(language)
+    template_name = "Form.js"
 
-    def render(self, is_preview=False):
-        """
-        Generate an ES5 based view with definitions needed to display the given instance.
-
-        Args:
-            - is_preview(Optional[bool]): Whether to render as standalone component.
+    def __init__(self, form, language, frontend=None):
+        self.form = form
+        super().__init__(language, frontend)
 
-        Returns:
-            str: ES5 code.
-        """
+    def get_context(self, is_preview=False):
         template_widgets = set()
         form_field_items = self.form.items.exclude(field=None).all()
         form_widgets = {item.field.widget for item in form_field_items}
@@ -144,25 +137,22 @@ class ReactFormRenderer(ReactRenderer):
             for button in item.button_list.buttons.all():
                 form_widgets.add(button.widget)
 
-        return render_to_string(
-            "Form.js",
-            context={
-                "form": self.form,
-                "form_widgets": form_widgets,
-                "module_definition": self.form.module_definition,
-                "module_widgets": module_widgets,
-                "template_widgets": template_widgets,
-                "validations": [],
-                "is_preview": is_preview,
-                "language": self.language,
-            },
-        )
+        return {
+            "form": self.form,
+            "form_widgets": form_widgets,
+            "module_definition": self.form.module_definition,
+            "module_widgets": module_widgets,
+            "template_widgets": template_widgets,
+            "validations": [],
+            "is_preview": is_preview,
+            "language": self.language,
+        }
 
 
 class ReactTemplateRenderer(ReactRenderer):
-    def __init__(self, template, language):
+    def __init__(self, template, language, frontend=None):
         self.template = template
-        super().__init__(language)
+        super().__init__(language, frontend)
 
     def render(self):
         template_widget_names = set()
@@ -181,97 +171,195 @@ class ReactTemplateRenderer(ReactRenderer):
 
 
 class ReactStageRenderer(ReactRenderer):
-    def __init__(self, stage_template, language):
-        self.stage_template = stage_template
-        super().__init__(language)
+    template_name = "Stage.js"
 
-    def render(self, is_preview=False):
-        """
-        Generate an ES5 based view with definitions needed to display the given instance.
+    def __init__(self, stage_template, language, frontend=None):
+        self.stage_template = stage_template
+        super().__init__(language, frontend)
 
-        Args:
-            - is_preview(Optional[bool]): Whether to render as standalone component.
-        Returns:
-            str: ES5 code.
-        """
+    def get_context(self, is_preview=False):
         module_definition = self.stage_template.stage_definition.module_definition
         # XXX: Not sure how we'll allocate team name without hand
-        variables = list(module_definition.variabledefinition_set.values_list('name', flat=True))
+        variables = [variable_definition.name for variable_definition in module_definition.variabledefinition_set.all()]
         theme = self.stage_template.theme or module_definition.default_theme
 
         template = self.stage_template.template or module_definition.default_template
 
-        return render_to_string(
-            "Stage.js",
-            context={
-                "blocks": self.stage_template.get_blocks(self.frontend, self.language),
-                "forms": module_definition.forms.all(),
-                "is_preview": is_preview,
-                "module_definition": module_definition,
-                "module_widgets": module_definition.module_widgets.all(),
-                "root_block_name": self.stage_template.get_root_block().name,
-                "stage_definition": self.stage_template.stage_definition,
-                "template_widgets": template.template_widgets.all(),
-                "theme": theme.get_mui_theme(),
-                "variables": variables,
-            },
-        )
+        return {
+            "blocks": self.stage_template.get_blocks(self.frontend, self.language),
+            "forms": module_definition.forms.all(),
+            "is_preview": is_preview,
+            "module_definition": module_definition,
+            "module_widgets": module_definition.module_widgets.all(),
+            "root_block_name": self.stage_template.get_root_block().name,
+            "stage_definition": self.stage_template.stage_definition,
+            "template_widgets": template.template_widgets.all(),
+            "theme": theme.get_mui_theme(),
+            "variables": variables,
+        }
 
 
 class ReactStintRenderer(ReactRenderer):
+    """
+    Notes:
+        - Everything needed by the bundle of a :class:`~ery_backend.stints.models.StintDefinition` is fetched upfront,
+          in a number of queries independent of its size (bar the blocks of each stage, see
+          :meth:`~ery_backend.base.mixins.BlockHolderMixin.get_block_catalog`).
+        - Contexts are then built serially, after which the files of widgets, module widgets, template widgets, modules
+          and stages are rendered on a pool of ERY_RENDER_WORKERS threads. Their contexts are fully prefetched, such that
+          pool threads do not query the database.
+    """
+
     def __init__(self, stint_definition, language, vendor=None, is_marketplace=False):
         self.stint_definition = stint_definition
         self.vendor = vendor
         self.is_marketplace = is_marketplace
         super().__init__(language)
 
-    def render_module_widget_files(self, module_widgets):
+    def get_module_definitions(self):
+        return self.stint_definition.module_definitions.prefetch_related('stage_definitions')
+
+    def get_forms(self):
+        from ery_backend.forms.models import Form
+
+        return Form.objects.filter(
+            id__in=self.stint_definition.module_definitions.values_list('forms__id', flat=True)
+        ).select_related('module_definition')
+
+    def get_stage_definitions(self):
+        from ery_backend.stages.models import StageDefinition, StageTemplate
+
+        stage_definition_ids = self.stint_definition.module_definitions.values_list('stage_definitions__id', flat=True)
+        stage_templates = StageTemplate.objects.filter(template__frontend=self.frontend).select_related('template', 'theme')
+        return (
+            StageDefinition.objects.filter(id__in=stage_definition_ids)
+            .select_related('module_definition__default_theme', 'module_definition__default_template')
+            .prefetch_related(
+                Prefetch('stage_templates', queryset=stage_templates, to_attr='frontend_stage_templates'),
+                'frontend_stage_templates__theme__palettes',
+                'frontend_stage_templates__theme__typographies',
+                'frontend_stage_templates__template__template_widgets',
+                'module_definition__default_theme__palettes',
+                'module_definition__default_theme__typographies',
+                'module_definition__default_template__template_widgets',
+                'module_definition__variabledefinition_set',
+                'module_definition__forms',
+                'module_definition__module_widgets',
+            )
+        )
+
+    def get_widgets(self):
+        from ery_backend.widgets.models import WidgetConnection
+
+        return self.stint_definition.get_widgets(self.frontend).prefetch_related(
+            'props',
+            'states',
+            'events__steps',
+            Prefetch('connections', queryset=WidgetConnection.objects.select_related('target')),
+        )
+
+    def get_template_widgets(self):
+        return self.stint_definition.get_template_widgets(self.frontend).select_related('template', 'widget')
+
+    def get_module_widgets(self):
+        return (
+            self.stint_definition.get_module_widgets(self.frontend)
+            .select_related('module_definition', 'widget', 'variable_definition')
+            .prefetch_related(
+                'events__steps',
+                'widget__events__steps',
+                'choices__translations',
+                'variable_definition__variablechoiceitem_set__translations',
+                'validations__validator',
+            )
+        )
+
+    def get_module_widget_renderers(self, module_widgets):
         return {
-            f"ModuleWidget/"
-            f"{self._get_file_name(module_widget.module_definition)}_{module_widget.name}.js": ReactModuleWidgetRenderer(
-                module_widget, self.language
-            ).render()
+            f"ModuleWidget/{self._get_file_name(module_widget.module_definition)}_{module_widget.name}.js": (
+                ReactModuleWidgetRenderer(module_widget, self.language, self.frontend)
+            )
             for module_widget in module_widgets
         }
 
-    @classmethod
-    def render_template_widget_files(cls, template_widgets, language):
+    def get_template_widget_renderers(self, template_widgets):
         return {
-            f"TemplateWidget/"
-            f"{cls._get_file_name(template_widget.template)}_{template_widget.name}.js": ReactTemplateWidgetRenderer(
-                template_widget, language
-            ).render()
+            f"TemplateWidget/{self._get_file_name(template_widget.template)}_{template_widget.name}.js": (
+                ReactTemplateWidgetRenderer(template_widget, self.language, self.frontend)
+            )
             for template_widget in template_widgets
         }
 
-    def render_module_files(self, module_definitions):
+    def get_widget_renderers(self, widgets):
         return {
-            f"Module/{module_definition.name}.js": render_to_string(
-                "Module.js", context={"stint_definition": self.stint_definition, "module_definition": module_definition,}
-            )
-            for module_definition in module_definitions
+            f"Widget/{self._get_file_name(widget)}.js": ReactWidgetRenderer(widget, self.language, self.frontend)
+            for widget in widgets
         }
 
-    def render_stage_files(self, stage_definitions):
-        output = {}
+    def get_stage_renderers(self, stage_definitions):
+        from ery_backend.stages.models import StageTemplate
 
+        output = {}
         for stage_definition in stage_definitions:
+            if not stage_definition.frontend_stage_templates:
+                raise StageTemplate.DoesNotExist(f"No StageTemplate of {stage_definition} exists for {self.frontend}")
             filename = f"Stage/{stage_definition.module_definition.name}{stage_definition.name}.js"
-            stage_template = stage_definition.stage_templates.get(template__frontend=self.frontend)
-            output[filename] = stage_template.render_web(self.language)
-
+            output[filename] = ReactStageRenderer(stage_definition.frontend_stage_templates[0], self.language, self.frontend)
         return output
 
-    def render_widget_files(self, widgets):
-        return {f"Widget/{self._get_file_name(widget)}.js": widget.render_web(self.language) for widget in widgets}
+    @staticmethod
+    def _prefetch_block_ancestors(stage_contexts):
+        # Stage.js lists the widgets of the holders of blocks
+        ancestors_by_cls = {}
+        for context in stage_contexts:
+            for info in context['blocks'].values():
+                ancestors_by_cls.setdefault(info['ancestor'].__class__, []).append(info['ancestor'])
+        for ancestor_cls, ancestors in ancestors_by_cls.items():
+            lookups = [lookup for lookup in ('module_widgets', 'template_widgets') if hasattr(ancestor_cls, lookup)]
+            prefetch_related_objects(ancestors, *lookups)
 
     def render_form_files(self, forms):
         return {
-            f"Form/{self._get_file_name(form.module_definition)}_{form.name}.js": form.render_web(self.language)
+            f"Form/{self._get_file_name(form.module_definition)}_{form.name}.js": ReactFormRenderer(
+                form, self.language, self.frontend
+            ).render()
             for form in forms
         }
 
-    def render(self, raw=False):
+    def render_files(self, module_definitions, stage_definitions, widgets, template_widgets, module_widgets):
+        """
+        Render the files of modules, stages and widgets concurrently.
+
+        Notes:
+            - Contexts are built beforehand, in the current thread.
+
+        Returns:
+            Dict[str, str]: Content by file name.
+        """
+        stage_renderers = self.get_stage_renderers(stage_definitions)
+        renderers = {
+            **self.get_widget_renderers(widgets),
+            **self.get_template_widget_renderers(template_widgets),
+            **self.get_module_widget_renderers(module_widgets),
+            **stage_renderers,
+        }
+        contexts = {filename: (renderer.template_name, renderer.get_context()) for filename, renderer in renderers.items()}
+        self._prefetch_block_ancestors([contexts[filename][1] for filename in stage_renderers])
+        for module_definition in module_definitions:
+            contexts[f"Module/{module_definition.name}.js"] = (
+                "Module.js",
+                {"stint_definition": self.stint_definition, "module_definition": module_definition},
+            )
+
+        if settings.ERY_RENDER_WORKERS <= 1:
+            return {filename: render_to_string(*template_context) for filename, template_context in contexts.items()}
+        with ThreadPoolExecutor(max_workers=settings.ERY_RENDER_WORKERS) as executor:
+            futures = {
+                filename: executor.submit(_render_file, *template_context) for filename, template_context in contexts.items()
+            }
+            return {filename: future.result() for filename, future in futures.items()}
+
+    def render(self, raw=False):  # pylint:disable=arguments-differ
         """
         Generate an ES5 based view with definitions needed to display the given instance.
 
@@ -282,16 +370,12 @@ class ReactStintRenderer(ReactRenderer):
         Returns:
             str: Component definitions.
         """
-        from ery_backend.forms.models import Form
-        from ery_backend.stages.models import StageDefinition
-
-        module_definitions = self.stint_definition.module_definitions.all()
-        forms = Form.objects.filter(id__in=self.stint_definition.module_definitions.values_list('forms__id', flat=True))
-        stage_definition_ids = self.stint_definition.module_definitions.values_list('stage_definitions__id', flat=True)
-        stage_definitions = StageDefinition.objects.filter(id__in=stage_definition_ids).all()
-        widgets = self.stint_definition.get_widgets(self.frontend)
-        template_widgets = self.stint_definition.get_template_widgets(self.frontend).all()
-        module_widgets = self.stint_definition.get_module_widgets(self.frontend)
+        module_definitions = list(self.get_module_definitions())
+        forms = self.get_forms()
+        stage_definitions = self.get_stage_definitions()
+        widgets = self.get_widgets()
+        template_widgets = self.get_template_widgets()
+        module_widgets = self.get_module_widgets()
 
         es6_index_file = render_to_string('index.js')
         es6_app_file = render_to_string('App.js', context={"stint_definition": self.stint_definition, "initial_context": {},})
@@ -304,11 +388,7 @@ class ReactStintRenderer(ReactRenderer):
             'App.js': es6_app_file,
             'Stint.js': es6_stint_file,
             **self.render_form_files(forms),
-            **self.render_module_files(module_definitions),
-            **self.render_widget_files(widgets),
-            **self.render_template_widget_files(template_widgets, self.language),
-            **self.render_module_widget_files(module_widgets),
-            **self.render_stage_files(stage_definitions),
+            **self.render_files(module_definitions, stage_definitions, widgets, template_widgets, module_widgets),
             'LoadingPage.js': render_to_string('LoadingPage.js'),
         }
 
@@ -37,7 +37,7 @@ def get_or_create_stint(opt_in_code, user, signal_pubsub=True):
         Returns:
             :class:`~ery_backend.stints.models.Stint`
     """
-    from ery_backend.frontends.models import Frontend
+    from ery_backend.base.registry import get_frontend
 
     try:
         stint_specification = StintSpecification.objects.get(opt_in_code=opt_in_code)
@@ -51,7 +51,7 @@ def get_or_create_stint(opt_in_code, user, signal_pubsub=True):
     if hand:
         return hand.first().stint
 
-    sms = Frontend.objects.get(name='SMS')
+    sms = get_frontend('SMS')
     if stint_specification.late_arrival:
         stint = stint_specification.stints.filter(status=Stint.STATUS_CHOICES.running).first()
         if stint:
@@ -201,9 +201,9 @@ class SMSRenderer(ABC):
     parser = etree.XMLParser()
 
     def __init__(self, hand):
-        from ery_backend.frontends.models import Frontend
+        from ery_backend.base.registry import get_frontend
 
-        self.frontend = Frontend.objects.get(name='SMS')
+        self.frontend = get_frontend('SMS')
         self.hand = hand
 
     def _fill_in_element(self, element, blocks, widgets, current_block_info=None):
@@ -394,12 +394,12 @@ class SMSRenderer(ABC):
                 :class:`~ery_backend.templates.models.TemplateWidget`]]: Key is widget composite key
                 (see :py:meth:`get_widgets_from_element`) and value is corresponding widget.
         """
-        from ery_backend.frontends.models import Frontend
+        from ery_backend.base.registry import get_frontend
         from ery_backend.stages.models import StageTemplateBlock
         from ery_backend.templates.models import TemplateWidget
 
         widgets = {}
-        sms = Frontend.objects.get(name='SMS')
+        sms = get_frontend('SMS')
         blocks = self.stage_template.get_blocks(self.hand.frontend, self.hand.language)
         root_block = self.stage_template.get_root_block()
         tree = self.get_xml_tree(blocks[root_block.name]['content'], parser=self.parser, wrapper=root_block.name)
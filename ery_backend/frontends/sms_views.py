@@ -1,4 +1,4 @@
-from .models import Frontend
+from ery_backend.base.registry import get_frontend
 
 
 def render_sms(hand):
@@ -12,8 +12,8 @@ def render_sms(hand):
     Returns:
         str
     """
-    sms_frontend = Frontend.objects.get(name='SMS')
-    if not hand.frontend == sms_frontend:
+    sms_frontend = get_frontend('SMS')
+    if hand.frontend_id != sms_frontend.id:
         hand.frontend = sms_frontend
         hand.save()
     # render stage with sms frontend
@@ -1,12 +1,16 @@
 import random
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
+
 from ery_backend.base.testcases import EryTestCase, create_test_hands, create_test_stintdefinition
 from ery_backend.frontends.models import Frontend
 from ery_backend.frontends.renderers import ReactStintRenderer
 from ery_backend.hands.factories import HandFactory
+from ery_backend.modules.widget_factories import ModuleDefinitionWidgetFactory
 from ery_backend.stint_specifications.factories import StintSpecificationFactory
 from ery_backend.templates.factories import TemplateWidgetFactory, TemplateFactory
-from ery_backend.widgets.factories import WidgetFactory
+from ery_backend.widgets.factories import WidgetConnectionFactory, WidgetEventFactory, WidgetFactory, WidgetPropFactory
 
 
 file_naming_function = ReactStintRenderer._get_file_name  # pylint: disable=protected-access
@@ -135,6 +139,49 @@ class TestReactModuleRender(EryTestCase):
                 )
 
 
+class TestReactStintRender(EryTestCase):
+    def setUp(self):
+        self.hand = create_test_hands(frontend_type='Web', module_definition_n=2, stage_n=2).first()
+        self.renderer = ReactStintRenderer(
+            stint_definition=self.hand.stint.stint_specification.stint_definition,
+            is_marketplace=False,
+            language=self.hand.language,
+        )
+
+    def add_widgets(self, n):
+        module_definition = self.hand.current_module_definition
+        for _ in range(n):
+            widget = WidgetFactory(frontend=self.hand.frontend)
+            WidgetPropFactory(widget=widget)
+            WidgetEventFactory(widget=widget, include_event_steps=True)
+            WidgetConnectionFactory(originator=widget, target=WidgetFactory(frontend=self.hand.frontend))
+            ModuleDefinitionWidgetFactory(
+                module_definition=module_definition, widget=widget, variable_definition=None, random_mode='asc'
+            )
+
+    def test_concurrent_render(self):
+        """Files rendered on a pool of threads match those rendered serially"""
+        self.add_widgets(3)
+        with override_settings(ERY_RENDER_WORKERS=1):
+            serial_output = self.renderer.render(raw=True)
+        with override_settings(ERY_RENDER_WORKERS=4):
+            self.assertEqual(self.renderer.render(raw=True), serial_output)
+
+    def test_query_count(self):
+        """The number of queries does not grow with the number of widgets"""
+        self.add_widgets(1)
+        self.renderer.render(raw=True)
+        with CaptureQueriesContext(connection) as context:
+            self.renderer.render(raw=True)
+        query_count = len(context.captured_queries)
+
+        self.add_widgets(5)
+        self.renderer.render(raw=True)
+        with CaptureQueriesContext(connection) as context:
+            self.renderer.render(raw=True)
+        self.assertEqual(len(context.captured_queries), query_count)
+
+
 # XXX: Revisit in issue concerning client-side evaluation
 # class TestProcedureIntegration(EryTestCase):
 #     """
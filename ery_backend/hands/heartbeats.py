@@ -0,0 +1,87 @@
+"""
+Heartbeats:
+    Writes of :class:`~ery_backend.hands.models.Hand` last_seen are coalesced in a Redis sorted set, scored by the
+    timestamp of the most recent heartbeat of each hand, and periodically flushed to the database in one UPDATE.
+"""
+import datetime as dt
+import logging
+import time
+
+from django.core.cache import cache
+from django.db.models import Case, DateTimeField, Value, When
+from django_redis import get_redis_connection
+import pytz
+
+logger = logging.getLogger(__name__)
+
+HEARTBEAT_KEY = 'HB:hands'
+
+
+def _get_heartbeat_key():
+    # Share the cache's prefix, keeping separate deployments (and test runs) apart
+    return cache.make_key(HEARTBEAT_KEY)
+
+
+def record_heartbeat(hand_id, seen=None):
+    """
+    Buffer the last_seen of a :class:`~ery_backend.hands.models.Hand`.
+
+    Args:
+        - hand_id (int)
+        - seen (Optional[float]): Epoch timestamp. Defaults to now.
+    """
+    if seen is None:
+        seen = time.time()
+    get_redis_connection('default').zadd(_get_heartbeat_key(), {str(hand_id): seen})
+
+
+def get_buffered_last_seen(hand_ids):
+    """
+    Read buffered heartbeats not yet flushed to the database.
+
+    Args:
+        - hand_ids (List[int])
+
+    Returns:
+        Dict[int, :class:`datetime.datetime`]: last_seen by hand id, for hands with a buffered heartbeat.
+    """
+    hand_ids = list(hand_ids)
+    if not hand_ids:
+        return {}
+    pipeline = get_redis_connection('default').pipeline(transaction=False)
+    key = _get_heartbeat_key()
+    for hand_id in hand_ids:
+        pipeline.zscore(key, str(hand_id))
+    return {
+        hand_id: dt.datetime.fromtimestamp(score, pytz.UTC)
+        for hand_id, score in zip(hand_ids, pipeline.execute())
+        if score is not None
+    }
+
+
+def flush_heartbeats():
+    """
+    Apply buffered heartbeats to last_seen of their :class:`~ery_backend.hands.models.Hand` in one UPDATE.
+
+    Notes:
+        - Heartbeats are removed from the buffer only after the UPDATE, and only up to the newest flushed timestamp, so
+          that heartbeats recorded during the flush are kept for the next one.
+        - Only last_seen is written. Cache tags are not invalidated, as no cached content depends on last_seen.
+
+    Returns:
+        int: Number of flushed heartbeats.
+    """
+    from .models import Hand
+
+    redis = get_redis_connection('default')
+    key = _get_heartbeat_key()
+    heartbeats = redis.zrange(key, 0, -1, withscores=True)
+    if not heartbeats:
+        return 0
+
+    last_seen = {int(hand_id): score for hand_id, score in heartbeats}
+    whens = [When(id=hand_id, then=Value(dt.datetime.fromtimestamp(score, pytz.UTC))) for hand_id, score in last_seen.items()]
+    Hand.objects.filter(id__in=last_seen).update(last_seen=Case(*whens, output_field=DateTimeField()))
+    redis.zremrangebyscore(key, '-inf', max(last_seen.values()))
+    logger.debug("Flushed %s hand heartbeats", len(last_seen))
+    return len(last_seen)
@@ -0,0 +1,22 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from ery_backend.hands.heartbeats import flush_heartbeats
+
+
+class Command(BaseCommand):
+    help = "Write buffered hand heartbeats to last_seen, once or every --interval seconds."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--interval', type=float, default=0, help="Seconds between flushes. Flush once and exit if not specified."
+        )
+
+    def handle(self, *args, **options):
+        interval = options['interval']
+        while True:
+            self.stdout.write("{} heartbeats flushed".format(flush_heartbeats()))
+            if not interval:
+                break
+            time.sleep(interval)
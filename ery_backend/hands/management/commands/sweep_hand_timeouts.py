@@ -0,0 +1,25 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from ery_backend.hands.utils import update_timeouts
+
+
+class Command(BaseCommand):
+    help = "Time out inactive hands of running stints, once or every --interval seconds."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--interval', type=float, default=0, help="Seconds between sweeps. Sweep once and exit if not specified."
+        )
+
+    def handle(self, *args, **options):
+        interval = options['interval']
+        while True:
+            metrics = update_timeouts()
+            self.stdout.write(
+                "{timed_out} hands timed out, {cancelled_stints} stints cancelled in {duration:.3f}s".format(**metrics)
+            )
+            if not interval:
+                break
+            time.sleep(interval)
@@ -9,13 +9,14 @@ from model_utils import Choices
 import pytz
 
 from ery_backend.base.mixins import LogMixin
+from ery_backend.base.models import RuntimeModelMixin
 from ery_backend.stints.models import StintModel
 from ery_backend.stint_specifications.models import StintModuleSpecification
 
 logger = logging.getLogger(__name__)
 
 
-class Hand(LogMixin, StintModel):
+class Hand(RuntimeModelMixin, LogMixin, StintModel):
     """
     Represents the worker (:class:`~ery_backend.hands.models.User` or :class:`~ery_backend.hands.models.Robot`) participating
     in a given :class:`~ery_backend.stints.models.Stint`.
@@ -159,11 +160,12 @@ class Hand(LogMixin, StintModel):
               new :class:`~ery_backend.syncs.models.Era` shared by all :class:`Hand` instances in said group, the \
               :class:`~ery_backend.syncs.models.Era` of the larger group will also change.
         """
+        previous_era_id = self.era_id
         self.era = era
-        self.save()
+        self.save(update_fields=['era'])
         self._log_attribute_change('Era', era)
         if self.current_team is not None:
-            self.current_team.synchronize(era)
+            self.current_team.synchronize(era, hand=self, previous_era_id=previous_era_id)
 
     # XXX: Address in issue #505
     def set_status(self, status):
@@ -181,7 +183,7 @@ class Hand(LogMixin, StintModel):
         if status not in Hand.STATUS_CHOICES:
             raise ValueError(f"'{status}' is not present in STATUS_CHOICES.")
         self.status = status
-        self.save()
+        self.save(update_fields=['status'])
         if status != self.STATUS_CHOICES.active:
             # XXX: Must be reimplemented
             # self.pay()
@@ -210,12 +212,39 @@ class Hand(LogMixin, StintModel):
               start :class:`~ery_backend.stages.models.Stage` of said :class:`~ery_backend.modules.models.Module` will be
               used as a replacement.
         """
+        return self.transition(stage, stage_definition)
+
+    def transition(self, stage=None, stage_definition=None, breadcrumb=None, create_breadcrumb=False):
+        """
+        Change :class:`~ery_backend.stages.models.Stage` attribute, along with the current
+        :class:`~ery_backend.modules.models.Module` and :class:`~ery_backend.stages.models.StageBreadcrumb` it implies,
+        and log details.
+
+        Args:
+            stage_definition: (:class:~ery_backend.stages.models.StageDefinition`): Used to instantiate \
+               :class:`~ery_backend.stages.models.Stage` to be set as new attribute value.
+            stage: (:class:~ery_backend.stages.models.Stage`): New attribute value.
+            breadcrumb (Optional[:class:`~ery_backend.stages.models.StageBreadcrumb`]): New current_breadcrumb.
+            create_breadcrumb (bool): Whether to add a :class:`~ery_backend.stages.models.StageBreadcrumb` for the new
+              :class:`~ery_backend.stages.models.Stage` (see :py:meth:`create_breadcrumb`), as new current_breadcrumb.
+
+        Notes:
+            - See :py:meth:`set_stage` for the behavior on end stages.
+            - Changes are written to :class:`Hand` in one UPDATE. If a pre_action is run, a change of module is written
+              before it, as the :class:`~ery_backend.actions.models.Action` may depend on it.
+
+        Returns:
+            Tuple(:class:`~ery_backend.stages.models.Stage`, Union[None, :class:`~ery_backend.stages.models.Stage`, \
+            List]): The new stage, and what changed, for use in websocket messages.
+        """
         if stage_definition is None:
             next_stage_definition = stage.stage_definition
         else:
             next_stage_definition = stage_definition
 
+        update_fields = ['stage']
         current_module_definition = self.current_module_definition
+        next_module = None
         if next_stage_definition.end_stage:
             next_module = self.get_next_module()
             if next_module:
@@ -227,19 +256,30 @@ class Hand(LogMixin, StintModel):
 
         new_module_definition = current_module_definition != next_stage_definition.module_definition
         if new_module_definition:
-            self.set_module(
-                self.stint.modules.get(
+            if next_module is None or next_module.module_definition != next_stage_definition.module_definition:
+                next_module = self.stint.modules.get(
                     stint_definition_module_definition__module_definition=next_stage_definition.module_definition
                 )
-            )
+            self.current_module = next_module
+            update_fields.append('current_module')
+            self._log_attribute_change('Current Module', next_module)
 
         if not stage.preaction_started and stage.stage_definition.pre_action:
+            if new_module_definition:
+                self.save(update_fields=[update_fields.pop()])
             stage.run_preaction(self)
         old_stage = self.stage
         self.stage = stage
-        self.save()
+        if create_breadcrumb:
+            breadcrumb = self.create_breadcrumb(stage)
+        if breadcrumb is not None:
+            self.current_breadcrumb = breadcrumb
+            update_fields.append('current_breadcrumb')
+        self.save(update_fields=update_fields)
 
         self._log_attribute_change('Stage', self.stage)
+        if breadcrumb is not None:
+            self._log_attribute_change('Current Breadcrumb', breadcrumb)
 
         changed = [next_stage_definition.module_definition, stage] if new_module_definition else None
         if not changed:
@@ -258,7 +298,7 @@ class Hand(LogMixin, StintModel):
         """
         previous_module = self.current_module
         self.current_module = module
-        self.save()
+        self.save(update_fields=['current_module'])
 
         changed = previous_module != module
         self._log_attribute_change('Current Module', module)
@@ -279,16 +319,16 @@ class Hand(LogMixin, StintModel):
         last_crumb = None
         if self.current_breadcrumb:
             last_crumb = self.current_breadcrumb
-        new_crumb = StageBreadcrumb.objects.create(hand=self, stage=stage)
-        if new_crumb.stage.stage_definition.breadcrumb_type in [
+        new_crumb = StageBreadcrumb(hand=self, stage=stage)
+        if stage.stage_definition.breadcrumb_type in [
             StageDefinition.BREADCRUMB_TYPE_CHOICES.back,
             StageDefinition.BREADCRUMB_TYPE_CHOICES.all,
         ]:
             new_crumb.previous_breadcrumb = last_crumb
-            new_crumb.save()
+        new_crumb.save()
         if last_crumb and last_crumb.stage.stage_definition.breadcrumb_type == StageDefinition.BREADCRUMB_TYPE_CHOICES.all:
             last_crumb.next_breadcrumb = new_crumb
-            last_crumb.save()
+            last_crumb.save(update_fields=['next_breadcrumb'])
         return new_crumb
 
     def set_breadcrumb(self, breadcrumb):
@@ -299,7 +339,7 @@ class Hand(LogMixin, StintModel):
             breadcrumb (:class:`~ery_backend.stage.models.StageBreadcrumb`).
         """
         self.current_breadcrumb = breadcrumb
-        self.save()
+        self.save(update_fields=['current_breadcrumb'])
         self._log_attribute_change('Current Breadcrumb', breadcrumb)
 
     def get_variable(self, variable_definition):
@@ -358,9 +398,15 @@ class Hand(LogMixin, StintModel):
     def update_last_seen(self):
         """
         Sets last_seen attribute to current time in UTC.
+
+        Notes:
+            - The database is not written. The heartbeat is buffered and flushed in bulk by
+              :func:`~ery_backend.hands.heartbeats.flush_heartbeats`.
         """
+        from .heartbeats import record_heartbeat
+
         self.last_seen = dt.datetime.now(pytz.UTC)
-        self.save()
+        record_heartbeat(self.id, self.last_seen.timestamp())
 
     def get_payoff(self, module=None):
         """
@@ -410,7 +456,7 @@ class Hand(LogMixin, StintModel):
 
     def _update_payoff(self, amount):
         self.current_payoff += amount
-        self.save()
+        self.save(update_fields=['current_payoff'])
 
     def back(self):
         """
@@ -424,10 +470,9 @@ class Hand(LogMixin, StintModel):
         if self.stage.stage_definition.breadcrumb_type in (crumb_choices.back, crumb_choices.all):
             previous_breadcrumb = self.current_breadcrumb.previous_breadcrumb
             if previous_breadcrumb:
-                changed = self.set_stage(previous_breadcrumb.stage)[1]
+                changed = self.transition(previous_breadcrumb.stage, breadcrumb=previous_breadcrumb)[1]
                 if changed:
                     socket_message_args.append(changed)
-                self.set_breadcrumb(previous_breadcrumb)
 
         return socket_message_args
 
@@ -445,16 +490,14 @@ class Hand(LogMixin, StintModel):
                 stage_definition.breadcrumb_type == StageDefinition.BREADCRUMB_TYPE_CHOICES.all
                 and self.current_breadcrumb.next_breadcrumb
             ):
-                changed = self.set_stage(self.current_breadcrumb.next_breadcrumb.stage)[1]
-                if changed:
-                    socket_message_args.append(changed)
-                self.set_breadcrumb(self.current_breadcrumb.next_breadcrumb)
+                next_breadcrumb = self.current_breadcrumb.next_breadcrumb
+                changed = self.transition(next_breadcrumb.stage, breadcrumb=next_breadcrumb)[1]
             else:
-                changed = self.set_stage(stage_definition=stage_definition.get_redirect_stage(self))[1]
-                if changed:
-                    socket_message_args.append(changed)
-                new_breadcrumb = self.create_breadcrumb(self.stage)
-                self.set_breadcrumb(new_breadcrumb)
+                changed = self.transition(
+                    stage_definition=stage_definition.get_redirect_stage(self), create_breadcrumb=True
+                )[1]
+            if changed:
+                socket_message_args.append(changed)
         return socket_message_args
 
     def pay(self, action_step=None):
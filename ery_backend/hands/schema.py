@@ -9,6 +9,7 @@ from .models import Hand
 class HandNode(PrivilegedNodeMixin, EryObjectType):
     class Meta:
         model = Hand
+        keyset_ordering = ('id',)
 
     # Used to access the property name
     name = graphene.String()
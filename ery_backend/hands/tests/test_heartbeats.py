@@ -0,0 +1,54 @@
+import datetime as dt
+
+import pytz
+
+from ery_backend.base.testcases import EryTestCase
+from ery_backend.hands.factories import HandFactory
+from ery_backend.hands.heartbeats import flush_heartbeats, get_buffered_last_seen
+from ery_backend.hands.models import Hand
+from ery_backend.hands.utils import update_timeouts
+from ery_backend.modules.factories import ModuleFactory
+from ery_backend.stints.factories import StintFactory
+from ery_backend.stints.models import Stint
+from ery_backend.stint_specifications.factories import StintModuleSpecificationFactory
+
+
+class TestHeartbeats(EryTestCase):
+    def setUp(self):
+        flush_heartbeats()
+        self.long_ago = dt.datetime.now(pytz.UTC) - dt.timedelta(seconds=120)
+        self.stint = StintFactory(status=Stint.STATUS_CHOICES.running)
+        self.current_module = ModuleFactory()
+        self.hand = HandFactory(
+            stint=self.stint, status=Hand.STATUS_CHOICES.active, last_seen=self.long_ago, current_module=self.current_module
+        )
+
+    def test_update_last_seen_is_buffered(self):
+        self.hand.update_last_seen()
+        self.assertIn(self.hand.id, get_buffered_last_seen([self.hand.id]))
+        self.hand.refresh_from_db()
+        self.assertEqual(self.hand.last_seen, self.long_ago)
+
+    def test_flush(self):
+        hands = [self.hand, HandFactory()]
+        for hand in hands:
+            hand.update_last_seen()
+        self.assertEqual(flush_heartbeats(), 2)
+        for hand in hands:
+            hand.refresh_from_db()
+            self.assertGreater(hand.last_seen, self.long_ago)
+        self.assertEqual(get_buffered_last_seen([hand.id for hand in hands]), {})
+        self.assertEqual(flush_heartbeats(), 0)
+
+    def test_sweep_reads_buffer(self):
+        """Unflushed heartbeats keep a hand from timing out"""
+        StintModuleSpecificationFactory(
+            hand_timeout=5,
+            stint_specification=self.stint.stint_specification,
+            module_definition=self.current_module.stint_definition_module_definition.module_definition,
+            stop_on_quit=False,
+        )
+        self.hand.update_last_seen()
+        self.assertEqual(update_timeouts()['timed_out'], 0)
+        self.hand.refresh_from_db()
+        self.assertEqual(self.hand.status, Hand.STATUS_CHOICES.active)
@@ -3,7 +3,9 @@ from unittest import mock
 import unittest
 
 from django.core.exceptions import ValidationError
+from django.db import connection
 from django.db.utils import IntegrityError
+from django.test.utils import CaptureQueriesContext
 
 import pytz
 
@@ -598,3 +600,46 @@ class TestBreadcrumb(EryTestCase):
                 hand=self.hand, stage=self.hand.stage, previous_breadcrumb=None, next_breadcrumb=None
             ).exists()
         )
+
+
+class TestTransition(EryTestCase):
+    def setUp(self):
+        self.hand = create_test_hands(n=1, stage_n=3, redirects=True, signal_pubsub=False).first()
+        self.start_crumb = self.hand.current_breadcrumb
+
+    def _count(self, queries, statement, table):
+        return len([query for query in queries if query['sql'].startswith(f'{statement} "{table}"')])
+
+    def test_submit_statements(self):
+        """
+        Confirm submit writes the hand once, along with the new stage and breadcrumb.
+        """
+        with CaptureQueriesContext(connection) as context:
+            self.hand.submit()
+        queries = context.captured_queries
+        self.assertEqual(self._count(queries, 'UPDATE', 'hands_hand'), 1)
+        self.assertEqual(self._count(queries, 'INSERT INTO', 'stages_stage'), 1)
+        self.assertEqual(self._count(queries, 'INSERT INTO', 'stages_stagebreadcrumb'), 1)
+
+        self.hand.refresh_from_db()
+        new_crumb = self.hand.current_breadcrumb
+        self.assertEqual(new_crumb.stage, self.hand.stage)
+        self.assertNotEqual(self.hand.stage, self.start_crumb.stage)
+        self.assertEqual(new_crumb.previous_breadcrumb, self.start_crumb)
+        self.start_crumb.refresh_from_db()
+        self.assertEqual(self.start_crumb.next_breadcrumb, new_crumb)
+
+    def test_back_and_forward(self):
+        self.hand.submit()
+        second_crumb = self.hand.current_breadcrumb
+        self.hand.back()
+        self.hand.refresh_from_db()
+        self.assertEqual(self.hand.current_breadcrumb, self.start_crumb)
+        self.assertEqual(self.hand.stage, self.start_crumb.stage)
+
+        with CaptureQueriesContext(connection) as context:
+            self.hand.submit()
+        self.assertEqual(self._count(context.captured_queries, 'INSERT INTO', 'stages_stage'), 0)
+        self.hand.refresh_from_db()
+        self.assertEqual(self.hand.current_breadcrumb, second_crumb)
+        self.assertEqual(self.hand.stage, second_crumb.stage)
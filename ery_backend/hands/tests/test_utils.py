@@ -56,3 +56,47 @@ class TestUpdateTimeouts(EryTestCase):
         # stint's status should be changed
         self.stint.refresh_from_db()
         self.assertEqual(self.stint.status, Stint.STATUS_CHOICES.cancelled)
+
+    def test_update_timeouts_ignores_recent_hands(self):
+        """Hands seen within their module's hand_timeout, or in stints that are not running, stay active"""
+        StintModuleSpecificationFactory(
+            hand_timeout=60,
+            stint_specification=self.stint_specification,
+            module_definition=self.current_module.stint_definition_module_definition.module_definition,
+            stop_on_quit=True,
+        )
+        stopped_stint = StintFactory(status=Stint.STATUS_CHOICES.cancelled, stint_specification=self.stint_specification)
+        stopped_hand = HandFactory(
+            stint=stopped_stint,
+            status=Hand.STATUS_CHOICES.active,
+            last_seen=dt.datetime.now(pytz.UTC) - dt.timedelta(seconds=120),
+            current_module=self.current_module,
+            user=UserFactory(),
+        )
+        metrics = update_timeouts()
+        self.assertEqual(metrics['timed_out'], 0)
+        for hand in (self.hand, stopped_hand):
+            hand.refresh_from_db()
+            self.assertEqual(hand.status, Hand.STATUS_CHOICES.active)
+
+    def test_update_timeouts_query_count(self):
+        """The number of queries does not depend on the number of hands"""
+        StintModuleSpecificationFactory(
+            hand_timeout=5,
+            stint_specification=self.stint_specification,
+            module_definition=self.current_module.stint_definition_module_definition.module_definition,
+            stop_on_quit=False,
+        )
+        for _ in range(5):
+            HandFactory(
+                stint=self.stint,
+                status=Hand.STATUS_CHOICES.active,
+                last_seen=dt.datetime.now(pytz.UTC) - dt.timedelta(seconds=10),
+                current_module=self.current_module,
+                user=UserFactory(),
+            )
+        # find expired hands and update them
+        with self.assertNumQueries(2):
+            metrics = update_timeouts()
+        self.assertEqual(metrics['timed_out'], 6)
+        self.assertFalse(Hand.objects.filter(stint=self.stint, status=Hand.STATUS_CHOICES.active).exists())
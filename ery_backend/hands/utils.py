@@ -1,11 +1,54 @@
 import datetime as dt
+import logging
+import time
 
+from django.db.models import DateTimeField, DurationField, ExpressionWrapper, F, OuterRef, Subquery
 import pytz
 
+from ery_backend.base.cache import invalidate_tag
+from ery_backend.hands.heartbeats import get_buffered_last_seen
 from ery_backend.hands.models import Hand
 from ery_backend.stints.models import Stint
 from ery_backend.stint_specifications.models import StintModuleSpecification
 
+logger = logging.getLogger(__name__)
+
+
+def get_expired_hands(now):
+    """
+    Find :class:`~ery_backend.hands.models.Hand` objects whose last_seen exceeds the hand_timeout of the
+    :class:`~ery_backend.stint_specifications.models.StintModuleSpecification` of their current
+    :class:`~ery_backend.modules.models.Module`.
+
+    Args:
+        - now (:class:`datetime.datetime`): Time against which last_seen is compared.
+
+    Notes:
+        - Only active :class:`~ery_backend.hands.models.Hand` objects in running :class:`~ery_backend.stints.models.Stint`
+          instances are considered.
+        - Resolved in one statement, with each instance annotated with hand_timeout and stop_on_quit.
+
+    Returns:
+        :class:`django.db.models.query.QuerySet`
+    """
+    module_specifications = StintModuleSpecification.objects.filter(
+        stint_specification=OuterRef('stint__stint_specification'),
+        module_definition=OuterRef('current_module__stint_definition_module_definition__module_definition'),
+    )
+    timeout = ExpressionWrapper(F('hand_timeout') * dt.timedelta(seconds=1), output_field=DurationField())
+
+    return (
+        Hand.objects.filter(
+            status=Hand.STATUS_CHOICES.active, stint__status=Stint.STATUS_CHOICES.running, last_seen__isnull=False
+        )
+        .annotate(
+            hand_timeout=Subquery(module_specifications.values('hand_timeout')[:1]),
+            stop_on_quit=Subquery(module_specifications.values('stop_on_quit')[:1]),
+        )
+        .annotate(expires=ExpressionWrapper(F('last_seen') + timeout, output_field=DateTimeField()))
+        .filter(expires__lte=now)
+    )
+
 
 def update_timeouts():
     """
@@ -14,18 +57,45 @@ def update_timeouts():
     Notes:
         - Only monitors :class:`~ery_backend.hands.models.Hand` objects in :class:`~ery_backend.stints.models.Stint` instances
           with a status of 'running'.
+        - Expired hands are found and set to timedout in bulk, after which each :class:`~ery_backend.stints.models.Stint`
+          with a timed out hand in a module with stop_on_quit is cancelled.
+        - Heartbeats buffered by :func:`~ery_backend.hands.heartbeats.record_heartbeat` are taken into account, even
+          when not yet flushed.
+
+    Returns:
+        dict: Metrics of the sweep (timed_out, cancelled_stints and duration in seconds).
     """
+    started = time.monotonic()
     now = dt.datetime.now(pytz.UTC)
-    for stint in Stint.objects.filter(status=Stint.STATUS_CHOICES.running).all():
-        for hand in stint.hands.filter(status=Hand.STATUS_CHOICES.active).all():
-            now = dt.datetime.now(pytz.UTC)
-            stint_module_specification = StintModuleSpecification.objects.get(
-                module_definition=hand.current_module.stint_definition_module_definition.module_definition,
-                stint_specification=hand.stint.stint_specification,
-            )
-            if now - hand.last_seen >= dt.timedelta(seconds=stint_module_specification.hand_timeout):
-                hand.status = Hand.STATUS_CHOICES.timedout
-                hand.save()
-                if stint_module_specification.stop_on_quit and stint.status == Stint.STATUS_CHOICES.running:
-                    stint.set_status(Stint.STATUS_CHOICES.cancelled)
-                    stint.save()
+
+    candidates = list(get_expired_hands(now).values_list('id', 'stint_id', 'stop_on_quit', 'hand_timeout'))
+    # Heartbeats not yet flushed to last_seen may keep a hand alive
+    buffered = get_buffered_last_seen([hand_id for hand_id, _, _, _ in candidates])
+    expired = [
+        (hand_id, stint_id, stop_on_quit)
+        for hand_id, stint_id, stop_on_quit, hand_timeout in candidates
+        if hand_id not in buffered or buffered[hand_id] + dt.timedelta(seconds=hand_timeout) <= now
+    ]
+    hand_ids = [hand_id for hand_id, _, _ in expired]
+    timed_out = 0
+    if hand_ids:
+        timed_out = Hand.objects.filter(id__in=hand_ids, status=Hand.STATUS_CHOICES.active).update(
+            status=Hand.STATUS_CHOICES.timedout, modified=now
+        )
+        for hand_id in hand_ids:
+            invalidate_tag(Hand.get_cache_tag_by_pk(hand_id))
+        for stint_id in {stint_id for _, stint_id, _ in expired}:
+            invalidate_tag(Stint.get_cache_tag_by_pk(stint_id))
+
+    cancelled_stints = 0
+    stop_stint_ids = {stint_id for _, stint_id, stop_on_quit in expired if stop_on_quit}
+    for stint in Stint.objects.filter(id__in=stop_stint_ids, status=Stint.STATUS_CHOICES.running):
+        stint.set_status(Stint.STATUS_CHOICES.cancelled)
+        cancelled_stints += 1
+
+    metrics = {'timed_out': timed_out, 'cancelled_stints': cancelled_stints, 'duration': time.monotonic() - started}
+    logger.info(
+        "Hand timeout sweep: %(timed_out)s hands timed out, %(cancelled_stints)s stints cancelled in %(duration).3fs",
+        metrics,
+    )
+    return metrics
@@ -110,8 +110,9 @@ class Lab(EryNamedSlugged, PrivilegedMixin):
 
         stintdef_name = self.current_stint.stint_specification.stint_definition.name
         username = stopped_by.username
-        hand_names = [hand.user.username for hand in self.current_stint.hands.all() if hand.user]
-        robot_names = [hand.robot for hand in self.current_stint.hands.all() if hand.robot]
+        hands = list(self.current_stint.hands.select_related('user', 'robot'))
+        hand_names = [hand.user.username for hand in hands if hand.user]
+        robot_names = [hand.robot for hand in hands if hand.robot]
         message = (
             f'Current stint with StintDefinition: {stintdef_name} '
             f'stopped by User: {username}, with hands: {hand_names} and robots: {robot_names}'
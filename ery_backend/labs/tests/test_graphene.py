@@ -1,4 +1,7 @@
 from unittest import mock
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 import graphene
 
 from ery_backend.base.testcases import GQLTestCase, create_test_hands
@@ -74,6 +77,28 @@ class TestReadLab(GQLTestCase):
         self.fail_on_errors(result)
         self.assertEqual(len(result["data"]["allLabs"]["edges"]), 1)
 
+    def test_read_all_query_count(self):
+        """Queries of allLabs do not grow with the number of labs"""
+        query = """{allLabs{ edges{ node{ name currentStint { status startedBy { username }}}}}}"""
+
+        def add_labs(n):
+            for _ in range(n):
+                lab = LabFactory(current_stint=StintFactory(started_by=UserFactory()))
+                grant_role(self.owner["role"], lab, self.owner["user"])
+
+        def execute():
+            with CaptureQueriesContext(connection) as queries:
+                result = self.gql_client.execute(query, context_value=self.gql_client.get_context(user=self.owner["user"]))
+            self.fail_on_errors(result)
+            return result, len(queries.captured_queries)
+
+        add_labs(2)
+        _, few_query_count = execute()
+        add_labs(5)
+        result, many_query_count = execute()
+        self.assertEqual(len(result["data"]["allLabs"]["edges"]), 7)
+        self.assertEqual(many_query_count, few_query_count)
+
 
 class TestCreateLab(GQLTestCase):
     node_name = "LabNode"
@@ -7,6 +7,7 @@ from .models import Log
 class LogNode(RoleAssignmentNodeMixin, EryObjectType):
     class Meta:
         model = Log
+        keyset_ordering = ('id',)
 
 
 LogQuery = LogNode.get_query_class()
@@ -0,0 +1,169 @@
+"""
+Sink:
+    Writes of :class:`~ery_backend.logs.models.Log` instances are queued in process, and created in batches by a
+    background thread, so that requests do not wait on audit logs.
+
+Notes:
+    - Instances are queued once the transaction that logged them commits, and are lost if it is rolled back, as when
+      they were saved within it.
+    - Instances are written with bulk_create, which skips :py:meth:`~ery_backend.base.models.EryModel.save`. No cached
+      content depends on logs.
+    - If the queue is full (ERY_LOG_QUEUE_SIZE), instances are dropped (with a warning) or, given ERY_LOG_OVERFLOW
+      'block', written by the thread logging them.
+    - The queue is flushed at interpreter exit.
+"""
+import atexit
+import logging
+import queue
+import threading
+
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+
+logger = logging.getLogger(__name__)
+
+
+class LogSink:
+    """
+    Queue of :class:`~ery_backend.logs.models.Log` instances, and the thread writing them.
+
+    Args:
+        - maxsize (int): Number of queued instances after which overflow applies.
+        - batch_size (int): Maximum number of instances per bulk_create.
+        - interval (float): Seconds the thread waits for a first instance, before checking whether to stop.
+        - overflow (str): 'drop' or 'block'.
+    """
+
+    def __init__(self, maxsize, batch_size, interval, overflow):
+        self.batch_size = batch_size
+        self.interval = interval
+        self.overflow = overflow
+        self.dropped = 0
+        self._queue = queue.Queue(maxsize)
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def _start(self):
+        with self._lock:
+            if self._thread is None:
+                self._stopped.clear()
+                self._thread = threading.Thread(target=self._run, name='ery-log-sink', daemon=True)
+                self._thread.start()
+                atexit.register(self.stop)
+
+    def put(self, log):
+        """
+        Queue log for creation.
+
+        Args:
+            - log (:class:`~ery_backend.logs.models.Log`): Unsaved instance.
+        """
+        if self._thread is None:
+            self._start()
+        try:
+            self._queue.put_nowait(log)
+        except queue.Full:
+            if self.overflow == 'block':
+                self._write([log])
+            else:
+                self.dropped += 1
+                logger.warning("Log queue full, dropped log (%s in total): %s", self.dropped, log.message)
+
+    def _get_batch(self, timeout=None):
+        batch = []
+        try:
+            batch.append(self._queue.get(timeout=timeout) if timeout else self._queue.get_nowait())
+            while len(batch) < self.batch_size:
+                batch.append(self._queue.get_nowait())
+        except queue.Empty:
+            pass
+        return batch
+
+    def _write(self, batch):
+        from .models import Log
+
+        try:
+            Log.objects.bulk_create(batch)
+        except Exception:  # pylint: disable=broad-except
+            # E.g., a stint deleted while its logs were queued. Keep the rest of the batch.
+            logger.exception("Failed to write batch of %s logs. Writing individually", len(batch))
+            for log in batch:
+                try:
+                    Log.objects.bulk_create([log])
+                except Exception:  # pylint: disable=broad-except
+                    logger.warning("Dropped log: %s", log.message)
+
+    def flush(self):
+        """
+        Write all queued instances on the calling thread.
+
+        Returns:
+            int: Number of written instances.
+        """
+        count = 0
+        batch = self._get_batch()
+        while batch:
+            self._write(batch)
+            count += len(batch)
+            batch = self._get_batch()
+        return count
+
+    def _run(self):
+        try:
+            while not self._stopped.is_set():
+                batch = self._get_batch(timeout=self.interval)
+                if batch:
+                    close_old_connections()
+                    self._write(batch)
+        finally:
+            connection.close()
+
+    def stop(self):
+        """
+        Stop the thread, and flush remaining instances.
+        """
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stopped.set()
+            thread.join()
+        self.flush()
+
+
+_sink = None
+_sink_lock = threading.Lock()
+
+
+def get_sink():
+    """
+    Returns:
+        :class:`LogSink`: Shared by the threads of the process.
+    """
+    global _sink  # pylint: disable=global-statement
+    if _sink is None:
+        with _sink_lock:
+            if _sink is None:
+                _sink = LogSink(
+                    settings.ERY_LOG_QUEUE_SIZE,
+                    settings.ERY_LOG_BATCH_SIZE,
+                    settings.ERY_LOG_FLUSH_INTERVAL,
+                    settings.ERY_LOG_OVERFLOW,
+                )
+    return _sink
+
+
+def record_log(**kwargs):
+    """
+    Create a :class:`~ery_backend.logs.models.Log`, through the :class:`LogSink` if ERY_LOG_BUFFERED.
+
+    Args:
+        - kwargs: Fields of the instance.
+    """
+    from .models import Log
+
+    if not settings.ERY_LOG_BUFFERED:
+        Log.objects.create(**kwargs)
+        return
+    log = Log(**kwargs)
+    transaction.on_commit(lambda: get_sink().put(log))
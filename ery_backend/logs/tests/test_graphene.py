@@ -66,6 +66,30 @@ class TestReadLog(GQLTestCase):
         self.fail_on_errors(result)
         self.assertEqual(len(result["data"]["allLogs"]["edges"]), 1)
 
+    def test_keyset_pagination(self):
+        """Pages follow each other through nextKey"""
+        query = """query AllLogs($afterKey: String){allLogs(limit: 2, afterKey: $afterKey){ nextKey edges{ node{ id }}}}"""
+        logs = [LogFactory() for _ in range(5)]
+        for obj in logs:
+            grant_role(self.viewer["role"], obj.stint.get_privilege_ancestor(), self.viewer["user"])
+
+        pages = []
+        after_key = None
+        while True:
+            result = self.gql_client.execute(
+                query,
+                variable_values={"afterKey": after_key},
+                context_value=self.gql_client.get_context(user=self.viewer["user"]),
+            )
+            self.fail_on_errors(result)
+            pages.append([edge["node"]["id"] for edge in result["data"]["allLogs"]["edges"]])
+            after_key = result["data"]["allLogs"]["nextKey"]
+            if after_key is None:
+                break
+
+        self.assertEqual([len(page) for page in pages], [2, 2, 1])
+        self.assertEqual([node_id for page in pages for node_id in page], [obj.gql_id for obj in logs])
+
     def test_related_models(self):
         """
         Confirm all related models can be accessed.
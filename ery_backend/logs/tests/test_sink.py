@@ -0,0 +1,59 @@
+from unittest import mock
+
+from django.test import override_settings
+
+from ery_backend.base.testcases import EryTestCase, create_test_hands
+from ..models import Log
+from ..sink import LogSink, record_log
+
+
+@mock.patch('ery_backend.logs.sink.LogSink._start')
+class TestLogSink(EryTestCase):
+    def setUp(self):
+        self.stint = create_test_hands(n=1, signal_pubsub=False).first().stint
+
+    def _log(self, message):
+        return Log(stint=self.stint, message=message)
+
+    def test_flush(self, mock_start):
+        sink = LogSink(10, 2, 1, 'drop')
+        for i in range(5):
+            sink.put(self._log(f'sink-{i}'))
+        self.assertFalse(Log.objects.filter(message__startswith='sink-').exists())
+        self.assertEqual(sink.flush(), 5)
+        self.assertEqual(Log.objects.filter(stint=self.stint, message__startswith='sink-').count(), 5)
+
+    def test_drop(self, mock_start):
+        sink = LogSink(1, 10, 1, 'drop')
+        sink.put(self._log('kept'))
+        sink.put(self._log('dropped'))
+        self.assertEqual(sink.dropped, 1)
+        sink.flush()
+        self.assertTrue(Log.objects.filter(message='kept').exists())
+        self.assertFalse(Log.objects.filter(message='dropped').exists())
+
+    def test_block(self, mock_start):
+        sink = LogSink(1, 10, 1, 'block')
+        sink.put(self._log('queued'))
+        sink.put(self._log('written'))
+        self.assertEqual(sink.dropped, 0)
+        self.assertTrue(Log.objects.filter(message='written').exists())
+        sink.flush()
+        self.assertTrue(Log.objects.filter(message='queued').exists())
+
+    @override_settings(ERY_LOG_BUFFERED=True)
+    def test_record_log_on_commit(self, mock_start):
+        sink = LogSink(10, 10, 1, 'drop')
+        with mock.patch('ery_backend.logs.sink.get_sink', return_value=sink), mock.patch(
+            'ery_backend.logs.sink.transaction.on_commit'
+        ) as on_commit:
+            record_log(stint=self.stint, message='committed')
+            self.assertEqual(sink.flush(), 0)
+            on_commit.call_args[0][0]()
+        self.assertEqual(sink.flush(), 1)
+        self.assertTrue(Log.objects.filter(message='committed').exists())
+
+    @override_settings(ERY_LOG_BUFFERED=False)
+    def test_record_log_unbuffered(self, mock_start):
+        record_log(stint=self.stint, message='immediate')
+        self.assertTrue(Log.objects.filter(message='immediate').exists())
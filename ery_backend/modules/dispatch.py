@@ -0,0 +1,169 @@
+"""
+Dispatch:
+    Events of the widget wrappers (:class:`~ery_backend.modules.widgets.ModuleDefinitionWidget`,
+    :class:`~ery_backend.templates.widgets.TemplateWidget` and :class:`~ery_backend.forms.models.FormButton`) of a
+    :class:`~ery_backend.modules.models.ModuleDefinition`, compiled into a table of the steps they run, so that dispatching
+    a websocket event is a dict lookup followed by running its steps.
+"""
+from collections import namedtuple
+
+from django.core.cache import cache
+
+from ery_backend.base.cache import set_tagged
+from ery_backend.base.utils import get_gql_id
+
+# requires_value is set on steps of module events whose widget does not save null values
+DispatchStep = namedtuple('DispatchStep', ('event_action_type', 'action', 'variable_definition', 'requires_value'))
+
+
+def _get_template_widgets(module_definition):
+    from ery_backend.stages.models import StageTemplate
+    from ery_backend.templates.models import Template, TemplateWidget
+
+    template_ids = set(
+        StageTemplate.objects.filter(stage_definition__module_definition=module_definition).values_list(
+            'template_id', flat=True
+        )
+    )
+    template_ids.add(module_definition.default_template_id)
+    template_ids = Template.get_ancestor_ids(template_ids)
+    return template_ids, list(TemplateWidget.objects.filter(template_id__in=template_ids).only('id', 'widget_id'))
+
+
+def compile_dispatch_table(module_definition):
+    """
+    Args:
+        - module_definition (:class:`~ery_backend.modules.models.ModuleDefinition`)
+
+    Notes:
+        - Each wrapper runs the steps of its own events (module events, for
+          :class:`~ery_backend.modules.widgets.ModuleDefinitionWidget`), followed by those of the events of its
+          :class:`~ery_backend.widgets.models.Widget`, as by the trigger_events method of each wrapper.
+        - Widget event steps run client-side (run_code) are left out.
+        - Template widgets are those of the templates used by the stage definitions of module_definition, its default
+          template, and their ancestors.
+
+    Returns:
+        Tuple[Dict[Tuple[str, str, str], Tuple[:class:`DispatchStep`]], Set[str]]: Steps by (wrapper gql_id, event name,
+        event type), and the cache tags of the objects they were compiled from.
+    """
+    from ery_backend.forms.models import FormButton
+    from ery_backend.templates.models import Template
+    from ery_backend.widgets.models import Widget, WidgetEventStep
+    from .models import ModuleDefinition
+    from .widgets import ModuleDefinitionWidget, ModuleEventStep
+
+    module_widgets = list(
+        ModuleDefinitionWidget.objects.filter(module_definition=module_definition).select_related(
+            'widget', 'variable_definition'
+        )
+    )
+    template_ids, template_widgets = _get_template_widgets(module_definition)
+    form_buttons = list(
+        FormButton.objects.filter(button_list__form_item__form__module_definition=module_definition).only('id', 'widget_id')
+    )
+    gql_ids = {}
+    # Wrapper gql_ids by widget
+    wrappers = {}
+    for wrapper in module_widgets + template_widgets + form_buttons:
+        gql_ids[wrapper] = get_gql_id(wrapper.__class__.__name__, wrapper.id)
+        wrappers.setdefault(wrapper.widget_id, []).append(gql_ids[wrapper])
+
+    table = {}
+    module_widgets = {module_widget.id: module_widget for module_widget in module_widgets}
+    module_steps = (
+        ModuleEventStep.objects.filter(module_event__widget__module_definition=module_definition)
+        .select_related('module_event', 'action')
+        .order_by('module_event__created', 'module_event__id', 'order', 'id')
+    )
+    for step in module_steps:
+        module_widget = module_widgets[step.module_event.widget_id]
+        key = (gql_ids[module_widget], step.module_event.name, step.module_event.event_type)
+        table.setdefault(key, []).append(
+            DispatchStep(
+                step.event_action_type,
+                step.action,
+                module_widget.variable_definition
+                if step.event_action_type == ModuleEventStep.EVENT_ACTION_TYPE_CHOICES.save_var
+                else None,
+                not module_widget.widget.save_null,
+            )
+        )
+
+    widget_steps = (
+        WidgetEventStep.objects.filter(widget_event__widget_id__in=wrappers)
+        .exclude(event_action_type=WidgetEventStep.EVENT_ACTION_TYPE_CHOICES.run_code)
+        .select_related('widget_event')
+        .order_by('widget_event__created', 'widget_event__id', 'order', 'id')
+    )
+    for step in widget_steps:
+        for gql_id in wrappers[step.widget_event.widget_id]:
+            key = (gql_id, step.widget_event.name, step.widget_event.event_type)
+            table.setdefault(key, []).append(DispatchStep(step.event_action_type, None, None, False))
+
+    tags = {ModuleDefinition.get_cache_tag_by_pk(module_definition.id)}
+    tags.update(Template.get_cache_tag_by_pk(template_id) for template_id in template_ids)
+    tags.update(Widget.get_cache_tag_by_pk(widget_id) for widget_id in wrappers)
+    return {key: tuple(steps) for key, steps in table.items()}, tags
+
+
+def get_dispatch_table(module_definition):
+    """
+    Get the compiled dispatch table of a :class:`~ery_backend.modules.models.ModuleDefinition` (see
+    :func:`compile_dispatch_table`).
+
+    Notes:
+        - Cached by version, and invalidated on changes to module_definition, its templates, or the
+          :class:`~ery_backend.widgets.models.Widget` instances of its wrappers.
+
+    Returns:
+        Dict[Tuple[str, str, str], Tuple[:class:`DispatchStep`]]
+    """
+    cache_key = f'EDT:{module_definition.id}:{module_definition.version}'
+    table = cache.get(cache_key)
+    if table is None:
+        table, tags = compile_dispatch_table(module_definition)
+        set_tagged(cache_key, table, tags)
+    return table
+
+
+def dispatch_event(hand, gql_id, name, event_type, value=None):
+    """
+    Run the steps of the events of a widget wrapper, as by its trigger_events method.
+
+    Args:
+        - hand (:class:`~ery_backend.hands.models.Hand`): Provides context during execution, and the
+          :class:`~ery_backend.modules.models.ModuleDefinition` of the wrapper.
+        - gql_id (str): Of the wrapper.
+        - name (str): Of the events.
+        - event_type (str): Of the events.
+        - value (Optional[Union[str, int, float, bool, list, dict]]): Saved by save_var steps.
+
+    Notes:
+        - Saved values are flushed before any other step runs, as it may read them.
+
+    Returns:
+        List: Socket message args.
+    """
+    from ery_backend.variables.batches import VariableBatch
+    from .widgets import ModuleEventStep
+
+    action_types = ModuleEventStep.EVENT_ACTION_TYPE_CHOICES
+    steps = get_dispatch_table(hand.current_module_definition).get((gql_id, name, event_type), ())
+    socket_message_args = []
+    batch = VariableBatch(hand.stint, hand=hand)
+    for step in steps:
+        if step.requires_value and value is None:
+            continue
+        if step.event_action_type == action_types.save_var:
+            batch.set(step.variable_definition, value)
+            continue
+        socket_message_args += batch.flush()
+        if step.event_action_type == action_types.run_action:
+            socket_message_args += step.action.run(hand)
+        elif step.event_action_type == action_types.back:
+            socket_message_args += hand.back()
+        elif step.event_action_type == action_types.submit:
+            socket_message_args += hand.submit()
+    socket_message_args += batch.flush()
+    return socket_message_args
@@ -85,13 +85,10 @@ class ModuleDefinition(ReactNamedMixin, EryFile):
         return ModuleDefinitionMutationSerializer
 
     def get_widgets(self, frontend=None):
-        from ery_backend.widgets.models import Widget, WidgetConnection
+        from ery_backend.widgets.models import Widget
 
         widget_ids = set(self.module_widgets.filter(widget__frontend=frontend).values_list('widget', flat=True))
-        connected_widget_ids = set(self.module_widgets.values_list('widget__connections__target', flat=True))
-        widget_ids.update(connected_widget_ids)
-        for connected_widget_id in connected_widget_ids:
-            widget_ids.update(Widget.get_nested_connected_widget_ids(connected_widget_id))
+        widget_ids.update(Widget.get_nested_connected_widget_ids(self.module_widgets.values_list('widget', flat=True)))
         return Widget.objects.filter(id__in=widget_ids)
 
     def _assign_start_era(self):
@@ -0,0 +1,93 @@
+from unittest import mock
+
+from ery_backend.base.testcases import EryTestCase, create_test_hands
+from ery_backend.stages.factories import StageDefinitionFactory, StageTemplateFactory
+from ery_backend.templates.widget_factories import TemplateWidgetFactory
+from ery_backend.widgets.factories import WidgetFactory, WidgetEventFactory, WidgetEventStepFactory
+from ery_backend.widgets.models import WidgetEvent, WidgetEventStep
+from ..dispatch import dispatch_event, get_dispatch_table
+from ..factories import ModuleDefinitionWidgetFactory, ModuleEventFactory, ModuleEventStepFactory
+from ..models import ModuleEvent, ModuleEventStep
+
+
+class TestDispatchTable(EryTestCase):
+    def setUp(self):
+        self.hand = create_test_hands(n=1, signal_pubsub=False).first()
+        self.module_definition = self.hand.current_module_definition
+        self.widget = WidgetFactory(save_null=False)
+        self.module_widget = ModuleDefinitionWidgetFactory(module_definition=self.module_definition, widget=self.widget)
+        self.module_event = ModuleEventFactory(
+            widget=self.module_widget, name='go', event_type=ModuleEvent.REACT_EVENT_CHOICES.onClick
+        )
+        for event_action_type in (
+            ModuleEventStep.EVENT_ACTION_TYPE_CHOICES.save_var,
+            ModuleEventStep.EVENT_ACTION_TYPE_CHOICES.run_action,
+        ):
+            ModuleEventStepFactory(module_event=self.module_event, event_action_type=event_action_type)
+        self.widget_event = WidgetEventFactory(
+            widget=self.widget, name='go', event_type=WidgetEvent.REACT_EVENT_CHOICES.onClick
+        )
+        for event_action_type in (
+            WidgetEventStep.EVENT_ACTION_TYPE_CHOICES.run_code,
+            WidgetEventStep.EVENT_ACTION_TYPE_CHOICES.submit,
+        ):
+            WidgetEventStepFactory(widget_event=self.widget_event, event_action_type=event_action_type)
+        self.key = (self.module_widget.gql_id, 'go', ModuleEvent.REACT_EVENT_CHOICES.onClick)
+
+    def test_steps(self):
+        """
+        Confirm module event steps are followed by widget event steps run server-side.
+        """
+        steps = get_dispatch_table(self.module_definition)[self.key]
+        self.assertEqual([step.event_action_type for step in steps], ['save_var', 'run_action', 'submit'])
+        self.assertEqual(steps[0].variable_definition, self.module_widget.variable_definition)
+        self.assertEqual(steps[1].action, self.module_event.steps.get(event_action_type='run_action').action)
+        self.assertTrue(steps[0].requires_value)
+        self.assertFalse(steps[2].requires_value)
+
+    def test_template_widgets(self):
+        stage_definition = StageDefinitionFactory(module_definition=self.module_definition)
+        stage_template = StageTemplateFactory(stage_definition=stage_definition)
+        widget = WidgetFactory(frontend=stage_template.template.frontend)
+        template_widget = TemplateWidgetFactory(template=stage_template.template, widget=widget)
+        widget_event = WidgetEventFactory(widget=widget, name='go', event_type=WidgetEvent.REACT_EVENT_CHOICES.onClick)
+        WidgetEventStepFactory(
+            widget_event=widget_event, event_action_type=WidgetEventStep.EVENT_ACTION_TYPE_CHOICES.back
+        )
+        key = (template_widget.gql_id, 'go', WidgetEvent.REACT_EVENT_CHOICES.onClick)
+        steps = get_dispatch_table(self.module_definition)[key]
+        self.assertEqual([step.event_action_type for step in steps], ['back'])
+
+    def test_cache(self):
+        """
+        Confirm tables are cached, and invalidated on changes to the events of widgets.
+        """
+        get_dispatch_table(self.module_definition)
+        with self.assertNumQueries(0):
+            get_dispatch_table(self.module_definition)
+
+        WidgetEventStepFactory(
+            widget_event=self.widget_event, event_action_type=WidgetEventStep.EVENT_ACTION_TYPE_CHOICES.back
+        )
+        steps = get_dispatch_table(self.module_definition)[self.key]
+        self.assertEqual([step.event_action_type for step in steps], ['save_var', 'run_action', 'submit', 'back'])
+
+    @mock.patch('ery_backend.hands.models.Hand.submit', return_value=[])
+    @mock.patch('ery_backend.actions.models.Action.run', return_value=[])
+    @mock.patch('ery_backend.variables.batches.VariableBatch.set')
+    def test_dispatch_event(self, mock_set, mock_run, mock_submit):
+        dispatch_event(self.hand, *self.key, value=3)
+        mock_set.assert_called_once_with(self.module_widget.variable_definition, 3)
+        mock_run.assert_called_once_with(self.hand)
+        mock_submit.assert_called_once_with()
+
+        # Module event steps require a value, as the widget does not save null values
+        mock_set.reset_mock()
+        mock_run.reset_mock()
+        dispatch_event(self.hand, *self.key)
+        mock_set.assert_not_called()
+        mock_run.assert_not_called()
+        self.assertEqual(mock_submit.call_count, 2)
+
+        # Unknown events run nothing
+        self.assertEqual(dispatch_event(self.hand, self.module_widget.gql_id, 'stop', 'onClick'), [])
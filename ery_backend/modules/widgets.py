@@ -266,20 +266,27 @@ class ModuleEvent(EventModel):
         Args:
             - hand (:class:`~ery_backend.hands.models.Hand`): Provides context (if required)
               during execution of associated action.
+
+        Notes:
+            - Saved values are flushed before any other step runs, as it may read them.
         """
+        from ery_backend.variables.batches import VariableBatch
+
         socket_message_args = []
+        batch = VariableBatch(hand.stint, hand=hand)
 
         for step in self.steps.all():
             if step.event_action_type == step.EVENT_ACTION_TYPE_CHOICES.save_var:
-                variable, changed = hand.stint.set_variable(self.widget.variable_definition, value, hand=hand)
-                if changed:
-                    socket_message_args.append(variable)
-            elif step.event_action_type == step.EVENT_ACTION_TYPE_CHOICES.run_action:
+                batch.set(self.widget.variable_definition, value)
+                continue
+            socket_message_args += batch.flush()
+            if step.event_action_type == step.EVENT_ACTION_TYPE_CHOICES.run_action:
                 socket_message_args += step.action.run(hand)
             elif step.event_action_type == step.EVENT_ACTION_TYPE_CHOICES.back:
                 socket_message_args += hand.back()
             elif step.event_action_type == step.EVENT_ACTION_TYPE_CHOICES.submit:
                 socket_message_args += hand.submit()
+        socket_message_args += batch.flush()
         return socket_message_args
 
 
@@ -478,13 +485,13 @@ class ModuleDefinitionWidget(ChoiceHolderMixin, ReactNamedMixin, EryNamedPrivile
 
     def get_events_info(self):
         events_info = []
+        widget_communicates = any(
+            step.event_action_type in ModuleEventStep.REQUIRE_COMMUNCIATE_ACTION_TYPES
+            for event in self.widget.events.all()
+            for step in event.steps.all()
+        )
         for event in self.events.all():
-            do_communicate = (
-                event.steps.exists()
-                and not self.widget.events.filter(
-                    steps__event_action_type__in=ModuleEventStep.REQUIRE_COMMUNCIATE_ACTION_TYPES
-                ).exists()
-            )
+            do_communicate = bool(event.steps.all()) and not widget_communicates
             events_info.append((event.name or '', event.event_type, do_communicate))
 
         return events_info
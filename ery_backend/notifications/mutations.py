@@ -1,8 +1,8 @@
 from graphene import relay
 import graphene
 
+from ery_backend.base.registry import get_role
 from ery_backend.base.schema import EryFilterConnectionField, EryMutationMixin
-from ery_backend.roles.models import Role
 from ery_backend.roles.utils import has_privilege, grant_role
 from ery_backend.users.models import User
 from ery_backend.users.utils import authenticated_user
@@ -32,7 +32,7 @@ class CreateNotificationContent(EryMutationMixin, relay.ClientIDMutation):
         cls.add_all_attributes(notification_content, inputs)
         notification_content.save()
 
-        ownership = Role.objects.get(name="owner")
+        ownership = get_role('owner')
         grant_role(ownership, notification_content, user)
 
         return CreateNotificationContent(notification_content=notification_content)
@@ -0,0 +1,94 @@
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def get_all_privilege_ids(RoleParent, role_id, privilege_ids_by_role):
+    privilege_ids = set(privilege_ids_by_role.get(role_id, ()))
+    for parent_id in RoleParent.objects.filter(role_id=role_id).values_list('parent_id', flat=True):
+        privilege_ids.update(get_all_privilege_ids(RoleParent, parent_id, privilege_ids_by_role))
+    return privilege_ids
+
+
+def populate_privilege_access(apps, schema_editor):
+    Role = apps.get_model('roles', 'Role')
+    RoleParent = apps.get_model('roles', 'RoleParent')
+    RoleAssignment = apps.get_model('roles', 'RoleAssignment')
+    PrivilegeAccess = apps.get_model('roles', 'PrivilegeAccess')
+
+    privilege_ids_by_role = {}
+    for role_id, privilege_id in Role.privileges.through.objects.values_list('role_id', 'privilege_id'):
+        privilege_ids_by_role.setdefault(role_id, set()).add(privilege_id)
+
+    all_privilege_ids = {}
+    accesses = []
+    for role_assignment in RoleAssignment.objects.all():
+        if role_assignment.role_id not in all_privilege_ids:
+            all_privilege_ids[role_assignment.role_id] = get_all_privilege_ids(
+                RoleParent, role_assignment.role_id, privilege_ids_by_role
+            )
+        accesses += [
+            PrivilegeAccess(
+                role_assignment=role_assignment,
+                content_type_id=role_assignment.content_type_id,
+                object_id=role_assignment.object_id,
+                privilege_id=privilege_id,
+                user_id=role_assignment.user_id,
+                group_id=role_assignment.group_id,
+            )
+            for privilege_id in all_privilege_ids[role_assignment.role_id]
+        ]
+    PrivilegeAccess.objects.bulk_create(accesses, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('users', '0004_auto_20200430_0148'),
+        ('roles', '0003_auto_20200430_0148'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PrivilegeAccess',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('object_id', models.PositiveIntegerField()),
+                (
+                    'content_type',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, related_name='+', to='contenttypes.ContentType'
+                    ),
+                ),
+                (
+                    'group',
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='+',
+                        to='users.Group',
+                    ),
+                ),
+                ('privilege', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='roles.Privilege')),
+                ('role_assignment', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='roles.RoleAssignment')),
+                (
+                    'user',
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='+',
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='privilegeaccess',
+            index=models.Index(fields=['content_type', 'privilege', 'object_id'], name='roles_privi_content_411a63_idx'),
+        ),
+        migrations.RunPython(populate_privilege_access, migrations.RunPython.noop),
+    ]
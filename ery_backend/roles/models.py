@@ -49,6 +49,14 @@ class RoleParent(EryModel):
                     )
                 }
             )
+        self.role.sync_privilege_access()
+
+    def delete(self, **kwargs):
+        """
+        Override of default django method, resynchronizing :class:`PrivilegeAccess` of the role losing its parent.
+        """
+        super().delete(**kwargs)
+        self.role.sync_privilege_access()
 
     def _invalidate_related_tags(self, history):
         """
@@ -111,6 +119,33 @@ class Role(EryNamedPrivileged):
 
         return privilege_id_set
 
+    def sync_privilege_access(self):
+        """
+        Rebuild the :class:`PrivilegeAccess` of :class:`RoleAssignment` instances of the current role and of the roles
+        inheriting from it.
+
+        Notes:
+            - Called whenever the privileges or parents of a role change.
+        """
+        roles = [self] + list(Role.objects.filter(id__in=self.get_descendant_ids()))
+        PrivilegeAccess.objects.filter(role_assignment__role__in=roles).delete()
+        accesses = []
+        for role in roles:
+            privilege_ids = role.get_all_privilege_ids()
+            for role_assignment in role.roleassignment_set.all():
+                accesses += role_assignment.get_privilege_accesses(privilege_ids)
+        PrivilegeAccess.objects.bulk_create(accesses)
+
+    def delete(self, **kwargs):
+        """
+        Override of default django method, resynchronizing :class:`PrivilegeAccess` of roles inheriting from current
+        role.
+        """
+        children = list(Role.objects.filter(id__in=self.role_set.values_list('id', flat=True)))
+        super().delete(**kwargs)
+        for child in children:
+            child.sync_privilege_access()
+
     def _invalidate_related_tags(self, history):
         """
         Invalidate cache tags of related models.
@@ -147,6 +182,35 @@ class RoleAssignment(EryModel):
         if not self.user and not self.group:
             raise ValidationError("Either user or group is mandatory.")
 
+    def post_save_clean(self):
+        """
+        Since :class:`PrivilegeAccess` rows reference the current assignment, they must be synchronized post_save.
+        """
+        self.privilegeaccess_set.all().delete()
+        PrivilegeAccess.objects.bulk_create(self.get_privilege_accesses(self.role.get_all_privilege_ids()))
+
+    def get_privilege_accesses(self, privilege_ids):
+        """
+        Build (unsaved) :class:`PrivilegeAccess` instances granted through the current assignment.
+
+        Args:
+            - privilege_ids (Iterable[int]): Ids of :class:`Privilege` instances directly or indirectly owned by role.
+
+        Returns:
+            List[:class:`PrivilegeAccess`]
+        """
+        return [
+            PrivilegeAccess(
+                role_assignment=self,
+                content_type_id=self.content_type_id,
+                object_id=self.object_id,
+                privilege_id=privilege_id,
+                user_id=self.user_id,
+                group_id=self.group_id,
+            )
+            for privilege_id in privilege_ids
+        ]
+
     def _invalidate_related_tags(self, history):
         """
         Invalidate cache tags of related models.
@@ -155,3 +219,24 @@ class RoleAssignment(EryModel):
             self.user.invalidate_tags(history)
         else:
             self.group.invalidate_tags(history)
+
+
+class PrivilegeAccess(models.Model):
+    """
+    Denormalization of :class:`RoleAssignment` instances, with one row per (user or group, object, privilege).
+
+    Notes:
+        - Maintained on save of :class:`RoleAssignment`, and on changes of the privileges or parents of a :class:`Role`.
+        - Rows are deleted along with the :class:`RoleAssignment` they were granted through.
+        - Allows privileges to be checked through a single indexed subquery, without walking the role hierarchy.
+    """
+
+    class Meta:
+        indexes = [models.Index(fields=['content_type', 'privilege', 'object_id'])]
+
+    role_assignment = models.ForeignKey(RoleAssignment, on_delete=models.CASCADE)
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE, related_name='+')
+    object_id = models.PositiveIntegerField()
+    privilege = models.ForeignKey(Privilege, on_delete=models.CASCADE)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, null=True, blank=True, related_name='+')
+    group = models.ForeignKey(Group, on_delete=models.CASCADE, null=True, blank=True, related_name='+')
@@ -2,6 +2,7 @@ import graphene
 from graphene import relay
 from graphql_relay.node.node import from_global_id, to_global_id
 
+from ery_backend.base.registry import get_role
 from ery_backend.base.schema import EryMutationMixin
 from ery_backend.users.models import User
 from ery_backend.users.utils import authenticated_user
@@ -25,7 +26,7 @@ class CreateRole(EryMutationMixin, relay.ClientIDMutation):
     @classmethod
     def mutate_and_get_payload(cls, root, info, **inputs):
         user = authenticated_user(info.context)
-        ownership = Role.objects.get(name="owner")
+        ownership = get_role('owner')
 
         role = Role()
         cls.add_all_attributes(role, inputs)
@@ -9,8 +9,8 @@ from ery_backend.stints.models import StintDefinition
 from ery_backend.users.factories import UserFactory, GroupFactory
 
 from ..factories import RoleAssignmentFactory, PrivilegeFactory, RoleFactory, RoleParentFactory
-from ..models import RoleAssignment
-from ..utils import get_cached_role_ids_by_privilege, grant_role, _get_privilege
+from ..models import PrivilegeAccess, RoleAssignment
+from ..utils import get_cached_role_ids_by_privilege, grant_role
 
 
 class TestRoleAssignment(EryTestCase):
@@ -70,7 +70,6 @@ class TestPrivilegeInvalidation(EryTestCase):
         self.role_2 = RoleFactory()
         self.privilege = PrivilegeFactory()
         self.privilege.role_set.add(self.role)
-        self.get_privilege_key = _get_privilege.cache_key(self.privilege.name)
         self.roles_cache_key = get_cached_role_ids_by_privilege.cache_key(self.privilege.name)
         grant_role(self.role, self.stint, self.user)
 
@@ -87,8 +86,7 @@ class TestPrivilegeInvalidation(EryTestCase):
             StintDefinition.objects.filter_privilege(self.privilege.name, user=self.user)  # confirms no cached result exists
 
     def test_minimal_invalidation_on_privilege_save_signal(self):
-        cache.delete(self.get_privilege_key)  # clear pre-existing
-        cache.delete(self.roles_cache_key)
+        cache.delete(self.roles_cache_key)  # clear pre-existing
         get_cached_role_ids_by_privilege(self.privilege.name)  # minimally generate cache
         self.privilege.comment = 'Another change is a\'comin'
         self.privilege.save()
@@ -223,3 +221,44 @@ class TestRoleParent(EryTestCase):
         # Reference before divergance should trigger an error
         with self.assertRaises(ValidationError):
             RoleParentFactory(role=othergreatgrand, parent=self.parent)
+
+
+class TestPrivilegeAccess(EryTestCase):
+    """
+    Confirm :class:`~ery_backend.roles.models.PrivilegeAccess` follows role assignments, privileges and role parents.
+    """
+
+    def setUp(self):
+        self.user = UserFactory()
+        self.privilege = PrivilegeFactory()
+        self.parent = RoleFactory()
+        self.role = RoleFactory()
+        self.stint_definition = StintDefinitionFactory()
+        self.role_assignment = grant_role(self.role, self.stint_definition, self.user)
+
+    def get_privilege_ids(self):
+        return set(self.role_assignment.privilegeaccess_set.values_list('privilege_id', flat=True))
+
+    def test_privileges(self):
+        self.assertEqual(self.get_privilege_ids(), set())
+        self.role.privileges.add(self.privilege)
+        self.assertEqual(self.get_privilege_ids(), {self.privilege.id})
+        self.role.privileges.remove(self.privilege)
+        self.assertEqual(self.get_privilege_ids(), set())
+
+        # reverse relation
+        self.privilege.role_set.add(self.role)
+        self.assertEqual(self.get_privilege_ids(), {self.privilege.id})
+
+    def test_parents(self):
+        self.parent.privileges.add(self.privilege)
+        role_parent = RoleParentFactory(role=self.role, parent=self.parent)
+        self.assertEqual(self.get_privilege_ids(), {self.privilege.id})
+
+        role_parent.delete()
+        self.assertEqual(self.get_privilege_ids(), set())
+
+    def test_revoke(self):
+        self.role.privileges.add(self.privilege)
+        self.role_assignment.delete()
+        self.assertFalse(PrivilegeAccess.objects.filter(user=self.user).exists())
@@ -13,7 +13,7 @@ from ery_backend.stages.factories import StageDefinitionFactory
 from ery_backend.users.models import User
 from ..factories import PrivilegeFactory, RoleFactory
 from ..models import RoleAssignment, Role, Privilege, RoleParent
-from ..utils import has_privilege, grant_role, revoke_role, get_cached_role_ids_by_privilege
+from ..utils import has_privilege, has_privilege_many, grant_role, revoke_role, get_cached_role_ids_by_privilege
 
 
 class TestPrivileges(EryTestCase):
@@ -204,6 +204,26 @@ class TestPrivileges(EryTestCase):
         self.assertFalse(has_privilege(stage_definition, self.user, self.privilege.name))
         self.assertTrue(has_privilege(stage_definition, superuser, self.privilege.name))
 
+    def test_has_privilege_many(self):
+        """
+        Confirm privileges of objects of several models are checked in one query per privilege ancestor model.
+        """
+        stage_definitions = [StageDefinitionFactory() for _ in range(3)]
+        module_definitions = [stage_definition.module_definition for stage_definition in stage_definitions]
+        grant_role(self.role, module_definitions[0], self.user)
+        self.user.groups.add(self.group)
+        grant_role(self.role, module_definitions[1], group=self.group)
+        has_privilege_many(module_definitions, self.user, self.privilege.name)  # warm up privilege lookup
+
+        with self.assertNumQueries(2):
+            results = has_privilege_many(stage_definitions + module_definitions, self.user, self.privilege.name)
+        self.assertEqual(results, [True, True, False, True, True, False])
+
+        # Matches has_privilege
+        self.assertEqual(
+            results, [has_privilege(obj, self.user, self.privilege.name) for obj in stage_definitions + module_definitions]
+        )
+
 
 @unittest.skip('Address in issue #710')
 class TestCaching(EryTestCase):
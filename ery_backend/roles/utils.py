@@ -1,15 +1,18 @@
+from collections import defaultdict
 import logging
 
 from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import Q
 
 import reversion
 
-from ery_backend.base.cache import invalidate_tag, ery_cache, tag_key
+from ery_backend.base.cache import invalidate_tag
 from ery_backend.base.models import EryFile
-from ery_backend.base.exceptions import EryTypeError
+from ery_backend.base.exceptions import EryTypeError, EryValidationError
+from ery_backend.base.registry import get_privilege, get_role
 from ery_backend.users.models import User, Group
 
-from .models import Role, RoleAssignment, Privilege
+from .models import Role, RoleAssignment, Privilege, PrivilegeAccess
 
 
 logger = logging.getLogger(__name__)
@@ -82,11 +85,12 @@ def grant_role(role, obj, user=None, group=None, granter=None):
 
     for tag in tags:
         invalidate_tag(tag)
+    _update_owner_search_document(role, obj)
     return role_assignment
 
 
 def grant_ownership(obj, user=None, group=None, granter=None):
-    ownership = Role.objects.get(name="owner")
+    ownership = get_role('owner')
     return grant_role(ownership, obj, user=user, group=group, granter=granter)
 
 
@@ -126,6 +130,13 @@ def revoke_role(role, obj, user=None, group=None, revoker=None):
 
     for tag in tags:
         invalidate_tag(tag)
+    _update_owner_search_document(role, obj)
+
+
+def _update_owner_search_document(role, obj):
+    # Search documents of files include their owner
+    if role.name == 'owner' and hasattr(obj, 'update_search_document'):
+        obj.update_search_document()
 
 
 def _get_privilege_obj(obj):
@@ -134,18 +145,12 @@ def _get_privilege_obj(obj):
     return obj
 
 
-@ery_cache
 def _get_privilege(privilege_name):
     try:
-        privilege = Privilege.objects.get(name=privilege_name)
+        return get_privilege(privilege_name)
     except Privilege.DoesNotExist:
         raise ObjectDoesNotExist('Privilege {}: Does Not Exist'.format(privilege_name))
 
-    cache_key = _get_privilege.cache_key(privilege_name)
-    tag_key(privilege.get_cache_tag(), cache_key)
-
-    return privilege
-
 
 def has_privilege(obj, user, privilege_name):
     """
@@ -169,41 +174,141 @@ def has_privilege(obj, user, privilege_name):
     if privilege_name == 'read' and isinstance(obj, EryFile) and obj.published:
         return True
 
-    result = False
-
     privilege = _get_privilege(privilege_name)
     privilege_obj = _get_privilege_obj(obj)
-    tags = set((privilege.get_cache_tag(),))  # Tag result to privilege cache_key
 
-    # Filter assignments of same class model for privilege
-    role_assignment_qs = RoleAssignment.objects.filter(
-        content_type=privilege_obj.get_content_type(), object_id=privilege_obj.id
-    )
+    return PrivilegeAccess.objects.filter(
+        Q(user=user) | Q(group__in=user.groups.values('id')),
+        content_type=privilege_obj.get_content_type(),
+        object_id=privilege_obj.id,
+        privilege=privilege,
+    ).exists()
 
-    # Check if any assignments belong to user
-    for role_assignment in role_assignment_qs.filter(user=user).select_related('role'):
-        if role_assignment.role.has_privilege(privilege_name):
-            result = True
-            tag = role_assignment.role.get_cache_tag()
-            tags.add(tag)
-            # Results should be invalidated if role tag is invalidated
-            break
-
-    if result is False:
-        # Check if any assignments belong to user's groups
-        for group in user.groups.all():
-            for role_assignment in role_assignment_qs.filter(group=group).select_related('role'):
-                if role_assignment.role.has_privilege(privilege_name):
-                    result = True
-                    tag = role_assignment.role.get_cache_tag()
-                    tags.add(tag)
-                    break
 
-    # XXX: Address in issue #783
-    # cache_key = has_privilege.cache_key(obj, user, privilege_name)
-    # tag_key(tags, cache_key)
+def has_privilege_many(objs, user, privilege_name):
+    """
+    Batched version of :func:`has_privilege`.
+
+    Args:
+        - objs (List[:class:`~ery_backend.base.models.EryModel`])
+        - user (:class:`~ery_backend.users.models.User`)
+        - privilege_name (str)
+
+    Notes:
+        - Privilege ancestors of descendants are resolved with one query per model.
+        - Privileges are then checked with one query per privilege ancestor content type.
+
+    Returns:
+        List[bool]: Whether privilege is granted, in the order of objs.
+    """
+    if not isinstance(user, User):
+        raise EryTypeError("Failed to search for matching privileges." "Second argument needs to be of type User.")
+    if not isinstance(privilege_name, str):
+        raise EryTypeError("Failed to search for matching privileges." "Third argument needs to be of type str.")
+
+    if user.is_superuser:
+        return [True for _ in objs]
 
-    return result
+    privilege = _get_privilege(privilege_name)
+
+    # Map each obj to the (class, id) of its privilege ancestor
+    objs_by_model = defaultdict(list)
+    for obj in objs:
+        objs_by_model[obj.__class__].append(obj)
+    ancestors = {}
+    for model_cls, model_objs in objs_by_model.items():
+        if model_cls.parent_field is None:
+            ancestors.update({(model_cls, obj.pk): (model_cls, obj.pk) for obj in model_objs})
+        elif isinstance(model_cls.parent_field, str):
+            ancestor_cls = model_cls.get_privilege_ancestor_cls()
+            ancestor_path = '{}__id'.format(model_cls.get_privilege_ancestor_filter_path())
+            ancestor_ids = model_cls.objects.filter(id__in=[obj.pk for obj in model_objs]).values_list('id', ancestor_path)
+            ancestors.update({(model_cls, obj_id): (ancestor_cls, ancestor_id) for obj_id, ancestor_id in ancestor_ids})
+        else:
+            # Parent is determined per instance
+            for obj in model_objs:
+                privilege_obj = _get_privilege_obj(obj)
+                ancestors[(model_cls, obj.pk)] = (privilege_obj.__class__, privilege_obj.pk)
+
+    ancestor_ids_by_cls = defaultdict(set)
+    for ancestor_cls, ancestor_id in ancestors.values():
+        ancestor_ids_by_cls[ancestor_cls].add(ancestor_id)
+    granted = set()
+    for ancestor_cls, ancestor_ids in ancestor_ids_by_cls.items():
+        object_ids = PrivilegeAccess.objects.filter(
+            Q(user=user) | Q(group__in=user.groups.values('id')),
+            content_type=ancestor_cls.get_content_type(),
+            object_id__in=ancestor_ids,
+            privilege=privilege,
+        ).values_list('object_id', flat=True)
+        granted.update((ancestor_cls, object_id) for object_id in object_ids)
+
+    return [
+        (privilege_name == 'read' and isinstance(obj, EryFile) and obj.published)
+        or ancestors.get((obj.__class__, obj.pk)) in granted
+        for obj in objs
+    ]
+
+
+def get_privileged_ids(model_cls, privilege_name, user=None, group=None):
+    """
+    Get a subquery of ids of instances of model_cls on which privilege is granted to user (directly or through their
+    groups) or group.
+
+    Args:
+        - model_cls (:class:`~ery_backend.base.models.EryModel`): Privilege ancestor class.
+        - privilege_name (str)
+        - user (Optional[:class:`~ery_backend.users.models.User`])
+        - group (Optional[:class:`~ery_backend.users.models.Group`])
+
+    Notes:
+        - Evaluated by the database as part of the outer query, such that ids are never materialized.
+
+    Raises:
+        - :class:`~ery_backend.base.exceptions.EryValidationError`: Raised on invalid use/combination of user and/or group.
+
+    Returns:
+        :class:`django.db.models.query.QuerySet`
+    """
+    from ery_backend.users.models import User, Group
+
+    if bool(user) == bool(group):
+        raise EryValidationError(
+            "Either a user OR group is required to execute get_privileged_ids for: {}, with privilege: {}, user: {},"
+            " group: {}".format(model_cls, privilege_name, user, group)
+        )
+    if not isinstance(user, User) and not isinstance(group, Group):
+        raise EryValidationError(
+            "Either a user of type: {}, or group of type: {}, can be used to execute get_privileged_ids for: {},"
+            " with privilege: {}, user: {}, group: {}".format(User, Group, model_cls, privilege_name, user, group)
+        )
+
+    accesses = PrivilegeAccess.objects.filter(
+        content_type=model_cls.get_content_type(), privilege=_get_privilege(privilege_name)
+    )
+    if user:
+        accesses = accesses.filter(Q(user=user) | Q(group__in=user.groups.values('id')))
+    else:
+        accesses = accesses.filter(group=group)
+    return accesses.values('object_id')
+
+
+def privilege_access_handler(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Keep :class:`~ery_backend.roles.models.PrivilegeAccess` in sync with the privileges and parents of
+    :class:`~ery_backend.roles.models.Role` instances. Used in signals.py
+    """
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        instance.sync_privilege_access()
+    elif action == 'post_clear':
+        # Former relations are unknown once cleared
+        for role in Role.objects.filter(parents__isnull=True):
+            role.sync_privilege_access()
+    else:
+        for role in Role.objects.filter(id__in=pk_set):
+            role.sync_privilege_access()
 
 
 def get_cached_role_ids_by_privilege(privilege_name):
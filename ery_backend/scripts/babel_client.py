@@ -1,24 +1,193 @@
+import hashlib
+import json
+import logging
+import re
+
 import grpc
 
 from django.conf import settings
+from django.core.cache import cache
 
-from .grpc.babel_pb2 import ES6Code, ES6CodeBundle
+from .grpc.babel_pb2 import ES5Code, ES6Code, ES6CodeBundle
 from .grpc.babel_pb2_grpc import BabelStub
 
+logger = logging.getLogger(__name__)
 
-def convert_es6_code(code):
-    channel = grpc.insecure_channel(settings.ERY_BABEL_HOSTPORT)
-    stub = BabelStub(channel)
-    es6code = ES6Code(code=code)
-    return stub.Convert(es6code)
+# Calls left by Babel's transform of ES6 imports to CommonJS
+REQUIRE_PATTERN = re.compile(r"""\brequire\((["'])([^"']+)\1\)""")
 
+# Loads the modules of a spliced bundle, requiring packages from the vendor bundle
+BUNDLE_RUNTIME = """(function (modules, entry) {
+  var loaded = {};
+  function resolve(from, name) {
+    var path = from.split('/').slice(0, -1);
+    name.split('/').forEach(function (part) {
+      if (part === '..') {
+        path.pop();
+      } else if (part !== '.') {
+        path.push(part);
+      }
+    });
+    path = path.join('/');
+    return /\\.js$/.test(path) ? path : path + '.js';
+  }
+  function load(name) {
+    if (!loaded[name]) {
+      var module = (loaded[name] = { exports: {} });
+      modules[name](
+        function (dependency) {
+          return dependency.charAt(0) === '.' ? load(resolve(name, dependency)) : window.eryVendor[dependency];
+        },
+        module,
+        module.exports
+      );
+    }
+    return loaded[name].exports;
+  }
+  load(entry);
+})({%s}, %s);"""
 
-def convert_es6_bundle(bundle):
+
+def get_babel_stub():
     channel = grpc.insecure_channel(settings.ERY_BABEL_HOSTPORT)
-    stub = BabelStub(channel)
+    return BabelStub(channel)
+
+
+def convert_es6_code(code, name=''):
+    es6code = ES6Code(name=name, code=code)
+    return get_babel_stub().Convert(es6code)
+
+
+def get_file_digest(name, code):
+    """
+    Address an ES6 file by its content.
+
+    Args:
+        - name (str): File name, by which other files import it.
+        - code (str): ES6 code.
+
+    Returns:
+        str
+    """
+    return hashlib.sha256(f"{name}\0{code}".encode('utf-8')).hexdigest()
+
+
+def get_bundle_digest(bundle):
+    """
+    Address an ES6 bundle by its content.
+
+    Args:
+        - bundle (Dict[str, str]): ES6 code by file name.
+
+    Returns:
+        str: Digest over the digests of each file, independent of file order.
+    """
+    file_digests = sorted(get_file_digest(name, code) for name, code in bundle.items())
+    return hashlib.sha256("".join(file_digests).encode('utf-8')).hexdigest()
+
+
+def convert_es6_files(files):
+    """
+    Transpile ES6 files to ES5 code, each on its own.
+
+    Args:
+        - files (Dict[str, str]): ES6 code by file name.
+
+    Notes:
+        - Results are cached (in the cache shared by all instances) by :func:`get_file_digest`, such that only files
+          changed since any previous call reach the Babel service.
+        - Results with errors are not cached.
+
+    Returns:
+        Dict[str, :class:`ES5Code`]: ES5 code by file name.
+    """
+    cache_keys = {name: f"BABEL:FILE:{get_file_digest(name, code)}" for name, code in files.items()}
+    cached = cache.get_many(list(cache_keys.values()))
+    es5codes = {name: ES5Code.FromString(cached[key]) for name, key in cache_keys.items() if key in cached}
+    logger.debug("Returning cached ES5 code for %s of %s files", len(es5codes), len(files))
+
+    stub = None
+    converted = {}
+    for name in [name for name in files if name not in es5codes]:
+        if stub is None:
+            stub = get_babel_stub()
+        es5codes[name] = stub.Convert(ES6Code(name=name, code=files[name]))
+        if not es5codes[name].error:
+            converted[cache_keys[name]] = es5codes[name].SerializeToString()
+    if converted:
+        cache.set_many(converted, settings.ERY_BABEL_CACHE_TIMEOUT)
+    return es5codes
+
+
+def convert_vendor_bundle(packages):
+    """
+    Bundle packages required by ES5 files as `window.eryVendor`.
+
+    Args:
+        - packages (Iterable[str]): Package names, as required.
+
+    Notes:
+        - Results are cached (in the cache shared by all instances) by :func:`get_bundle_digest`, such that the service
+          only bundles packages again when their set changes.
+
+    Returns:
+        :class:`ES5Code`
+    """
+    requires = ", ".join(f"{json.dumps(package)}: require({json.dumps(package)})" for package in sorted(packages))
+    bundle = {'index.js': f"window.eryVendor = {{{requires}}};"}
+    cache_key = f"BABEL:{get_bundle_digest(bundle)}"
+    cached = cache.get(cache_key)
+    if cached is not None:
+        logger.debug("Returning cached ES5 code for key: %s", cache_key)
+        return ES5Code.FromString(cached)
 
     es6code = ES6CodeBundle(bundle=[ES6Code(name=name, code=code) for name, code in bundle.items()])
-    return stub.ConvertBundle(es6code)
+    es5code = get_babel_stub().ConvertBundle(es6code)
+    if not es5code.error:
+        cache.set(cache_key, es5code.SerializeToString(), settings.ERY_BABEL_CACHE_TIMEOUT)
+    return es5code
+
+
+def convert_es6_bundle(bundle, entry='index.js'):
+    """
+    Transpile and bundle ES6 files to ES5 code.
+
+    Args:
+        - bundle (Dict[str, str]): ES6 code by file name.
+        - entry (str): Name of the file run by the bundle.
+
+    Notes:
+        - Each file is transpiled through :func:`convert_es6_files`, such that only changed files reach the Babel
+          service, and the ES5 code is spliced into one bundle as CommonJS modules. Packages they require are loaded
+          from :func:`convert_vendor_bundle`.
+        - On any error, the :class:`ES5Code` of the first file failing to transpile is returned, with the file name
+          prepended to its error.
+
+    Returns:
+        :class:`ES5Code`
+    """
+    es5codes = convert_es6_files(bundle)
+    for name in sorted(es5codes):
+        if es5codes[name].error:
+            es5code = ES5Code()
+            es5code.CopyFrom(es5codes[name])
+            es5code.error = f"{name}: {es5code.error}"
+            return es5code
+
+    packages = {
+        match.group(2)
+        for es5code in es5codes.values()
+        for match in REQUIRE_PATTERN.finditer(es5code.code)
+        if not match.group(2).startswith('.')
+    }
+    vendor_code = convert_vendor_bundle(packages)
+    if vendor_code.error:
+        return vendor_code
+
+    modules = ",\n".join(
+        f"{json.dumps(name)}: function (require, module, exports) {{\n{es5codes[name].code}\n}}" for name in sorted(es5codes)
+    )
+    return ES5Code(code=f"{vendor_code.code}\n{BUNDLE_RUNTIME % (modules, json.dumps(entry))}")
 
 
 if __name__ == '__main__':
@@ -0,0 +1,88 @@
+from unittest import mock
+
+from django.utils.crypto import get_random_string
+
+from ery_backend.base.testcases import EryTestCase
+
+from ..babel_client import convert_es6_bundle, convert_es6_files, get_bundle_digest
+from ..grpc.babel_pb2 import ES5Code
+
+
+def convert(es6code):
+    """Stands in for the Convert method of the Babel service"""
+    if 'error' in es6code.code:
+        return ES5Code(error='Unexpected token')
+    return ES5Code(code=es6code.code.replace('import App from ', 'var App = require(').replace(';', ');', 1))
+
+
+class TestBabelClient(EryTestCase):
+    def setUp(self):
+        # Unique code and packages, such that nothing is cached by earlier tests
+        self.suffix = get_random_string()
+        self.bundle = {
+            'index.js': f"import App from './App'; // {self.suffix}",
+            'Widget/Button.js': f"import App from '../App'; // {self.suffix}",
+            'App.js': f"import App from 'react-{self.suffix}'; // {self.suffix}",
+        }
+
+    def test_get_bundle_digest(self):
+        """Digests depend on file names and content, not on file order"""
+        digest = get_bundle_digest(self.bundle)
+        self.assertEqual(digest, get_bundle_digest(dict(reversed(list(self.bundle.items())))))
+        self.assertNotEqual(digest, get_bundle_digest({**self.bundle, 'App.js': "export default () => 1;"}))
+        self.assertNotEqual(digest, get_bundle_digest({'index.js': self.bundle['index.js'], 'Main.js': self.bundle['App.js']}))
+
+    @mock.patch('ery_backend.scripts.babel_client.BabelStub')
+    def test_convert_es6_files_cached(self, mock_stub):
+        """Only files changed since an earlier call are transpiled"""
+        mock_stub.return_value.Convert.side_effect = convert
+
+        es5codes = convert_es6_files(self.bundle)
+        self.assertEqual(es5codes['index.js'].code, f"var App = require('./App'); // {self.suffix}")
+        self.assertEqual(mock_stub.return_value.Convert.call_count, 3)
+
+        self.assertEqual(convert_es6_files(dict(self.bundle)), es5codes)
+        self.assertEqual(mock_stub.return_value.Convert.call_count, 3)
+
+        es5codes = convert_es6_files({**self.bundle, 'App.js': f"export default () => null; // {self.suffix}"})
+        self.assertEqual(es5codes['App.js'].code, f"export default () => null); // {self.suffix}")
+        self.assertEqual(mock_stub.return_value.Convert.call_count, 4)
+        self.assertEqual(mock_stub.return_value.Convert.call_args[0][0].name, 'App.js')
+
+    @mock.patch('ery_backend.scripts.babel_client.BabelStub')
+    def test_convert_es6_files_errors_not_cached(self, mock_stub):
+        """Files failing to transpile are sent again"""
+        mock_stub.return_value.Convert.side_effect = convert
+        bundle = {'App.js': f"error // {self.suffix}"}
+
+        self.assertEqual(convert_es6_files(bundle)['App.js'].error, 'Unexpected token')
+        convert_es6_files(bundle)
+        self.assertEqual(mock_stub.return_value.Convert.call_count, 2)
+
+    @mock.patch('ery_backend.scripts.babel_client.BabelStub')
+    def test_convert_es6_bundle(self, mock_stub):
+        """Transpiled files are spliced into one bundle, with the packages they require"""
+        mock_stub.return_value.Convert.side_effect = convert
+        mock_stub.return_value.ConvertBundle.return_value = ES5Code(code='var vendor;')
+
+        es5code = convert_es6_bundle(self.bundle)
+        self.assertFalse(es5code.error)
+        self.assertTrue(es5code.code.startswith('var vendor;\n'))
+        for name in self.bundle:
+            self.assertIn(f'"{name}": function (require, module, exports) {{', es5code.code)
+        self.assertIn(f"var App = require('../App'); // {self.suffix}", es5code.code)
+        self.assertTrue(es5code.code.endswith('}, "index.js");'))
+
+        vendor_bundle = mock_stub.return_value.ConvertBundle.call_args[0][0].bundle
+        self.assertEqual(len(vendor_bundle), 1)
+        package = f"react-{self.suffix}"
+        self.assertEqual(vendor_bundle[0].code, f'window.eryVendor = {{"{package}": require("{package}")}};')
+
+    @mock.patch('ery_backend.scripts.babel_client.BabelStub')
+    def test_convert_es6_bundle_error(self, mock_stub):
+        """Errors name the file failing to transpile"""
+        mock_stub.return_value.Convert.side_effect = convert
+
+        es5code = convert_es6_bundle({**self.bundle, 'App.js': f"error // {self.suffix}"})
+        self.assertEqual(es5code.error, 'App.js: Unexpected token')
+        mock_stub.return_value.ConvertBundle.assert_not_called()
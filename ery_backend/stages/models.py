@@ -1,3 +1,4 @@
+from django.core.cache import cache
 from django.db import models
 from django.db.utils import IntegrityError
 from django.utils.translation import gettext_lazy as _
@@ -6,8 +7,10 @@ from languages_plus.models import Language
 from model_utils import Choices
 import reversion
 
+from ery_backend.base.cache import set_tagged
 from ery_backend.base.mixins import BlockHolderMixin, ReactNamedMixin, TranslationHolderMixin
-from ery_backend.base.models import EryPrivileged, EryNamedPrivileged
+from ery_backend.base.models import EryPrivileged, EryNamedPrivileged, RuntimeModelMixin
+from ery_backend.scripts import engine_client
 from ery_backend.templates.models import Template
 from ery_backend.modules.models import ModuleDefinitionNamedModel, ModuleDefinitionWidget
 
@@ -206,7 +209,7 @@ class StageTemplate(BlockHolderMixin, EryPrivileged):
         Returns:
             :class:`django.db.models.query.Queryset`
         """
-        from ery_backend.widgets.models import Widget, WidgetConnection
+        from ery_backend.widgets.models import Widget
 
         widget_ids = set()
         for form in self.module_definition.forms.all():
@@ -216,17 +219,7 @@ class StageTemplate(BlockHolderMixin, EryPrivileged):
         widget_ids.update(self.get_module_widgets().values_list("widget__id", flat=True))
         widget_ids.update(self.get_template_widgets().values_list("widget__id", flat=True))
 
-        widget_dependency_ids = set(
-            WidgetConnection.objects.filter(originator__id__in=widget_ids).values_list("target__id", flat=True)
-        )
-
-        prev_widget_dependency_ids = None
-        while prev_widget_dependency_ids != widget_dependency_ids:
-            prev_widget_dependency_ids = widget_dependency_ids
-            widget_dependency_ids = widget_dependency_ids.union(
-                WidgetConnection.objects.filter(originator__id__in=widget_dependency_ids).values_list("target__id", flat=True)
-            )
-        widget_ids = widget_ids.union(widget_dependency_ids)
+        widget_ids.update(Widget.get_nested_connected_widget_ids(widget_ids))
 
         return Widget.objects.filter(id__in=widget_ids, frontend=self.template.frontend)
 
@@ -254,14 +247,6 @@ class StageTemplate(BlockHolderMixin, EryPrivileged):
     def render_web(self, language):
         from ery_backend.frontends.renderers import ReactStageRenderer
 
-        template_widgets = set()
-
-        current_template = self.template
-        template_widgets.update(current_template.template_widgets.all())
-        while current_template.parental_template_id:
-            current_template = current_template.parental_template
-            template_widgets.update(current_template.template_widgets.all())
-
         return ReactStageRenderer(self, language).render()
 
     def render_sms(self, hand):  # Should not need hand, or render_web should use hand too.
@@ -357,12 +342,7 @@ class StageDefinition(ModuleDefinitionNamedModel, ReactNamedMixin):
 
         template = self.templates.get(frontend=frontend)
 
-        template_widget_ids = list(template.template_widgets.values_list('id', flat=True))
-        while template.parental_template:
-            template = template.parental_template
-            template_widget_ids += list(template.template_widgets.values_list('id', flat=True))
-
-        return TemplateWidget.objects.filter(id__in=template_widget_ids)
+        return TemplateWidget.objects.filter(template_id__in=template.get_ancestor_ids([template.id]))
 
     def get_module_widgets(self, frontend):
         module_definition_widget_ids = self.module_definition.module_widgets.values_list('id', flat=True)
@@ -447,7 +427,7 @@ class StageDefinition(ModuleDefinitionNamedModel, ReactNamedMixin):
                     hand.current_breadcrumb = previous_breadcrumb
                 else:
                     hand.current_breadcrumb = None
-                hand.save()
+                hand.save(update_fields=['current_breadcrumb'])
 
         def _update_breadcrumb(breadcrumb):
             _update_hand(breadcrumb)
@@ -491,21 +471,70 @@ class StageDefinition(ModuleDefinitionNamedModel, ReactNamedMixin):
         """
         Instatiate a :class:`Stage` instance.
         """
-        stage = Stage.objects.create(stage_definition=self)
+        stage = Stage(stage_definition=self)
+        # A new runtime instance has no cached content or ancestors to touch, and only needs its INSERT
+        Stage.objects.bulk_create([stage])
         return stage
 
+    def get_redirect_program(self):
+        """
+        Compile the conditions of :class:`~ery_backend.stages.models.Redirect` instances into one JavaScript expression,
+        evaluating to the index of the first match, or -1.
+
+        Notes:
+            - Redirects following one without a condition can never match, and are left out.
+            - Cached per version of the parental :class:`~ery_backend.modules.models.ModuleDefinition`, and invalidated
+              on changes to the :class:`StageDefinition` (e.g., of its redirects) or
+              :class:`~ery_backend.modules.models.ModuleDefinition` (e.g., of its conditions).
+
+        Returns:
+            Tuple(List[int], Optional[str]): Ids of next_stage_definition in order, and the expression, which is None if
+            the first redirect has no condition.
+        """
+        module_definition = self.module_definition
+        cache_key = f'RDP:{self.id}:{module_definition.version}'
+        program = cache.get(cache_key)
+        if program is None:
+            next_stage_definition_ids = []
+            conditions = []
+            for redirect in self.redirects.select_related('condition').order_by('order'):
+                next_stage_definition_ids.append(redirect.next_stage_definition_id)
+                if redirect.condition is None:
+                    break
+                conditions.append(redirect.condition.as_javascript())
+            # A trailing redirect without a condition matches if no other does
+            if len(conditions) < len(next_stage_definition_ids):
+                expression = str(len(next_stage_definition_ids) - 1)
+            else:
+                expression = '-1'
+            # Conditional expressions are evaluated in order, up to the first match
+            for index in reversed(range(len(conditions))):
+                expression = f'({conditions[index]}) ? {index} : {expression}'
+            program = (next_stage_definition_ids, expression if conditions else None)
+            set_tagged(cache_key, program, [self.get_cache_tag(), module_definition.get_cache_tag()])
+        return program
+
     def get_redirect_stage(self, hand):
         """
         Get next_stage_definition for first matching :class:`~ery_backend.stages.models.Redirect`.
 
+        Notes:
+            - The conditions of all redirects are evaluated in one call to the EryEngine (see
+              :py:meth:`get_redirect_program`).
+
         Returns:
             :class:`StageDefinition`
         """
-        redirects = self.redirects.select_related('condition').order_by('order').all()
-        for redirect in redirects:
-            if not redirect.condition or redirect.condition.evaluate(hand):
-                return redirect.next_stage_definition
-        raise StageDefinition.DoesNotExist("No matching redirect exists or passes the condition requirements to be used.")
+        next_stage_definition_ids, expression = self.get_redirect_program()
+        if not next_stage_definition_ids:
+            index = -1
+        elif expression is None:
+            index = 0
+        else:
+            index = int(engine_client.evaluate_without_side_effects(f'{self}:redirects', expression, hand))
+        if index < 0:
+            raise StageDefinition.DoesNotExist("No matching redirect exists or passes the condition requirements to be used.")
+        return StageDefinition.objects.get(id=next_stage_definition_ids[index])
 
     def submit(self, hand):
         """
@@ -517,15 +546,13 @@ class StageDefinition(ModuleDefinitionNamedModel, ReactNamedMixin):
         """
         if self.redirect_on_submit:
             if self.breadcrumb_type == self.BREADCRUMB_TYPE_CHOICES.all and hand.current_breadcrumb.next_breadcrumb:
-                hand.set_stage(hand.current_breadcrumb.next_breadcrumb.stage)
-                hand.set_breadcrumb(hand.current_breadcrumb.next_breadcrumb)
+                next_breadcrumb = hand.current_breadcrumb.next_breadcrumb
+                hand.transition(next_breadcrumb.stage, breadcrumb=next_breadcrumb)
             else:
-                hand.set_stage(stage_definition=self.get_redirect_stage(hand))
-                new_breadcrumb = hand.create_breadcrumb(hand.stage)
-                hand.set_breadcrumb(new_breadcrumb)
+                hand.transition(stage_definition=self.get_redirect_stage(hand), create_breadcrumb=True)
 
 
-class Stage(EryPrivileged):
+class Stage(RuntimeModelMixin, EryPrivileged):
     """
     Instantiation of :class:`StageDefinition` for use in a running :class:`~ery_backend.stints.models.Stint`.
 
@@ -550,7 +577,7 @@ class Stage(EryPrivileged):
         if self.stage_definition.pre_action is not None:
             self.stage_definition.pre_action.run(hand)
             self.preaction_started = True
-            self.save()
+            self.save(update_fields=['preaction_started'])
 
     def render(self, hand):
         """
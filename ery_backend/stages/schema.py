@@ -48,15 +48,14 @@ class StageTemplateNode(RoleAssignmentNodeMixin, EryObjectType):
         else:
             language = from_global_id(language)[1]
 
-        block_infos = self.get_blocks(self.template.frontend, language)
         return [
             {
-                "name": name,
-                "content": info["content"],
-                "block_type": info["block_type"],
-                "ancestor_template_id": info["ancestor"].id if info["block_type"] == "TemplateBlock" else None,
+                "name": block_info.name,
+                "content": block_info.content,
+                "block_type": block_info.block_type,
+                "ancestor_template_id": block_info.ancestor_id if block_info.block_type == "TemplateBlock" else None,
             }
-            for name, info in block_infos.items()
+            for block_info in self.get_block_catalog(self.template.frontend_id, getattr(language, 'pk', language))
         ]
 
     def resolve_preview(self, info, language=None):
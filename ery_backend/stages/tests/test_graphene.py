@@ -1,4 +1,6 @@
 # pylint:disable=too-many-lines
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 import graphene
 from graphql_relay.node.node import from_global_id
 
@@ -117,6 +119,28 @@ class TestReadStageDefinition(GQLTestCase):
         self.fail_on_errors(result)
         self.assertEqual(len(result["data"]["allStageDefinitions"]["edges"]), 1)
 
+    def test_read_all_query_count(self):
+        """Queries of allStageDefinitions do not grow with the number of stage definitions"""
+        query = """{allStageDefinitions{ edges { node { id name moduleDefinition { name primaryFrontend { name }}}}}}"""
+
+        def add_stage_definitions(n):
+            for _ in range(n):
+                stage_definition = StageDefinitionFactory(module_definition=ModuleDefinitionFactory())
+                grant_role(self.owner["role"], stage_definition.module_definition, self.owner["user"])
+
+        def execute():
+            with CaptureQueriesContext(connection) as queries:
+                result = self.gql_client.execute(query, context_value=self.gql_client.get_context(user=self.owner["user"]))
+            self.fail_on_errors(result)
+            return result, len(queries.captured_queries)
+
+        add_stage_definitions(2)
+        _, few_query_count = execute()
+        add_stage_definitions(5)
+        result, many_query_count = execute()
+        self.assertEqual(len(result["data"]["allStageDefinitions"]["edges"]), 7)
+        self.assertEqual(many_query_count, few_query_count)
+
 
 class TestCreateStageDefinition(GQLTestCase):
     node_name = "StageDefinitionNode"
@@ -279,24 +279,47 @@ class TestRedirectFlow(EryTestCase):
         """
         self.assertEqual(self.stage_definition_1.get_redirect_stage(self.hand), self.redirect_1.next_stage_definition)
 
-    @mock.patch('ery_backend.conditions.models.Condition.evaluate')
+    @mock.patch('ery_backend.scripts.engine_client.evaluate_without_side_effects')
     def test_get_redirect_stage_with_conditions(self, mock_eval):
-        mock_eval.return_value = False
-        self.redirect_1.condition = ConditionFactory(module_definition=self.module_definition)
+        mock_eval.return_value = 1
+        condition = ConditionFactory(module_definition=self.module_definition)
+        self.redirect_1.condition = condition
         self.redirect_1.save()
         self.assertEqual(self.stage_definition_1.get_redirect_stage(self.hand), self.redirect_2.next_stage_definition)
+        # One evaluation, falling back on the unconditional redirect
+        mock_eval.assert_called_once()
+        self.assertEqual(mock_eval.call_args[0][1], f'({condition.as_javascript()}) ? 0 : 1')
 
-    @mock.patch('ery_backend.conditions.models.Condition.evaluate')
+    @mock.patch('ery_backend.scripts.engine_client.evaluate_without_side_effects')
     def test_get_redirect_stage_errors(self, mock_eval):
         """
         No match found.
         """
-        mock_eval.return_value = False
+        mock_eval.return_value = -1
+        conditions = []
         for redirect in (self.redirect_1, self.redirect_2):
             redirect.condition = ConditionFactory(module_definition=self.hand.current_module_definition)
             redirect.save()
+            conditions.append(redirect.condition.as_javascript())
         with self.assertRaises(ObjectDoesNotExist):
             self.stage_definition_1.get_redirect_stage(self.hand)
+        self.assertEqual(mock_eval.call_args[0][1], f'({conditions[0]}) ? 0 : ({conditions[1]}) ? 1 : -1')
+
+    def test_redirect_program_invalidation(self):
+        """
+        Confirm the cached program changes with redirects.
+        """
+        self.assertEqual(
+            self.stage_definition_1.get_redirect_program(),
+            ([self.stage_definition_2.id], None),
+        )
+        condition = ConditionFactory(module_definition=self.module_definition)
+        self.redirect_1.condition = condition
+        self.redirect_1.save()
+        self.assertEqual(
+            self.stage_definition_1.get_redirect_program(),
+            ([self.stage_definition_2.id, self.stage_definition_3.id], f'({condition.as_javascript()}) ? 0 : 1'),
+        )
 
 
 class TestAddBreadcrumb(EryTestCase):
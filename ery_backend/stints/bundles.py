@@ -0,0 +1,154 @@
+"""
+Bundles:
+    Stint pages (see :class:`~ery_backend.frontends.renderers.ReactStintRenderer`) prebuilt as immutable artifacts,
+    addressed by the sha256 of their content and stored alongside gzip and brotli encoded variants. A pointer per
+    (stint definition, language, vendor, marketplace) refers to the current artifact. Pointers are dropped with the
+    cache tag of their :class:`~ery_backend.stints.models.StintDefinition`, upon which the next request rebuilds them.
+"""
+import gzip
+import hashlib
+import logging
+
+import brotli
+from django.conf import settings
+from django.core.cache import cache
+
+from ery_backend.base.cache import set_tagged
+
+logger = logging.getLogger(__name__)
+
+# Supported content encodings, by order of preference
+ENCODINGS = ('br', 'gzip', 'identity')
+
+
+def _get_pointer_key(stint_definition, language, vendor, is_marketplace):
+    language_id = getattr(language, 'pk', language)
+    vendor_id = vendor.pk if vendor else None
+    return f"BUNDLE:{stint_definition.get_cache_key()}:{language_id}:{vendor_id}:{int(is_marketplace)}"
+
+
+def _get_artifact_key(digest, encoding):
+    return f"BUNDLE_ARTIFACT:{digest}:{encoding}"
+
+
+def build_bundle(stint_definition, language, vendor=None, is_marketplace=False):
+    """
+    Render and store the page of a :class:`~ery_backend.stints.models.StintDefinition`.
+
+    Args:
+        - stint_definition (:class:`~ery_backend.stints.models.StintDefinition`)
+        - language (:class:`Language`)
+        - vendor (Optional[:class:`~ery_backend.vendors.models.Vendor`])
+        - is_marketplace (bool)
+
+    Notes:
+        - Artifacts are immutable, such that an unchanged page is stored (and compressed) once.
+
+    Returns:
+        str: Digest of the page.
+    """
+    from ery_backend.frontends.renderers import ReactStintRenderer
+
+    content = ReactStintRenderer(stint_definition, language, vendor, is_marketplace).render().encode('utf-8')
+    digest = hashlib.sha256(content).hexdigest()
+    timeout = settings.ERY_BUNDLE_CACHE_TIMEOUT
+    if cache.get(_get_artifact_key(digest, 'identity')) is None:
+        cache.set_many(
+            {
+                _get_artifact_key(digest, 'identity'): content,
+                _get_artifact_key(digest, 'gzip'): gzip.compress(content),
+                _get_artifact_key(digest, 'br'): brotli.compress(content),
+            },
+            timeout,
+        )
+
+    tags = [stint_definition.get_cache_tag()] + ([vendor.get_cache_tag()] if vendor else [])
+    set_tagged(_get_pointer_key(stint_definition, language, vendor, is_marketplace), digest, tags, timeout)
+    logger.info("Built bundle %s of %s, for language: %s, vendor: %s", digest, stint_definition, language, vendor)
+    return digest
+
+
+def get_bundle_digest(stint_definition, language, vendor=None, is_marketplace=False):
+    """
+    Get the digest of the current page of a :class:`~ery_backend.stints.models.StintDefinition`, building it if needed.
+
+    Args:
+        - stint_definition (:class:`~ery_backend.stints.models.StintDefinition`)
+        - language (:class:`Language`)
+        - vendor (Optional[:class:`~ery_backend.vendors.models.Vendor`])
+        - is_marketplace (bool)
+
+    Notes:
+        - Concurrent requests for a missing bundle wait for a single build.
+
+    Returns:
+        str
+    """
+    pointer_key = _get_pointer_key(stint_definition, language, vendor, is_marketplace)
+    digest = cache.get(pointer_key)
+    if digest is None:
+        with cache.lock(f'BL:{pointer_key}'):
+            digest = cache.get(pointer_key)
+            if digest is None:
+                digest = build_bundle(stint_definition, language, vendor, is_marketplace)
+    return digest
+
+
+def get_bundle_content(digest, encoding='identity'):
+    """
+    Args:
+        - digest (str)
+        - encoding (str): One of :data:`ENCODINGS`.
+
+    Returns:
+        Optional[bytes]: None if the artifact expired.
+    """
+    return cache.get(_get_artifact_key(digest, encoding))
+
+
+def select_encoding(accept_encoding):
+    """
+    Choose the preferred encoding accepted by a client.
+
+    Args:
+        - accept_encoding (str): Value of the Accept-Encoding header.
+
+    Returns:
+        str: One of :data:`ENCODINGS`.
+    """
+    accepted = set()
+    for item in accept_encoding.split(','):
+        name, _, params = item.strip().partition(';')
+        if params.replace(' ', '') not in ('q=0', 'q=0.0'):
+            accepted.add(name.strip().lower())
+    for encoding in ENCODINGS[:-1]:
+        if encoding in accepted or '*' in accepted:
+            return encoding
+    return 'identity'
+
+
+def build_specification_bundles(stint_specification, languages=None):
+    """
+    Prebuild the pages of a :class:`~ery_backend.stint_specifications.models.StintSpecification`.
+
+    Args:
+        - stint_specification (:class:`~ery_backend.stint_specifications.models.StintSpecification`)
+        - languages (Optional[Iterable[:class:`Language`]]): Defaults to the languages allowed with the Web
+          :class:`~ery_backend.frontends.models.Frontend`.
+
+    Returns:
+        Dict[str, str]: Digest by language id.
+    """
+    from languages_plus.models import Language
+
+    if languages is None:
+        languages = Language.objects.filter(
+            id__in=stint_specification.allowed_language_frontend_combinations.filter(frontend__name='Web').values(
+                'language'
+            )
+        )
+    is_marketplace = stint_specification.where_to_run == stint_specification.WHERE_TO_RUN_CHOICES.market
+    return {
+        language.pk: build_bundle(stint_specification.stint_definition, language, stint_specification.vendor, is_marketplace)
+        for language in languages
+    }
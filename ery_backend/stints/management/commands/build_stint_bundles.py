@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from ery_backend.stint_specifications.models import StintSpecification
+from ery_backend.stints.bundles import build_specification_bundles
+
+
+class Command(BaseCommand):
+    help = "Prebuild the stint pages of stint specifications."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--stint-specification', type=int, nargs='*', dest='stint_specification_ids', help="Ids to build (default: all)"
+        )
+
+    def handle(self, *args, **options):
+        stint_specifications = StintSpecification.objects.select_related('stint_definition', 'vendor')
+        if options['stint_specification_ids']:
+            stint_specifications = stint_specifications.filter(id__in=options['stint_specification_ids'])
+        count = 0
+        for stint_specification in stint_specifications.iterator():
+            count += len(build_specification_bundles(stint_specification))
+        self.stdout.write("{} bundles built".format(count))
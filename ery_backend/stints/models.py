@@ -4,7 +4,7 @@ import json
 import logging
 import pytz
 
-from django.db import models
+from django.db import models, transaction
 from django.contrib.postgres.fields import JSONField
 from django.conf import settings
 import google
@@ -134,13 +134,11 @@ class StintDefinition(EryFile):
         """
         from ery_backend.templates.models import Template, TemplateWidget
 
-        template_widget_ids = set()
+        template_ids = Template.objects.filter(
+            id__in=self.module_definitions.values('stage_definitions__stage_templates__template__id'), frontend=frontend
+        ).values_list('id', flat=True)
 
-        template_ids = set(self.module_definitions.values_list('stage_definitions__stage_templates__template__id', flat=True))
-        for template in Template.objects.filter(id__in=template_ids).filter(frontend=frontend):
-            template_widget_ids = template_widget_ids.union(template.get_ancestoral_template_widget_ids())
-
-        return TemplateWidget.objects.filter(id__in=template_widget_ids)
+        return TemplateWidget.objects.filter(template_id__in=Template.get_ancestor_ids(template_ids))
 
     # XXX: Cache this
     def get_widgets(self, frontend):
@@ -151,7 +149,7 @@ class StintDefinition(EryFile):
         Returns:
             :class:`django.db.models.query.Queryset`
         """
-        from ery_backend.widgets.models import Widget, WidgetConnection
+        from ery_backend.widgets.models import Widget
 
         form_widget_ids = self.module_definitions.values_list('forms__items__field__widget__id', flat=True).union(
             self.module_definitions.values_list('forms__items__button_list__buttons__widget__id', flat=True)
@@ -161,15 +159,7 @@ class StintDefinition(EryFile):
 
         widget_ids = set(module_widget_ids).union(set(template_widget_ids)).union(set(form_widget_ids))
 
-        widget_dependency_ids = set(
-            WidgetConnection.objects.filter(originator__id__in=widget_ids).values_list('target__id', flat=True)
-        )
-
-        while not widget_dependency_ids.issubset(widget_ids):
-            widget_ids.update(widget_dependency_ids)
-            widget_dependency_ids = set(
-                WidgetConnection.objects.filter(originator__id__in=widget_dependency_ids).values_list('target__id', flat=True)
-            )
+        widget_ids.update(Widget.get_nested_connected_widget_ids(widget_ids))
 
         return Widget.objects.filter(id__in=widget_ids, frontend=frontend)
 
@@ -449,7 +439,7 @@ class Stint(RenderMixin, LogMixin, EryPrivileged):
         changed = old_value != new_value
         if changed:
             variable.value = new_value
-            variable.save()
+            variable.save(update_fields=['value'])
 
         self.log(
             'set_variable for: {}, of type: {}, = {}'.format(variable_definition.name, variable.__class__, value),
@@ -483,10 +473,8 @@ class Stint(RenderMixin, LogMixin, EryPrivileged):
 
         hand.set_module(module)
         hand.set_era(module.module_definition.start_era)
-        hand.set_stage(stage_definition=module.module_definition.start_stage)
+        hand.transition(stage_definition=module.module_definition.start_stage, create_breadcrumb=True)
         hand.set_status(Hand.STATUS_CHOICES.active)
-        breadcrumb = hand.create_breadcrumb(hand.stage)
-        hand.set_breadcrumb(breadcrumb)
 
     def join_user(self, user, frontend):
         """
@@ -559,6 +547,7 @@ class Stint(RenderMixin, LogMixin, EryPrivileged):
             - signal_pubsub (bool): Whether to send a signal to the Robot Runner using Google Pubsub during stint.start.
         """
         from ery_backend.teams.models import Team, TeamHand
+        from ery_backend.teams.networks import build_adjacencies
         from ery_backend.wardens.models import Warden
 
         if self.status is not None:
@@ -619,6 +608,9 @@ class Stint(RenderMixin, LogMixin, EryPrivileged):
             if signal_error:
                 raise signal_error
 
+        self.build_bundles()
+        build_adjacencies(self)
+
         for hand in self.hands.all():
             self.start_hand(hand)
 
@@ -627,6 +619,29 @@ class Stint(RenderMixin, LogMixin, EryPrivileged):
 
         self.save()
 
+    def build_bundles(self):
+        """
+        Prebuild the pages served to :class:`~ery_backend.hands.models.Hand` instances, in each allowed
+        :class:`Language` and in those of current hands.
+
+        Notes:
+            - A failed build is logged rather than raised, as pages are otherwise built on first request.
+        """
+        from languages_plus.models import Language
+
+        from .bundles import build_specification_bundles
+
+        language_ids = set(
+            self.stint_specification.allowed_language_frontend_combinations.filter(frontend__name='Web').values_list(
+                'language', flat=True
+            )
+        )
+        language_ids.update(self.hands.values_list('language', flat=True))
+        try:
+            build_specification_bundles(self.stint_specification, Language.objects.filter(id__in=language_ids))
+        except Exception:  # pylint:disable=broad-except
+            logger.exception("Could not prebuild bundles of %s", self)
+
     # XXX: Address in issue #505
     def stop(self, stopped_by=None):
         """
@@ -650,8 +665,7 @@ class Stint(RenderMixin, LogMixin, EryPrivileged):
             self.STATUS_CHOICES.finished,
         ]
         if cancel_hand:
-            for hand in self.hands.filter(status=Hand.STATUS_CHOICES.active):
-                hand.set_status(Hand.STATUS_CHOICES.cancelled)
+            self.set_hand_statuses(Hand.STATUS_CHOICES.cancelled, current_statuses=[Hand.STATUS_CHOICES.active])
         self.stopped_by = stopped_by
         self.ended = stop_time
         self.save()
@@ -692,12 +706,57 @@ class Stint(RenderMixin, LogMixin, EryPrivileged):
             if status in (self.STATUS_CHOICES.finished, self.STATUS_CHOICES.cancelled, self.STATUS_CHOICES.panicked):
                 self.stop(actor)
             elif status == self.STATUS_CHOICES.running:
-                for hand in self.hands.all():
-                    hand.set_status(Hand.STATUS_CHOICES.active)
+                self.set_hand_statuses(Hand.STATUS_CHOICES.active)
 
         else:
             raise ValueError(f"'{status}' is not a valid status choice for {self}.")
 
+    def set_hand_statuses(self, status, current_statuses=None):
+        """
+        Change the status of the :class:`~ery_backend.hands.models.Hand` instances of :class:`Stint` in one update.
+
+        Args:
+            status (str): New status of each :class:`~ery_backend.hands.models.Hand`.
+            current_statuses (Optional[List[str]]): Only change hands currently in one of these statuses.
+
+        Notes:
+            - Unlike :py:meth:`~ery_backend.hands.models.Hand.set_status`, the status of :class:`Stint` is not rederived
+              from those of its hands, as this is only used in changing the former.
+            - The transition is logged once, and broadcast once to the :class:`Stint` channel on commit, naming the
+              changed hands.
+
+        Raises:
+            ValueError: If status is not present in :py:meth:`~ery_backend.hands.models.Hand.STATUS_CHOICES`.
+
+        Returns:
+            int: Number of changed :class:`~ery_backend.hands.models.Hand` instances.
+        """
+        from ery_backend.base.cache import batch_invalidations, defer_invalidation
+        from ery_backend.base.utils import send_stint_message
+        from ery_backend.hands.models import Hand
+
+        if status not in Hand.STATUS_CHOICES:
+            raise ValueError(f"'{status}' is not present in STATUS_CHOICES.")
+        hands = self.hands.exclude(status=status)
+        if current_statuses is not None:
+            hands = hands.filter(status__in=current_statuses)
+        hand_ids = list(hands.values_list('id', flat=True))
+        if not hand_ids:
+            return 0
+        Hand.objects.filter(id__in=hand_ids).update(status=status, modified=dt.datetime.now(pytz.UTC))
+
+        # Invalidated as on save of each hand, together with their ancestors
+        with batch_invalidations():
+            for hand_id in hand_ids:
+                defer_invalidation(Hand(id=hand_id, stint=self))
+        message = {
+            'type': 'websocket.send',
+            'messages': [{'event': 'set_hand_status', 'data': {'status': status, 'hand_ids': hand_ids}}],
+        }
+        transaction.on_commit(lambda: send_stint_message(self, message))
+        self.log(f'Set status of {len(hand_ids)} hands to: {status}')
+        return len(hand_ids)
+
     def render(self, hand):
         """
         Generate an ES5 based view for the given model instance.
@@ -717,6 +776,25 @@ class Stint(RenderMixin, LogMixin, EryPrivileged):
             return self.render_web(hand.language)
         raise EryValidationError('No render method exists for StageDefinition given {hand.frontend} ')
 
+    def get_bundle_digest(self, language):
+        """
+        Get the digest of the prebuilt page of current instance (see :mod:`ery_backend.stints.bundles`).
+
+        Args:
+            - language (:class:`Language`)
+
+        Returns:
+            str
+        """
+        from .bundles import get_bundle_digest
+
+        return get_bundle_digest(
+            self.stint_specification.stint_definition,
+            language,
+            self.stint_specification.vendor,
+            self.stint_specification.where_to_run == self.stint_specification.WHERE_TO_RUN_CHOICES.market,
+        )
+
     def render_web(self, language):
         """
         Generate ES5 code for given instance.
@@ -737,7 +815,7 @@ class Stint(RenderMixin, LogMixin, EryPrivileged):
     def save_output_data(self, action_step, hand):
         entities = []
 
-        variable_definitions = action_step.get_to_save(self)
+        variable_definition_ids = [variable_definition.id for variable_definition in action_step.get_to_save(self)]
 
         def get_variables_by_scope(scope):
             from ery_backend.variables.models import VariableDefinition, HandVariable, TeamVariable, ModuleVariable
@@ -752,7 +830,6 @@ class Stint(RenderMixin, LogMixin, EryPrivileged):
             if scope == VariableDefinition.SCOPE_CHOICES.hand:
                 variable_cls = HandVariable
                 qs_filter_kwargs['hand'] = hand
-            variable_definition_ids = variable_definitions.values_list('id', flat=True)
             qs_filter_kwargs["variable_definition__id__in"] = variable_definition_ids
             variable_qs = variable_cls.objects.filter(**qs_filter_kwargs).prefetch_related('variable_definition')
             return dict(variable_qs.values_list('variable_definition__name', 'value'))
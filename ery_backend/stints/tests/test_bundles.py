@@ -0,0 +1,45 @@
+import gzip
+from unittest import mock
+
+import brotli
+from languages_plus.models import Language
+
+from ery_backend.base.testcases import EryTestCase
+
+from ..bundles import build_bundle, get_bundle_content, get_bundle_digest, select_encoding
+from ..factories import StintDefinitionFactory
+
+
+@mock.patch('ery_backend.frontends.renderers.ReactStintRenderer.render', return_value='<html>Stint</html>')
+class TestBundles(EryTestCase):
+    def setUp(self):
+        self.stint_definition = StintDefinitionFactory()
+        self.language = Language.objects.get(pk='en')
+
+    def test_build_bundle(self, mock_render):
+        """Bundles are addressed by their content, and stored with each encoding"""
+        digest = build_bundle(self.stint_definition, self.language)
+        self.assertEqual(digest, build_bundle(self.stint_definition, self.language))
+        self.assertEqual(get_bundle_content(digest), b'<html>Stint</html>')
+        self.assertEqual(gzip.decompress(get_bundle_content(digest, 'gzip')), b'<html>Stint</html>')
+        self.assertEqual(brotli.decompress(get_bundle_content(digest, 'br')), b'<html>Stint</html>')
+
+        mock_render.return_value = '<html>Other</html>'
+        self.assertNotEqual(digest, build_bundle(self.stint_definition, self.language))
+
+    def test_get_bundle_digest(self, mock_render):
+        """Bundles are built once, until their stint definition changes"""
+        digest = get_bundle_digest(self.stint_definition, self.language)
+        self.assertEqual(get_bundle_digest(self.stint_definition, self.language), digest)
+        self.assertEqual(mock_render.call_count, 1)
+
+        self.stint_definition.save()
+        get_bundle_digest(self.stint_definition, self.language)
+        self.assertEqual(mock_render.call_count, 2)
+
+    def test_select_encoding(self, mock_render):
+        self.assertEqual(select_encoding('gzip, deflate, br'), 'br')
+        self.assertEqual(select_encoding('gzip, br;q=0'), 'gzip')
+        self.assertEqual(select_encoding('*'), 'br')
+        self.assertEqual(select_encoding('deflate'), 'identity')
+        self.assertEqual(select_encoding(''), 'identity')
@@ -1,5 +1,7 @@
 from unittest import mock
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 import graphene
 
 from ery_backend.base.testcases import GQLTestCase, create_test_stintdefinition
@@ -340,6 +342,34 @@ query StintQuery($gqlId: ID!){stint(id: $gqlId){ id hands{ edges{ node{ id era{
         for hand_id in expected_hand_ids:
             self.assertIn(hand_id, hand_ids)
 
+    def test_nested_connections_query_count(self):
+        """Queries of hands and teams of allStints do not grow with the number of stints"""
+        query = """{allStints{ edges{ node{ id hands{ edges{ node{ id }}} teams{ edges{ node{ id name }}}}}}}"""
+
+        def add_stints(n):
+            for _ in range(n):
+                stint = StintFactory()
+                grant_role(self.viewer["role"], stint.get_privilege_ancestor(), self.viewer["user"])
+                HandFactory(stint=stint)
+                HandFactory(stint=stint)
+                TeamFactory(stint=stint)
+
+        def execute():
+            with CaptureQueriesContext(connection) as queries:
+                result = self.gql_client.execute(query, context_value=self.gql_client.get_context(user=self.viewer["user"]))
+            self.fail_on_errors(result)
+            return result, len(queries.captured_queries)
+
+        add_stints(2)
+        _, few_query_count = execute()
+        add_stints(5)
+        result, many_query_count = execute()
+        self.assertEqual(len(result["data"]["allStints"]["edges"]), 8)
+        stint_nodes = [edge["node"] for edge in result["data"]["allStints"]["edges"]]
+        self.assertEqual(sum(len(node["hands"]["edges"]) for node in stint_nodes), 14)
+        self.assertEqual(sum(len(node["teams"]["edges"]) for node in stint_nodes), 7)
+        self.assertEqual(many_query_count, few_query_count)
+
 
 class TestStartStint(GQLTestCase):
     node_name = "StintNode"
@@ -7,7 +7,9 @@ import random
 
 from django.core.exceptions import ObjectDoesNotExist
 from django.conf import settings
+from django.db import connection
 from django.db.utils import IntegrityError
+from django.test.utils import CaptureQueriesContext
 
 import grpc
 from languages_plus.models import Language
@@ -1003,6 +1005,47 @@ class TestStopStint(EryTestCase):
         self.assertEqual(self.hand_3.status, Hand.STATUS_CHOICES.quit)
         self.assertEqual(self.hand_4.status, Hand.STATUS_CHOICES.finished)
 
+    def test_set_hand_statuses(self):
+        """
+        Confirm hands are changed in one update, and the transition logged once.
+        """
+        with CaptureQueriesContext(connection) as context:
+            count = self.stint.set_hand_statuses(
+                Hand.STATUS_CHOICES.cancelled, current_statuses=[Hand.STATUS_CHOICES.active, Hand.STATUS_CHOICES.quit]
+            )
+        self.assertEqual(count, 2)
+        hand_updates = [query for query in context.captured_queries if query['sql'].startswith('UPDATE "hands_hand"')]
+        self.assertEqual(len(hand_updates), 1)
+        message = f'Set status of 2 hands to: {Hand.STATUS_CHOICES.cancelled}'
+        self.assertEqual(Log.objects.filter(stint=self.stint, message=message).count(), 1)
+        self.batch_refresh([self.hand_1, self.hand_2, self.hand_3, self.hand_4])
+        self.assertEqual(self.hand_1.status, Hand.STATUS_CHOICES.cancelled)
+        self.assertEqual(self.hand_2.status, Hand.STATUS_CHOICES.timedout)
+        self.assertEqual(self.hand_3.status, Hand.STATUS_CHOICES.cancelled)
+        self.assertEqual(self.hand_4.status, Hand.STATUS_CHOICES.finished)
+
+        # Nothing left to change, nor to log
+        log_count = Log.objects.filter(stint=self.stint).count()
+        self.assertEqual(self.stint.set_hand_statuses(Hand.STATUS_CHOICES.cancelled, [Hand.STATUS_CHOICES.active]), 0)
+        self.assertEqual(Log.objects.filter(stint=self.stint).count(), log_count)
+
+        self.assertEqual(self.stint.set_hand_statuses(Hand.STATUS_CHOICES.active), 4)
+        self.assertFalse(self.stint.hands.exclude(status=Hand.STATUS_CHOICES.active).exists())
+
+        with self.assertRaises(ValueError):
+            self.stint.set_hand_statuses('done')
+
+    @mock.patch('ery_backend.base.cache.defer_invalidation')
+    def test_set_hand_statuses_invalidation(self, mock_defer):
+        """
+        Confirm changed hands are invalidated as on save, together with their stint.
+        """
+        self.stint.set_hand_statuses(Hand.STATUS_CHOICES.cancelled, current_statuses=[Hand.STATUS_CHOICES.active])
+        mock_defer.assert_called_once()
+        hand = mock_defer.call_args[0][0]
+        self.assertEqual(hand.pk, self.hand_1.pk)
+        self.assertEqual(hand.parent, self.stint)
+
 
 class TestStintDefinitionModuleDefinition(EryTestCase):
     def setUp(self):
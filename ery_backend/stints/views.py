@@ -6,15 +6,16 @@ import numpy
 
 from django.conf import settings
 from django.contrib.auth.decorators import login_required
-from django.http import HttpResponse, HttpResponseBadRequest, Http404
+from django.http import HttpResponse, HttpResponseBadRequest, HttpResponseNotModified, Http404
 from django.shortcuts import render, redirect
 
+from ery_backend.base.registry import get_frontend
 from ery_backend.datastore.entities import csv_fields
-from ery_backend.frontends.models import Frontend
 from ery_backend.hands.models import Hand
 from ery_backend.stint_specifications.models import StintSpecification
 from ery_backend.vendors.models import Vendor
 
+from .bundles import build_bundle, get_bundle_content, select_encoding
 from .models import Stint
 
 logger = logging.getLogger(__name__)
@@ -34,11 +35,36 @@ def render_stint(request, stint_gql_id):
     # if not stint.active:
     #     return render(request, 'stints/wait.html')
 
-    hand.frontend = Frontend.objects.get(name='Web')
-    hand.save()
+    web = get_frontend('Web')
+    if hand.frontend_id != web.id:
+        hand.frontend = web
+        hand.save()
 
-    render_code = hand.stint.render(hand)
-    return HttpResponse(render_code)
+    # Pages are prebuilt (see ery_backend.stints.bundles), and revalidated by their digest
+    digest = stint.get_bundle_digest(hand.language)
+    etag = f'"{digest}"'
+    if etag in request.META.get('HTTP_IF_NONE_MATCH', ''):
+        response = HttpResponseNotModified()
+    else:
+        encoding = select_encoding(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        content = get_bundle_content(digest, encoding)
+        if content is None:
+            spec = stint.stint_specification
+            digest = build_bundle(
+                spec.stint_definition,
+                hand.language,
+                spec.vendor,
+                spec.where_to_run == StintSpecification.WHERE_TO_RUN_CHOICES.market,
+            )
+            etag = f'"{digest}"'
+            content = get_bundle_content(digest, encoding)
+        response = HttpResponse(content)
+        if encoding != 'identity':
+            response['Content-Encoding'] = encoding
+    response['ETag'] = etag
+    response['Vary'] = 'Accept-Encoding'
+    response['Cache-Control'] = 'private, no-cache'
+    return response
 
 
 @login_required
@@ -180,7 +206,7 @@ def redirect_to_market_stint(request, started_by_gql_id=None, frontend_name='Web
     logger.info("User is '%s'", request.user.username if request.user else 'Unknown')
 
     vendor = Vendor.get_vendor_by_request(request)
-    frontend = Frontend.objects.get(name=frontend_name)
+    frontend = get_frontend(frontend_name)
 
     market_stints = Stint.objects.filter(
         status=Stint.STATUS_CHOICES.running,
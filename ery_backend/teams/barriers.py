@@ -0,0 +1,55 @@
+"""
+Barriers:
+    Members of a :class:`~ery_backend.teams.models.Team` arriving at an :class:`~ery_backend.syncs.models.Era` are
+    recorded in a Redis set per (team, era), so that synchronizing the team does not rescan its members on each arrival.
+"""
+from django.core.cache import cache
+from django_redis import get_redis_connection
+
+# Seconds a barrier is kept after its last arrival
+BARRIER_TTL = 7 * 24 * 60 * 60
+
+# Atomically moves a hand from the barrier of its previous era to that of its new era, and reports whether it completed
+# the latter. KEYS: new era, previous era. ARGV: hand id, team size, ttl.
+_ARRIVE_SCRIPT = """
+if KEYS[2] ~= KEYS[1] then
+    redis.call('SREM', KEYS[2], ARGV[1])
+end
+local added = redis.call('SADD', KEYS[1], ARGV[1])
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+if added == 1 and redis.call('SCARD', KEYS[1]) == tonumber(ARGV[2]) then
+    return 1
+end
+return 0
+"""
+
+
+def _get_barrier_key(team_id, era_id):
+    # Share the cache's prefix, keeping separate deployments (and test runs) apart
+    return cache.make_key(f'EB:{team_id}:{era_id}')
+
+
+def arrive(team_id, hand_id, era_id, previous_era_id, size):
+    """
+    Record a member of a :class:`~ery_backend.teams.models.Team` changing :class:`~ery_backend.syncs.models.Era`.
+
+    Args:
+        - team_id (int)
+        - hand_id (int)
+        - era_id (Optional[int])
+        - previous_era_id (Optional[int])
+        - size (int): Number of members of the team.
+
+    Notes:
+        - Safe under concurrent arrivals, as the barrier is updated in one Lua script. Exactly one of the arrivals
+          completing a barrier gets True, and repeated arrivals of the same member are not counted twice.
+        - Members are counted from their arrival, so members not having changed era since realization of the stint are
+          not counted towards its initial era, which the team already shares.
+
+    Returns:
+        bool: Whether this arrival completed the barrier of era_id.
+    """
+    redis = get_redis_connection('default')
+    script = redis.register_script(_ARRIVE_SCRIPT)
+    keys = [_get_barrier_key(team_id, era_id), _get_barrier_key(team_id, previous_era_id)]
+    return bool(script(keys=keys, args=[hand_id, size, BARRIER_TTL]))
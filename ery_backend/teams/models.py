@@ -5,7 +5,7 @@ from django.core.exceptions import ValidationError
 from django.contrib.postgres.fields import JSONField
 
 from ery_backend.base.mixins import LogMixin
-from ery_backend.base.models import EryModel
+from ery_backend.base.models import EryModel, RuntimeModelMixin
 from ery_backend.modules.models import ModuleDefinitionNamedModel
 from ery_backend.stints.models import StintModel
 
@@ -24,7 +24,7 @@ class TeamHand(EryModel):
     hand = models.ForeignKey('hands.Hand', on_delete=models.CASCADE)
 
 
-class Team(LogMixin, StintModel):
+class Team(RuntimeModelMixin, LogMixin, StintModel):
     """
     Group :class:`Hand` instances in a given :class:`~ery_backend.stints.models.Stint`.
 
@@ -68,13 +68,27 @@ class Team(LogMixin, StintModel):
             era, self.id, self.stint.id, self.stint.stint_specification.stint_definition.name
         )
         self.stint.log(message, system_only=True)
-        self.save()
+        self.save(update_fields=['era'])
 
-    def synchronize(self, era):
+    def synchronize(self, era, hand=None, previous_era_id=None):
         """
         Sets new era if all member :class:`Hand` instances are of said :class:`~ery_backend.syncs.models.Era`.
+
+        Args:
+            - era (:class:`~ery_backend.syncs.models.Era`)
+            - hand (Optional[:class:`Hand`]): Member having changed to era.
+            - previous_era_id (Optional[int]): Era of hand before the change.
+
+        Notes:
+            - Given hand, its arrival is recorded at the barrier of era (see :func:`~ery_backend.teams.barriers.arrive`),
+              and era is set exactly once, by the arrival of the last member. Otherwise, members are counted.
         """
-        if self.hands.filter(era=era).count() == self.hands.count():
+        from .barriers import arrive
+
+        if hand is not None:
+            if arrive(self.id, hand.id, getattr(era, 'id', None), previous_era_id, self.hands.count()):
+                self.set_era(era)
+        elif self.hands.filter(era=era).count() == self.hands.count():
             self.set_era(era)
 
     def get_variable(self, variable_definition):
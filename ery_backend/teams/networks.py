@@ -0,0 +1,241 @@
+"""
+Networks:
+    The GML of each :class:`~ery_backend.teams.models.TeamNetwork` parsed once into a compact adjacency, in compressed
+    sparse row (CSR) form, and cached, for neighborhood queries during a :class:`~ery_backend.stints.models.Stint`.
+"""
+from array import array
+from bisect import bisect_left
+import logging
+import re
+
+from django.core.cache import cache
+
+from ery_backend.base.cache import set_tagged
+from ery_backend.base.exceptions import EryValidationError
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r'"[^"]*"|\[|\]|[^\s\[\]"]+')
+
+
+def _parse_value(token):
+    if token.startswith('"'):
+        return token[1:-1]
+    for cast in (int, float):
+        try:
+            return cast(token)
+        except ValueError:
+            pass
+    return token
+
+
+def parse_gml(text):
+    """
+    Parse GML (https://networkx.github.io/documentation/networkx-2.3/reference/readwrite/gml.html) into nested lists.
+
+    Args:
+        - text (str)
+
+    Raises:
+        ValueError: If brackets are unbalanced, or a key has no value.
+
+    Returns:
+        List[Tuple[str, Union[int, float, str, List]]]: (key, value) pairs, in order, where the value of a list is a list
+        of pairs.
+    """
+    lines = (line for line in text.splitlines() if not line.lstrip().startswith('#'))
+    tokens = _TOKEN_RE.findall('\n'.join(lines))
+    position = 0
+
+    def _parse_list(nested):
+        nonlocal position
+        items = []
+        while position < len(tokens):
+            key = tokens[position]
+            position += 1
+            if key == ']':
+                if not nested:
+                    raise ValueError("Unbalanced ']'")
+                return items
+            if position == len(tokens) or tokens[position] == ']':
+                raise ValueError(f"Key '{key}' has no value")
+            value = tokens[position]
+            position += 1
+            items.append((key, _parse_list(True) if value == '[' else _parse_value(value)))
+        if nested:
+            raise ValueError("Unbalanced '['")
+        return items
+
+    return _parse_list(False)
+
+
+class NetworkAdjacency:
+    """
+    Neighbors of the :class:`~ery_backend.hands.models.Hand` instances of a network, in CSR form.
+
+    Args:
+        - hand_ids (:class:`array.array`): Of nodes, in ascending order.
+        - indptr (:class:`array.array`): Neighbors of the node at position i are at indices[indptr[i]:indptr[i + 1]].
+        - indices (:class:`array.array`): Positions of neighbors in hand_ids.
+    """
+
+    def __init__(self, hand_ids, indptr, indices):
+        self.hand_ids = hand_ids
+        self.indptr = indptr
+        self.indices = indices
+
+    def __len__(self):
+        return len(self.hand_ids)
+
+    def _get_position(self, hand_id):
+        position = bisect_left(self.hand_ids, hand_id)
+        if position < len(self.hand_ids) and self.hand_ids[position] == hand_id:
+            return position
+        return None
+
+    def __contains__(self, hand_id):
+        return self._get_position(hand_id) is not None
+
+    def get_neighbor_ids(self, hand_id):
+        """
+        Returns:
+            List[int]: Ids of the neighbors of hand_id (out-neighbors, in a directed network), in ascending order. Empty
+            if hand_id is not a node.
+        """
+        position = self._get_position(hand_id)
+        if position is None:
+            return []
+        return [self.hand_ids[index] for index in self.indices[self.indptr[position] : self.indptr[position + 1]]]
+
+    @classmethod
+    def from_gml(cls, text):
+        """
+        Args:
+            - text (str): GML of a graph.
+
+        Notes:
+            - A node is the :class:`~ery_backend.hands.models.Hand` of its 'hand' attribute, or else of its 'id'.
+            - Graphs are undirected unless 'directed 1' is given. Self loops and repeated edges are ignored.
+
+        Raises:
+            ValueError: If text is not valid GML, has no graph, or has edges between undeclared nodes.
+
+        Returns:
+            :class:`NetworkAdjacency`
+        """
+        graphs = [value for key, value in parse_gml(text) if key == 'graph' and isinstance(value, list)]
+        if not graphs:
+            raise ValueError("No graph found")
+        graph = graphs[0]
+        directed = any(key == 'directed' and value == 1 for key, value in graph)
+
+        node_hand_ids = {}
+        for key, value in graph:
+            if key == 'node' and isinstance(value, list):
+                attributes = dict(reversed(value))  # first of repeated attributes
+                if 'id' not in attributes:
+                    raise ValueError(f"Node without id: {attributes}")
+                node_hand_ids[attributes.get('id')] = int(attributes.get('hand', attributes.get('id')))
+
+        hand_ids = sorted(set(node_hand_ids.values()))
+        positions = {hand_id: position for position, hand_id in enumerate(hand_ids)}
+        neighbors = [set() for _ in hand_ids]
+        for key, value in graph:
+            if key == 'edge' and isinstance(value, list):
+                attributes = dict(reversed(value))
+                try:
+                    source = positions[node_hand_ids[attributes.get('source')]]
+                    target = positions[node_hand_ids[attributes.get('target')]]
+                except KeyError:
+                    raise ValueError(f"Edge between undeclared nodes: {attributes}")
+                if source != target:
+                    neighbors[source].add(target)
+                    if not directed:
+                        neighbors[target].add(source)
+
+        indptr = array('q', [0])
+        indices = array('q')
+        for node_neighbors in neighbors:
+            indices.extend(sorted(node_neighbors))
+            indptr.append(len(indices))
+        return cls(array('q', hand_ids), indptr, indices)
+
+
+def _get_cache_key(team_network_id):
+    return f'TNA:{team_network_id}'
+
+
+def _build_adjacency(team_network):
+    try:
+        adjacency = NetworkAdjacency.from_gml(team_network.network)
+    except ValueError as e:
+        raise EryValidationError(f"Invalid network of TeamNetwork: {team_network.id}. {e}")
+    set_tagged(_get_cache_key(team_network.id), adjacency, [team_network.get_cache_tag()])
+    return adjacency
+
+
+def build_adjacencies(stint):
+    """
+    Parse and cache the adjacencies of the :class:`~ery_backend.teams.models.TeamNetwork` instances of stint.
+
+    Args:
+        - stint (:class:`~ery_backend.stints.models.Stint`)
+
+    Notes:
+        - An invalid network is logged rather than raised, as it only fails the neighborhood queries using it.
+    """
+    from .models import TeamNetwork
+
+    for team_network in TeamNetwork.objects.filter(stint=stint):
+        try:
+            _build_adjacency(team_network)
+        except EryValidationError:
+            logger.exception("Failed to build adjacency of TeamNetwork: %s", team_network.id)
+
+
+def get_adjacencies(stint_id):
+    """
+    Args:
+        - stint_id (int)
+
+    Notes:
+        - Cached per :class:`~ery_backend.teams.models.TeamNetwork`, and invalidated on its changes. Missing adjacencies
+          are built in one query.
+
+    Returns:
+        List[:class:`NetworkAdjacency`]: Of the :class:`~ery_backend.teams.models.TeamNetwork` instances of the
+        :class:`~ery_backend.stints.models.Stint`.
+    """
+    from .models import TeamNetwork
+
+    team_network_ids = list(TeamNetwork.objects.filter(stint_id=stint_id).values_list('id', flat=True))
+    if not team_network_ids:
+        return []
+    cached = cache.get_many([_get_cache_key(team_network_id) for team_network_id in team_network_ids])
+    adjacencies = [cached[key] for key in cached]
+    missing_ids = [team_network_id for team_network_id in team_network_ids if _get_cache_key(team_network_id) not in cached]
+    if missing_ids:
+        adjacencies += [_build_adjacency(team_network) for team_network in TeamNetwork.objects.filter(id__in=missing_ids)]
+    return adjacencies
+
+
+def get_neighbor_ids(hand):
+    """
+    Get the neighborhood of a :class:`~ery_backend.hands.models.Hand`.
+
+    Args:
+        - hand (:class:`~ery_backend.hands.models.Hand`)
+
+    Notes:
+        - As a :class:`~ery_backend.hands.models.Hand` can be a node in multiple networks, its neighborhood is the union
+          of its neighbors in each :class:`~ery_backend.teams.models.TeamNetwork` of its
+          :class:`~ery_backend.stints.models.Stint`.
+
+    Returns:
+        List[int]: In ascending order, excluding hand.
+    """
+    neighbor_ids = set()
+    for adjacency in get_adjacencies(hand.stint_id):
+        neighbor_ids.update(adjacency.get_neighbor_ids(hand.id))
+    neighbor_ids.discard(hand.id)
+    return sorted(neighbor_ids)
@@ -0,0 +1,53 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from ery_backend.base.testcases import EryTestCase
+from ery_backend.hands.factories import HandFactory
+from ery_backend.syncs.factories import EraFactory
+
+from ..barriers import arrive
+from ..factories import TeamFactory
+from ..models import TeamHand
+
+
+class TestArrive(EryTestCase):
+    def setUp(self):
+        self.team = TeamFactory()
+        self.era = EraFactory()
+        self.other_era = EraFactory()
+
+    def test_arrive(self):
+        self.assertFalse(arrive(self.team.id, 1, self.era.id, None, 3))
+        self.assertFalse(arrive(self.team.id, 2, self.era.id, None, 3))
+        # Repeated arrivals are not counted
+        self.assertFalse(arrive(self.team.id, 2, self.era.id, self.era.id, 3))
+        self.assertTrue(arrive(self.team.id, 3, self.era.id, None, 3))
+        self.assertFalse(arrive(self.team.id, 3, self.era.id, self.era.id, 3))
+
+        # Leaving and returning completes the barrier again
+        self.assertFalse(arrive(self.team.id, 1, self.other_era.id, self.era.id, 3))
+        self.assertTrue(arrive(self.team.id, 1, self.era.id, self.other_era.id, 3))
+
+    def test_concurrent_arrivals(self):
+        """
+        Confirm exactly one of concurrent arrivals completes a barrier.
+        """
+        size = 20
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda hand_id: arrive(self.team.id, hand_id, self.era.id, None, size), range(size)))
+        self.assertEqual(results.count(True), 1)
+
+
+class TestSynchronize(EryTestCase):
+    def test_set_era(self):
+        team = TeamFactory()
+        hands = [HandFactory(current_team=team, era=team.era) for _ in range(2)]
+        for hand in hands:
+            TeamHand.objects.create(team=team, hand=hand)
+        era = EraFactory()
+
+        hands[0].set_era(era)
+        team.refresh_from_db()
+        self.assertNotEqual(team.era, era)
+        hands[1].set_era(era)
+        team.refresh_from_db()
+        self.assertEqual(team.era, era)
@@ -0,0 +1,71 @@
+from ery_backend.base.exceptions import EryValidationError
+from ery_backend.base.testcases import EryTestCase
+from ery_backend.hands.factories import HandFactory
+from ery_backend.stints.factories import StintFactory
+
+from ..factories import TeamNetworkFactory
+from ..networks import NetworkAdjacency, build_adjacencies, get_neighbor_ids
+
+GML = """
+graph [
+  # Nodes are hands, by id unless given
+  node [ id 1 hand {} ]
+  node [ id 2 hand {} ]
+  node [ id 3 hand {} ]
+  edge [ source 1 target 2 ]
+  edge [ source 2 target 3 ]
+]
+"""
+
+
+class TestNetworkAdjacency(EryTestCase):
+    def test_undirected(self):
+        adjacency = NetworkAdjacency.from_gml(GML.format(30, 10, 20))
+        self.assertEqual(list(adjacency.hand_ids), [10, 20, 30])
+        self.assertEqual(adjacency.get_neighbor_ids(10), [20, 30])
+        self.assertEqual(adjacency.get_neighbor_ids(30), [10])
+        self.assertEqual(adjacency.get_neighbor_ids(20), [10])
+        self.assertEqual(adjacency.get_neighbor_ids(40), [])
+        self.assertNotIn(40, adjacency)
+
+    def test_directed(self):
+        adjacency = NetworkAdjacency.from_gml(GML.format(30, 10, 20).replace('graph [', 'graph [ directed 1'))
+        self.assertEqual(adjacency.get_neighbor_ids(30), [10])
+        self.assertEqual(adjacency.get_neighbor_ids(20), [])
+
+    def test_invalid(self):
+        for network in ('graphQL', 'graph [ node [ id 1 ]', 'graph [ edge [ source 1 target 2 ] ]'):
+            with self.assertRaises(ValueError):
+                NetworkAdjacency.from_gml(network)
+
+
+class TestGetNeighborIds(EryTestCase):
+    def setUp(self):
+        self.stint = StintFactory()
+        self.hands = [HandFactory(stint=self.stint) for _ in range(4)]
+        hand_ids = [hand.id for hand in self.hands]
+        self.team_network = TeamNetworkFactory(stint=self.stint, network=GML.format(*hand_ids[:3]))
+        # A hand can be a node in multiple networks
+        TeamNetworkFactory(stint=self.stint, network=GML.format(hand_ids[3], hand_ids[1], hand_ids[2]))
+
+    def test_union(self):
+        self.assertEqual(get_neighbor_ids(self.hands[1]), [self.hands[0].id, self.hands[2].id, self.hands[3].id])
+        self.assertEqual(get_neighbor_ids(self.hands[2]), [self.hands[1].id])
+
+    def test_cache(self):
+        build_adjacencies(self.stint)
+        # Network ids only
+        with self.assertNumQueries(1):
+            get_neighbor_ids(self.hands[0])
+
+        self.team_network.network = GML.format(self.hands[0].id, self.hands[2].id, self.hands[1].id)
+        self.team_network.save()
+        self.assertEqual(get_neighbor_ids(self.hands[0]), [self.hands[2].id])
+
+    def test_invalid(self):
+        self.team_network.network = 'graphQL'
+        self.team_network.save()
+        # Logged when starting
+        build_adjacencies(self.stint)
+        with self.assertRaises(EryValidationError):
+            get_neighbor_ids(self.hands[0])
@@ -1,5 +1,5 @@
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import connection, models
 from django.template.loader import render_to_string
 
 from languages_plus.models import Language
@@ -184,41 +184,80 @@ class Template(BlockHolderMixin, EryFile):
     def get_blocks(self, language):
         return self.get_blocks_by_frontend_language(language=language)
 
+    @classmethod
+    def get_ancestor_ids(cls, template_ids):
+        """
+        Get ids of given :class:`Template` instances and all of their ancestors.
+
+        Args:
+            - template_ids (Iterable[int])
+
+        Notes:
+            - Resolved in one recursive query, whatever the depth of inheritance.
+
+        Returns:
+            set
+        """
+        template_ids = [pk for pk in template_ids if pk is not None]
+        if not template_ids:
+            return set()
+        with connection.cursor() as cursor:
+            cursor.execute(f"{cls._get_ancestry_sql()} SELECT DISTINCT id FROM ancestry", [template_ids])
+            return {row[0] for row in cursor.fetchall()}
+
+    def get_ancestors(self):
+        """
+        Get current instance followed by its chain of parental :class:`Template` instances.
+
+        Notes:
+            - Resolved in one recursive query, whatever the depth of inheritance.
+
+        Returns:
+            List[:class:`Template`]: Current instance first, root last.
+        """
+        table = self._meta.db_table
+        query = (
+            f"{self._get_ancestry_sql()} SELECT template.* FROM ancestry JOIN {table} template ON template.id = ancestry.id"
+            " ORDER BY array_length(ancestry.path, 1)"
+        )
+        return list(Template.objects.raw(query, [[self.id]]))
+
+    @classmethod
+    def _get_ancestry_sql(cls):
+        # Each row keeps the path walked so far, which orders ancestors and stops on (invalid) circular inheritance
+        table = cls._meta.db_table
+        return f"""
+            WITH RECURSIVE ancestry(id, path) AS (
+                SELECT id, ARRAY[id] FROM {table} WHERE id = ANY(%s)
+                UNION ALL
+                SELECT template.parental_template_id, ancestry.path || template.parental_template_id
+                FROM ancestry JOIN {table} template ON template.id = ancestry.id
+                WHERE template.parental_template_id IS NOT NULL AND NOT template.parental_template_id = ANY(ancestry.path)
+            )
+        """
+
+    def get_block_ancestors(self):
+        return self.get_ancestors()[1:]
+
     def get_widgets(self):
         from ery_backend.widgets.models import Widget
 
-        additional_tags = []  # Not covered by ery_cache method
-        widget_ids = set(self.template_widgets.values_list('widget', flat=True).all())
-        connected_widget_ids = set()
-        for widget_id in widget_ids:
-            connected_widget_ids.update(Widget.get_nested_connected_widget_ids(widget_id))
-        widget_ids.update(connected_widget_ids)
+        template_ids = self.get_ancestor_ids([self.id])
+        widget_ids = set(TemplateWidget.objects.filter(template_id__in=template_ids).values_list('widget', flat=True))
+        widget_ids.update(Widget.get_nested_connected_widget_ids(widget_ids))
+
+        # Not covered by ery_cache method
+        additional_tags = [Template.get_cache_tag_by_pk(pk) for pk in template_ids if pk != self.id]
         additional_tags += [Widget.get_cache_tag_by_pk(pk) for pk in widget_ids]
-        current_template = self
-        while current_template.parental_template:
-            current_template = current_template.parental_template
-            additional_tags.append(current_template.get_cache_tag())
-            ancestral_widget_ids = set(current_template.template_widgets.values_list('widget', flat=True))
-            additional_tags += [Widget.get_cache_tag_by_pk(pk) for pk in ancestral_widget_ids]
-            ancestral_connected_widget_ids = set()
-            for ancestral_widget_id in ancestral_widget_ids:
-                ancestral_connected_widget_ids.update(Widget.get_nested_connected_widget_ids(ancestral_widget_id))
-            additional_tags += [Widget.get_cache_tag_by_pk(pk) for pk in ancestral_connected_widget_ids]
-            widget_ids.update(ancestral_widget_ids, ancestral_connected_widget_ids)
         cache_key = get_func_cache_key(self.get_widgets, self)
         tag_key(additional_tags, cache_key)
 
         return Widget.objects.filter(id__in=widget_ids)
 
     def get_ancestoral_template_widget_ids(self):
-        template_widget_ids = set()
-
-        current_template = self
-        while current_template is not None:
-            template_widget_ids.update(set(current_template.template_widgets.values_list('id', flat=True)))
-            current_template = current_template.parental_template
-
-        return template_widget_ids
+        return set(
+            TemplateWidget.objects.filter(template_id__in=self.get_ancestor_ids([self.id])).values_list('id', flat=True)
+        )
 
     def get_ancestoral_template_widgets(self, include_ancestoral=False):
         if include_ancestoral:
@@ -323,13 +362,6 @@ class Template(BlockHolderMixin, EryFile):
             stage_template.invalidate_tags(history)
 
     def render_web(self, language):
-        template_widget_names = set()
-        current_template = self
-
-        while current_template.parental_template_id:
-            template_widget_names.update(current_template.template_widgets.values_list('name', flat=True))
-            current_template = current_template.parental_template
-
         return render_to_string(
             "react-spa/Template.js",
             context={
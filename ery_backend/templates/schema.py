@@ -27,15 +27,14 @@ class TemplateNode(FileNodeMixin, EryObjectType):
         else:
             language = from_global_id(language)[1]
 
-        block_infos = self.get_blocks(language)
         return [
             {
-                "name": name,
-                "content": info["content"],
+                "name": block_info.name,
+                "content": block_info.content,
                 "block_type": "TemplateBlock",
-                "ancestor_template_id": info["ancestor"].gql_id,
+                "ancestor_template_id": Template.get_gql_id(block_info.ancestor_id),
             }
-            for name, info in block_infos.items()
+            for block_info in self.get_block_catalog(language_id=getattr(language, 'pk', language))
         ]
 
     def resolve_preview(self, info, language=None):
@@ -7,6 +7,7 @@ from django.db.utils import IntegrityError
 from languages_plus.models import Language
 
 from ery_backend.base.cache import cache
+from ery_backend.base.mixins import BlockInfo
 from ery_backend.base.testcases import EryTestCase, create_test_hands
 from ery_backend.keywords.factories import KeywordFactory
 from ery_backend.frontends.factories import FrontendFactory
@@ -210,6 +211,30 @@ class TestTemplate(EryTestCase):
             preferred_conflict_translation.content,
         )
 
+    def test_get_block_catalog(self):
+        """Blocks of the whole inheritance chain are compiled in a fixed number of queries, then cached"""
+        language = Language.objects.get(pk='en')
+        templates = [TemplateFactory()]
+        for _ in range(3):
+            templates.append(TemplateFactory(frontend=templates[0].frontend, parental_template=templates[-1]))
+        translations = [
+            TemplateBlockTranslationFactory(template_block=TemplateBlockFactory(template=template), language=language)
+            for template in templates
+        ]
+
+        with self.assertNumQueries(3):
+            catalog = templates[-1].get_block_catalog(language_id=language.pk)
+        names = [TemplateBlock.objects.get(id=translation.template_block_id).name for translation in translations]
+        self.assertEqual(
+            catalog,
+            [
+                BlockInfo(name, translation.content, 'TemplateBlock', template.id)
+                for template, name, translation in reversed(list(zip(templates, names, translations)))
+            ],
+        )
+        with self.assertNumQueries(0):
+            templates[-1].get_block_catalog(language_id=language.pk)
+
     def test_parental_template_restrictions(self):
         """
         Cannot remove parental_template if template has more than one associated block.
@@ -381,6 +406,41 @@ class TestGetWidgetsCaching(EryTestCase):
         self.assertIsNone(cache.get(key))
 
 
+class TestTemplateAncestry(EryTestCase):
+    def setUp(self):
+        self.templates = [TemplateFactory()]
+        for _ in range(3):
+            self.templates.append(
+                TemplateFactory(frontend=self.templates[-1].frontend, parental_template=self.templates[-1])
+            )
+
+    def test_get_ancestors(self):
+        """Ancestors are resolved in one query, nearest first"""
+        template = self.templates[-1]
+        with self.assertNumQueries(1):
+            ancestors = template.get_ancestors()
+        self.assertEqual(ancestors, self.templates[::-1])
+        self.assertEqual(template.get_block_ancestors(), self.templates[-2::-1])
+
+    def test_get_ancestor_ids(self):
+        other_template = TemplateFactory()
+        self.assertEqual(
+            Template.get_ancestor_ids([self.templates[2].id, other_template.id]),
+            {template.id for template in self.templates[:3]} | {other_template.id},
+        )
+        self.assertEqual(Template.get_ancestor_ids([]), set())
+
+    def test_get_ancestoral_template_widget_ids(self):
+        template_widgets = [
+            TemplateWidgetFactory(template=template, widget=WidgetFactory(frontend=template.frontend))
+            for template in self.templates
+        ]
+        self.assertEqual(
+            self.templates[1].get_ancestoral_template_widget_ids(),
+            {template_widget.id for template_widget in template_widgets[:2]},
+        )
+
+
 class TestTemplateBlock(EryTestCase):
     @classmethod
     def setUpClass(cls, *args, **kwargs):
@@ -7,16 +7,8 @@ from django.contrib.auth.models import Group as DjangoGroup
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
-from ery_backend.assets.models import ImageAsset
 from ery_backend.base.cache import ery_cache
 from ery_backend.base.models import EryModel, EryFileReference
-from ery_backend.stints.models import StintDefinition
-from ery_backend.modules.models import ModuleDefinition
-from ery_backend.templates.models import Template
-from ery_backend.themes.models import Theme
-from ery_backend.procedures.models import Procedure
-from ery_backend.widgets.models import Widget
-from ery_backend.validators.models import Validator
 
 from .managers import UserManager
 
@@ -229,25 +221,24 @@ class User(AbstractBaseUser):
         """Convenience wrapper over django ContentType queryset manager."""
         return ContentType.objects.get_for_model(cls)
 
-    @ery_cache(timeout=3)
-    def query_library(self):
-        model_map = {
-            StintDefinition: 'stint_definition',
-            ModuleDefinition: 'module_definition',
-            Template: 'template',
-            Theme: 'theme',
-            Procedure: 'procedure',
-            Widget: 'widget',
-            ImageAsset: 'image_asset',
-            Validator: 'validator',
-        }
-        objs = []
-        for model in model_map:
-            objs += list(model.objects.filter_privilege('read', self).add_popularity().all())
-
-        objs.sort(key=lambda x: x.popularity, reverse=True)
-
-        return [{model_map[obj.__class__]: obj, 'popularity': obj.popularity, 'owner': obj.get_owner()} for obj in objs]
+    def query_library(self, order_by='-popularity', offset=0, limit=None):
+        """
+        List files readable by current instance, most popular first unless ordered otherwise.
+
+        Args:
+            - order_by (str): One of :attr:`~ery_backend.folders.models.FileSearchDocument.FILE_ORDERINGS`.
+            - offset (int)
+            - limit (Optional[int])
+
+        Notes:
+            - See :meth:`~ery_backend.folders.models.FileSearchDocument.query_files`.
+
+        Returns:
+            List[Dict[str, Union[:class:`~ery_backend.base.models.EryFile`, :class:`User`, int]]]
+        """
+        from ery_backend.folders.models import FileSearchDocument
+
+        return FileSearchDocument.query_files(self, order_by, offset, limit)
 
     def _invalidate_related_tags(self, hisitory):
         """
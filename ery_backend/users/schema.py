@@ -12,7 +12,7 @@ from ery_backend.comments.schema import FileCommentQuery, FileStarQuery, FileCom
 from ery_backend.conditions.schema import ConditionQuery
 from ery_backend.datasets.schema import DatasetQuery
 from ery_backend.folders.models import Folder
-from ery_backend.folders.schema import LinkQuery, FolderQuery, FolderNode
+from ery_backend.folders.schema import FileSearchQuery, LinkQuery, FolderQuery, FolderNode
 from ery_backend.forms.schema import (
     FormQuery,
     FormButtonQuery,
@@ -139,6 +139,7 @@ class ViewerNode(
     DatasetQuery,
     EraQuery,
     FileCommentQuery,
+    FileSearchQuery,
     FileStarQuery,
     FileTouchQuery,
     FolderQuery,
@@ -205,7 +206,12 @@ class ViewerNode(
         model = get_user_model()
 
     user_id = graphene.String()
-    library = graphene.List('ery_backend.folders.schema.EryFileNode')
+    library = graphene.List(
+        'ery_backend.folders.schema.EryFileNode',
+        order_by=graphene.String(default_value='-popularity'),
+        offset=graphene.Int(default_value=0),
+        limit=graphene.Int(),
+    )
     recommended = EryFilterConnectionField(UserNode)
     followings = EryFilterConnectionField(UserNode)
     comments = EryFilterConnectionField(FileCommentNode)
@@ -213,10 +219,10 @@ class ViewerNode(
     def resolve_user_id(self, info):
         return self.gql_id
 
-    def resolve_library(self, info):
+    def resolve_library(self, info, order_by, offset, limit=None):
         from ery_backend.folders.schema import EryFileNode
 
-        return [EryFileNode(**entry) for entry in self.query_library()]
+        return [EryFileNode(**entry) for entry in self.query_library(order_by, offset, limit)]
 
     def resolve_recommended(self, info, **kwargs):
         return (
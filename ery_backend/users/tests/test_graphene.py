@@ -441,7 +441,6 @@ class TestLibrary(GQLTestCase):
                                      validator { name comment modified }
                                      owner{ username} popularity }}}"""
 
-        self.owner["user"].query_library.invalidate()  # pylint:disable=protected-access
         result = self.gql_client.execute(query, context_value=self.gql_client.get_context(user=self.owner["user"]))
         data = result["data"]["viewer"]["library"]
         searchable_data = []
@@ -480,6 +479,16 @@ class TestLibrary(GQLTestCase):
         self.assertIsNotNone(test_obj_data['obj']['modified'])
         self.assertIsNotNone(test_obj_data['popularity'])
 
+    def test_library_pagination(self):
+        """
+        Confirm the library is sorted and paginated like folder files.
+        """
+        query = """{viewer{ library(orderBy: "-popularity", offset: 1, limit: 2){ procedure{ name } popularity }}}"""
+        result = self.gql_client.execute(query, context_value=self.gql_client.get_context(user=self.owner["user"]))
+        data = result["data"]["viewer"]["library"]
+        self.assertEqual(len(data), 2)
+        self.assertGreaterEqual(data[0]['popularity'], data[1]['popularity'])
+
 
 class TestViewerFileTouches(GQLTestCase):
     """
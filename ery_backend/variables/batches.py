@@ -0,0 +1,119 @@
+"""
+Batches:
+    Writes of variable values made while handling one participant event, resolved, cast and flushed together rather than
+    through one :py:meth:`~ery_backend.stints.models.Stint.set_variable` per value.
+"""
+from django.utils import timezone
+
+from ery_backend.base.cache import defer_invalidation
+from ery_backend.base.exceptions import EryValidationError
+
+
+class VariableBatch:
+    """
+    Unit of work for setting the variables of a :class:`~ery_backend.stints.models.Stint`.
+
+    Args:
+        - stint (:class:`~ery_backend.stints.models.Stint`)
+        - hand (Optional[:class:`~ery_backend.hands.models.Hand`]): Owner of hand variables, and provider of the current
+          :class:`~ery_backend.teams.models.Team` and :class:`~ery_backend.modules.models.Module`.
+        - team (Optional[:class:`~ery_backend.teams.models.Team`]): Owner of team variables.
+
+    Notes:
+        - Variables are resolved in one query per scope, and written in one UPDATE per variable class, on :meth:`flush`.
+          Values set before a flush are not visible to queries, and should be flushed before running anything that reads
+          them (e.g., an :class:`~ery_backend.actions.models.Action`).
+        - Values are compared, cast and validated as by :py:meth:`~ery_backend.stints.models.Stint.set_variable`. If a
+          variable is set more than once before a flush, the last value is used.
+    """
+
+    def __init__(self, stint, hand=None, team=None):
+        self.stint = stint
+        self.hand = hand
+        self.team = team
+        self._values = {}
+
+    def set(self, variable_definition, value):
+        """
+        Queue value for the variable of variable_definition.
+
+        Args:
+            - variable_definition (:class:`~ery_backend.variables.models.VariableDefinition`)
+            - value (Union[str, int, float, bool, list, dict])
+        """
+        self._values.pop(variable_definition.id, None)
+        self._values[variable_definition.id] = (variable_definition, value)
+
+    def _get_variables(self, variable_definitions):
+        from .models import HandVariable, ModuleVariable, TeamVariable, VariableDefinition
+
+        querysets = {}
+        for variable_definition in variable_definitions:
+            scope = variable_definition.scope
+            if VariableDefinition.SCOPE_CHOICES.hand in scope:
+                if self.hand is None:
+                    raise EryValidationError(
+                        f"Hand required in VariableBatch for variable_definition: {variable_definition}, with scope: '{scope}'"
+                    )
+                queryset = HandVariable.objects.filter(hand=self.hand)
+            elif VariableDefinition.SCOPE_CHOICES.team in scope:
+                if self.hand is None and self.team is None:
+                    raise EryValidationError(
+                        f"Hand or Team required in VariableBatch for variable_definition: {variable_definition},"
+                        f" with scope: '{scope}'"
+                    )
+                queryset = TeamVariable.objects.filter(team=self.team if self.team else self.hand.current_team)
+            elif VariableDefinition.SCOPE_CHOICES.module in scope:
+                queryset = ModuleVariable.objects.filter(module=self.hand.current_module)
+            else:
+                raise NotImplementedError(f"VariableBatch is unprepared for scope {scope}")
+            querysets.setdefault(queryset.model, (queryset, []))[1].append(variable_definition.id)
+
+        variables = {}
+        for model, (queryset, variable_definition_ids) in querysets.items():
+            for variable in queryset.filter(variable_definition_id__in=variable_definition_ids):
+                variables[variable.variable_definition_id] = variable
+            for variable_definition_id in variable_definition_ids:
+                if variable_definition_id not in variables:
+                    raise model.DoesNotExist(
+                        f"{model.__name__} with variable_definition: {variable_definition_id}, does not exist"
+                    )
+        return variables
+
+    def flush(self):
+        """
+        Write queued values.
+
+        Returns:
+            List[:class:`~ery_backend.variables.models.VariableMixin`]: Changed variables, in the order their values
+            were queued.
+        """
+        if not self._values:
+            return []
+        values, self._values = self._values, {}
+        variables = self._get_variables([variable_definition for variable_definition, _ in values.values()])
+
+        changed = []
+        for variable_definition_id, (variable_definition, value) in values.items():
+            variable = variables[variable_definition_id]
+            variable.variable_definition = variable_definition
+            new_value = variable_definition.cast(value) if value not in [None, ''] else None
+            if variable.value != new_value:
+                variable.value = new_value
+                variable.runtime_clean()
+                changed.append(variable)
+            self.stint.log(
+                'set_variable for: {}, of type: {}, = {}'.format(variable_definition.name, variable.__class__, value),
+                system_only=True,
+            )
+
+        modified = timezone.now()
+        by_model = {}
+        for variable in changed:
+            variable.modified = modified
+            by_model.setdefault(variable.__class__, []).append(variable)
+        for model, model_variables in by_model.items():
+            model.objects.bulk_update(model_variables, ['value', 'modified'])
+        for variable in changed:
+            defer_invalidation(variable)
+        return changed
@@ -13,7 +13,7 @@ import reversion
 import fastnumbers
 
 from ery_backend.base.mixins import ChoiceMixin, SluggedMixin, JavascriptNamedMixin
-from ery_backend.base.models import EryPrivileged
+from ery_backend.base.models import EryPrivileged, RuntimeModelMixin
 from ery_backend.base.exceptions import EryValueError, EryTypeError, EryValidationError
 from ery_backend.base.utils import get_default_language
 from ery_backend.modules.models import ModuleDefinitionNamedModel
@@ -537,6 +537,12 @@ class VariableMixin(models.Model):
 
     def clean(self):
         super().clean()
+        self.runtime_clean()
+
+    def runtime_clean(self):
+        """
+        Set default or cast value, and validate the value of stage variables.
+        """
         vd = self.get_variable_definition()
 
         if self.value in [None, '']:
@@ -572,7 +578,7 @@ class VariableMixin(models.Model):
         self.save()
 
 
-class ModuleVariable(VariableMixin, EryPrivileged):
+class ModuleVariable(RuntimeModelMixin, VariableMixin, EryPrivileged):
     """
     Instantiated form of VariableDefinition shared at the module level (across Hands/Teams)
 
@@ -588,7 +594,7 @@ class ModuleVariable(VariableMixin, EryPrivileged):
     module = models.ForeignKey('modules.Module', on_delete=models.CASCADE, null=True, blank=True, related_name='variables')
 
 
-class TeamVariable(VariableMixin, EryPrivileged):
+class TeamVariable(RuntimeModelMixin, VariableMixin, EryPrivileged):
     """
     Instantiated form of VariableDefinition shared at the team level (across Hands belonging to said Team)
     Teams have their own scope of variable (TeamVariable) used to measure Team specific info during a stint
@@ -607,7 +613,7 @@ class TeamVariable(VariableMixin, EryPrivileged):
     team = models.ForeignKey('teams.Team', on_delete=models.CASCADE, null=True, blank=True, related_name='variables')
 
 
-class HandVariable(VariableMixin, EryPrivileged):
+class HandVariable(RuntimeModelMixin, VariableMixin, EryPrivileged):
     """
     Instantiated form of VariableDefinition specific to a Hand
     Hands have their own scope of variable (HandVariable) used to measure Hand specific info during a stint (such as payoff)
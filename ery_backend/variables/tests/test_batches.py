@@ -0,0 +1,88 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from ery_backend.base.exceptions import EryValidationError
+from ery_backend.base.testcases import EryTestCase, create_test_hands
+from ..batches import VariableBatch
+from ..factories import HandVariableFactory, ModuleVariableFactory, VariableDefinitionFactory
+from ..models import VariableDefinition
+
+
+class TestVariableBatch(EryTestCase):
+    def setUp(self):
+        self.hand = create_test_hands(n=1, signal_pubsub=False).first()
+        self.module_definition = self.hand.current_module.stint_definition_module_definition.module_definition
+
+    def _create_hand_variables(self, n):
+        variables = []
+        for _ in range(n):
+            variable_definition = VariableDefinitionFactory(
+                module_definition=self.module_definition,
+                scope=VariableDefinition.SCOPE_CHOICES.hand,
+                data_type=VariableDefinition.DATA_TYPE_CHOICES.int,
+                default_value=0,
+                validator=None,
+            )
+            variables.append(HandVariableFactory(hand=self.hand, variable_definition=variable_definition, value=1))
+        return variables
+
+    def test_flush(self):
+        hand_variables = self._create_hand_variables(3)
+        module_variable_definition = VariableDefinitionFactory(
+            module_definition=self.module_definition,
+            scope=VariableDefinition.SCOPE_CHOICES.module,
+            data_type=VariableDefinition.DATA_TYPE_CHOICES.str,
+            default_value='',
+            validator=None,
+        )
+        module_variable = ModuleVariableFactory(
+            module=self.hand.current_module, variable_definition=module_variable_definition, value='old'
+        )
+
+        batch = VariableBatch(self.hand.stint, hand=self.hand)
+        batch.set(hand_variables[0].variable_definition, '2')
+        batch.set(hand_variables[1].variable_definition, 1)  # unchanged
+        batch.set(module_variable_definition, 'new')
+        batch.set(hand_variables[2].variable_definition, 3)
+        changed = batch.flush()
+
+        self.assertEqual(
+            [variable.id for variable in changed], [hand_variables[0].id, module_variable.id, hand_variables[2].id]
+        )
+        for variable, value in zip(hand_variables + [module_variable], (2, 1, 3, 'new')):
+            variable.refresh_from_db()
+            self.assertEqual(variable.value, value)
+        self.assertEqual(batch.flush(), [])
+
+    def test_last_value(self):
+        """
+        Confirm the last value set for a variable before a flush is written.
+        """
+        variable = self._create_hand_variables(1)[0]
+        batch = VariableBatch(self.hand.stint, hand=self.hand)
+        batch.set(variable.variable_definition, 5)
+        batch.set(variable.variable_definition, 7)
+        batch.flush()
+        variable.refresh_from_db()
+        self.assertEqual(variable.value, 7)
+
+    def test_hand_required(self):
+        variable = self._create_hand_variables(1)[0]
+        batch = VariableBatch(self.hand.stint)
+        batch.set(variable.variable_definition, 5)
+        with self.assertRaises(EryValidationError):
+            batch.flush()
+
+    def test_fixed_queries(self):
+        """
+        Confirm the number of queries of a flush does not depend on the number of variables.
+        """
+        counts = []
+        for n in (2, 6):
+            batch = VariableBatch(self.hand.stint, hand=self.hand)
+            for variable in self._create_hand_variables(n):
+                batch.set(variable.variable_definition, 4)
+            with CaptureQueriesContext(connection) as context:
+                self.assertEqual(len(batch.flush()), n)
+            counts.append(len(context.captured_queries))
+        self.assertEqual(counts[0], counts[1])
@@ -1,7 +1,7 @@
 import json
 
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import connection, models
 from django.contrib.postgres.fields import JSONField
 from django.utils.translation import gettext_lazy as _
 
@@ -215,19 +215,33 @@ class Widget(ReactNamedMixin, EryFile):
         Get ids of all dependencies.
 
         Attrs:
-            - widget_id (int): Originating widget.
+            - widget_id (Union[int, Iterable[int]]): Originating widget(s).
+
+        Notes:
+            - Resolved in one recursive query, whatever the depth of the dependency graph. Cycles are followed once.
 
         Returns:
             set
         """
-        output = set()
-
-        nested_ids = WidgetConnection.objects.filter(originator__id=widget_id).values_list('target__id', flat=True)
-        for nested_id in nested_ids:
-            output.update(cls.get_nested_connected_widget_ids(nested_id))
-            output.update((nested_id,))
-
-        return output
+        widget_ids = [widget_id] if isinstance(widget_id, int) else [pk for pk in widget_id if pk is not None]
+        if not widget_ids:
+            return set()
+
+        table = WidgetConnection._meta.db_table
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                WITH RECURSIVE dependencies(id) AS (
+                    SELECT target_id FROM {table} WHERE originator_id = ANY(%s)
+                    UNION
+                    SELECT widget_connection.target_id FROM {table} widget_connection
+                    JOIN dependencies ON widget_connection.originator_id = dependencies.id
+                )
+                SELECT id FROM dependencies
+                """,
+                [widget_ids],
+            )
+            return {row[0] for row in cursor.fetchall()}
 
     def get_all_connected_widgets(self):
         return Widget.objects.filter(id__in=self.get_nested_connected_widget_ids(self.id))
@@ -319,21 +333,38 @@ class Widget(ReactNamedMixin, EryFile):
             for widget_wrapper in widget_wrapper_manager.all():
                 widget_wrapper.invalidate_tags(history)
 
+    def requires_communicate(self):
+        """
+        Whether any :class:`WidgetEventStep` of current instance communicates with the server.
+
+        Notes:
+            - Uses prefetched events and steps where available.
+
+        Returns:
+            bool
+        """
+        return any(
+            step.event_action_type in WidgetEventStep.REQUIRE_COMMUNCIATE_ACTION_TYPES
+            for event in self.events.all()
+            for step in event.steps.all()
+        )
+
     def get_events_info(self):
-        return [
-            (
-                event.name,
-                event.event_type,
-                event.steps.filter(event_action_type__in=WidgetEventStep.REQUIRE_COMMUNCIATE_ACTION_TYPES).exists(),
-                [
-                    (i, step.code)
-                    for i, step in enumerate(
-                        event.steps.filter(event_action_type=WidgetEventStep.EVENT_ACTION_TYPE_CHOICES.run_code)
-                    )
-                ],
+        events_info = []
+        for event in self.events.all():
+            steps = event.steps.all()
+            run_code_steps = [
+                step for step in steps if step.event_action_type == WidgetEventStep.EVENT_ACTION_TYPE_CHOICES.run_code
+            ]
+            events_info.append(
+                (
+                    event.name,
+                    event.event_type,
+                    any(step.event_action_type in WidgetEventStep.REQUIRE_COMMUNCIATE_ACTION_TYPES for step in steps),
+                    [(i, step.code) for i, step in enumerate(run_code_steps)],
+                )
             )
-            for event in self.events.all()
-        ]
+        return events_info
 
 
 class WidgetConnection(ReactNamedMixin, EryNamedPrivileged):
@@ -499,6 +499,20 @@ class TestNestedConnectedWidgetIds(EryTestCase):
         # pylint: disable=protected-access
         self.assertEqual(target_ids, self.widget.get_nested_connected_widget_ids(self.widget.id))
 
+    def test_circular(self):
+        """Circular dependencies are followed once"""
+        connection = WidgetConnectionFactory(originator=self.widget)
+        WidgetConnectionFactory(originator=connection.target, target=self.widget)
+
+        with self.assertNumQueries(1):
+            widget_ids = self.widget.get_nested_connected_widget_ids(self.widget.id)
+        self.assertEqual(widget_ids, {self.widget.id, connection.target.id})
+
+    def test_many(self):
+        other_widget = WidgetFactory()
+        target_ids = {WidgetConnectionFactory(originator=widget).target.id for widget in (self.widget, other_widget)}
+        self.assertEqual(target_ids, Widget.get_nested_connected_widget_ids([self.widget.id, other_widget.id]))
+
 
 class TestAllConnectedWidgets(EryTestCase):
     def test_ids_same_as_nested_connected_widget_ids(self):
@@ -0,0 +1,53 @@
+"""
+Count SQL statements and Redis commands per write of a hand variable, through the full save of authoring models and
+through the save given update_fields used by Stint.set_variable.
+
+The variable is written back to its original value, so that the benchmark leaves no changes behind.
+
+Usage:
+    ./manage.py runscript benchmark_set_variable --script-args [hand_variable_id] [repeat]
+"""
+from unittest import mock
+
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from redis.client import Redis
+
+from ery_backend.base.cache import batch_invalidations
+from ery_backend.variables.models import HandVariable, VariableDefinition
+
+
+def _measure(variable, values, save):
+    commands = []
+    execute_command = Redis.execute_command
+
+    def _execute_command(self, *args, **options):
+        commands.append(args[0])
+        return execute_command(self, *args, **options)
+
+    with mock.patch.object(Redis, 'execute_command', _execute_command):
+        with CaptureQueriesContext(connection) as context:
+            for value in values:
+                with batch_invalidations(), transaction.atomic():
+                    variable.value = value
+                    save(variable)
+    return len(context.captured_queries) / len(values), len(commands) / len(values)
+
+
+def run(*args):
+    numeric = (VariableDefinition.DATA_TYPE_CHOICES.int, VariableDefinition.DATA_TYPE_CHOICES.float)
+    if args:
+        variable = HandVariable.objects.get(id=int(args[0]))
+    else:
+        variable = HandVariable.objects.filter(variable_definition__data_type__in=numeric).order_by('-id').first()
+    repeat = int(args[1]) if len(args) > 1 else 50
+    original = variable.value
+    # Alternate, ending on the original value
+    values = [(original or 0) + 1, original] * max(repeat // 2, 1)
+
+    for name, save in (
+        ('full save', lambda variable: variable.save()),
+        ('runtime save', lambda variable: variable.save(update_fields=['value'])),
+    ):
+        queries, commands = _measure(variable, values, save)
+        print(f"{name}: {queries:.1f} statements, {commands:.1f} Redis commands per set_variable")
@@ -0,0 +1,49 @@
+"""
+Count SQL statements per Hand.submit, by kind, on the active hands of running stints.
+
+Each submit is rolled back, so that the benchmark leaves no changes behind.
+
+Usage:
+    ./manage.py runscript benchmark_stage_transition --script-args [count]
+"""
+from collections import Counter
+
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from ery_backend.hands.models import Hand
+
+
+def _submit(hand):
+    with CaptureQueriesContext(connection) as context:
+        with transaction.atomic():
+            try:
+                hand.submit()
+            finally:
+                transaction.set_rollback(True)
+    return Counter(query['sql'].split(' ', 1)[0] for query in context.captured_queries)
+
+
+def run(*args):
+    count = int(args[0]) if args else 20
+    hands = Hand.objects.filter(
+        status=Hand.STATUS_CHOICES.active, stage__stage_definition__redirect_on_submit=True
+    ).order_by('-id')[:count]
+
+    total = Counter()
+    submits = 0
+    for hand in hands:
+        try:
+            statements = _submit(hand)
+        except Exception as e:  # pylint: disable=broad-except
+            print(f"Hand {hand.id}: submit failed ({e})")
+            continue
+        print(f"Hand {hand.id}: {sum(statements.values())} statements ({dict(statements)})")
+        total += statements
+        submits += 1
+
+    if submits:
+        print(
+            f"{sum(total.values()) / submits:.1f} statements per submit: "
+            + ", ".join(f"{kind} {n / submits:.1f}" for kind, n in total.most_common())
+        )
@@ -0,0 +1,48 @@
+"""
+Benchmark ReactStintRenderer on the largest stint definitions, serially and on a pool of threads.
+
+Babel is stubbed, so that only the rendering of the ES6 bundle is measured.
+
+Usage:
+    ./manage.py runscript benchmark_stint_render --script-args [count] [repeat]
+"""
+import time
+from unittest import mock
+
+from django.db import connection
+from django.db.models import Count
+from django.test.utils import CaptureQueriesContext, override_settings
+from languages_plus.models import Language
+
+from ery_backend.frontends.renderers import ReactStintRenderer
+from ery_backend.scripts.grpc.babel_pb2 import ES5Code
+from ery_backend.stints.models import StintDefinition
+
+
+def _measure(stint_definition, language, workers, repeat):
+    durations = []
+    with override_settings(ERY_RENDER_WORKERS=workers):
+        for _ in range(repeat):
+            with CaptureQueriesContext(connection) as context:
+                started = time.perf_counter()
+                ReactStintRenderer(stint_definition, language).render()
+                durations.append(time.perf_counter() - started)
+    return min(durations), len(context.captured_queries)
+
+
+def run(*args):
+    count = int(args[0]) if args else 5
+    repeat = int(args[1]) if len(args) > 1 else 3
+    language = Language.objects.get(pk='en')
+    stint_definitions = StintDefinition.objects.annotate(
+        stage_count=Count('module_definitions__stage_definitions')
+    ).order_by('-stage_count')[:count]
+
+    with mock.patch('ery_backend.frontends.renderers.convert_es6_bundle', return_value=ES5Code(code='')):
+        for stint_definition in stint_definitions:
+            serial, queries = _measure(stint_definition, language, 1, repeat)
+            concurrent, _ = _measure(stint_definition, language, 4, repeat)
+            print(
+                f"{stint_definition.name} ({stint_definition.stage_count} stages): {queries} queries,"
+                f" serial {serial:.3f}s, 4 threads {concurrent:.3f}s"
+            )
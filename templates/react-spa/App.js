@@ -1,7 +1,11 @@
-import React, { useMemo, useState } from 'react';
+import React, { useMemo, useRef, useState } from 'react';
 
 import useWebSocket from 'react-use-websocket';
 
+import Grid from '@material-ui/core/Grid';
+import Paper from '@material-ui/core/Paper';
+import Typography from '@material-ui/core/Typography';
+
 import LoadingPage from './LoadingPage';
 import Stint{{stint_definition.name}} from './Stint';
 
@@ -20,6 +24,9 @@ const App = props => {
   const [currentStageName, setCurrentStageName] = useState();
   const [currentStageID, setCurrentStageID] = useState();
   const [currentStintID, setCurrentStintID] = useState();
+  // A ref, as message handlers are memoized
+  const currentHandID = useRef();
+  const [handStatus, setHandStatus] = useState();
   const [variables, setVariables] = useState();
 
   const wsOptions = useMemo(() => ({
@@ -30,6 +37,15 @@ const App = props => {
           case 'set_stint':
             setCurrentStintID(message.data);
             break
+          case 'set_hand':
+            currentHandID.current = message.data;
+            break
+          case 'set_hand_status':
+            // Broadcast to the whole stint, naming the hands changed
+            if (message.data.hand_ids.includes(currentHandID.current)) {
+              setHandStatus(message.data.status);
+            }
+            break
           case 'update_all_vars':
             setVariables(JSON.parse(message.data));
             break
@@ -83,6 +99,16 @@ const App = props => {
     }));
   };
 
+  if (handStatus && handStatus !== 'active') {
+    return (
+      <Grid container direction='column' alignItems='center' justify='center'>
+        <Paper>
+          <Typography variant='h3'>{`This session is ${handStatus}.`}</Typography>
+        </Paper>
+      </Grid>
+    );
+  }
+
   return (
     readyState === 1 // websocket ready
     ? (